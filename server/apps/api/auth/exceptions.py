@@ -11,3 +11,15 @@ class InvalidPasswordError(CustomApiError):  # noqa: D101
 class RefreshTokenFailError(CustomApiError):  # noqa: D101
     status_code = status.HTTP_406_NOT_ACCEPTABLE
     default_detail = 'Attempt to refresh token failed.'
+
+
+class LoginBusyError(CustomApiError):  # noqa: D101
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Too many logins at once, try again later.'
+    wait = 1  # seconds in Retry-After header
+
+
+class RefreshUnavailableError(CustomApiError):  # noqa: D101
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Token can not be refreshed now, try again later.'
+    wait = 5  # seconds in Retry-After header
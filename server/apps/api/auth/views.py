@@ -5,8 +5,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from server.apps.auth.services import AuthService
+from server.apps.core.instrumentation import timer
 from server.apps.users.services import UserService
 
+from ..throttling import AuthThrottle
 from . import exceptions
 
 
@@ -14,6 +16,8 @@ class LoginApi(APIView):
     """API for user log in."""
 
     authentication_classes: list[str] = []
+    throttle_classes = [AuthThrottle]
+    throttle_scope = 'login'
 
     class InputSerializer(serializers.Serializer):
         email = serializers.EmailField()
@@ -33,8 +37,11 @@ class LoginApi(APIView):
             raise NotFound() from exc
         except AuthService.InvalidPasswordError as exc:
             raise exceptions.InvalidPasswordError() from exc
+        except AuthService.LoginBusyError as exc:
+            raise exceptions.LoginBusyError() from exc
 
-        data = self.OutputSerializer(result).data
+        with timer('serialize'):
+            data = self.OutputSerializer(result).data
         return Response(data)
 
 
@@ -42,6 +49,8 @@ class RefreshTokenApi(APIView):
     """API for updating access token by refresh token."""
 
     authentication_classes: list[str] = []
+    throttle_classes = [AuthThrottle]
+    throttle_scope = 'refresh'
 
     class InputSerializer(serializers.Serializer):
         refresh_token = serializers.CharField()
@@ -56,10 +65,11 @@ class RefreshTokenApi(APIView):
 
         try:
             result = AuthService.refresh_token(**serializer.validated_data)
-        except UserService.UserNotFoundError as exc:
-            raise NotFound() from exc
         except AuthService.InvalidRefreshTokenError as exc:
             raise exceptions.RefreshTokenFailError() from exc
+        except AuthService.RefreshUnavailableError as exc:
+            raise exceptions.RefreshUnavailableError() from exc
 
-        data = self.OutputSerializer(result).data
+        with timer('serialize'):
+            data = self.OutputSerializer(result).data
         return Response(data)
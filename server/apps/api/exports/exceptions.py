@@ -0,0 +1,8 @@
+from rest_framework import status
+
+from ..exceptions import CustomApiError
+
+
+class ExportNotReadyError(CustomApiError):  # noqa: D101
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'Export has not been finished yet or failed.'
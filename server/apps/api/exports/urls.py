@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import views
+
+app_name = 'exports'
+
+urlpatterns = [
+    path('create', views.ExportJobCreateApi.as_view(), name='create'),
+    path('<int:job_id>', views.ExportJobDetailApi.as_view(), name='detail'),
+    path('<int:job_id>/download', views.ExportJobDownloadApi.as_view(), name='download'),
+]
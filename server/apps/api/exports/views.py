@@ -0,0 +1,76 @@
+from django.http import FileResponse
+from rest_framework import serializers, status
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from server.apps.core.instrumentation import timer
+from server.apps.issues.services import ExportService
+
+from .. import permissions
+from . import exceptions
+
+
+class ExportJobCreateApi(APIView):
+    """
+    API for starting export of issues, releases and comments.
+
+    Export is performed in background. Use returned id to get progress of export and to download
+    zip archive with CSV files when export is done. Archive is a full dump, so only admins start
+    exports. Finished jobs and archives are deleted after EXPORT_RETENTION seconds.
+    """
+
+    permission_classes = [permissions.IsAdmin]
+    throttle_scope = 'expensive'
+
+    def post(self, request: Request) -> Response:  # noqa: D102
+        job = ExportService.create(author=request.user)
+
+        return Response({'id': job.id}, status=status.HTTP_201_CREATED)
+
+
+class ExportJobDetailApi(APIView):
+    """API for getting export job progress."""
+
+    permission_classes = [permissions.IsAdmin | permissions.IsAuthor]
+
+    class OutputSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        status = serializers.CharField()
+        progress = serializers.IntegerField()
+        created_at = serializers.DateTimeField(format='%Y-%m-%d %H:%M')
+
+    def get(self, request: Request, job_id: int) -> Response:  # noqa: D102
+        try:
+            job = ExportService.get_or_error(job_id)
+        except ExportService.ExportJobNotFoundError as exc:
+            raise NotFound() from exc
+
+        self.check_object_permissions(request, job)
+
+        with timer('serialize'):
+            data = self.OutputSerializer(job).data
+        return Response(data)
+
+
+class ExportJobDownloadApi(APIView):
+    """API for downloading exported file."""
+
+    permission_classes = [permissions.IsAdmin | permissions.IsAuthor]
+    throttle_scope = 'expensive'
+
+    def get(self, request: Request, job_id: int) -> FileResponse:  # noqa: D102
+        try:
+            job = ExportService.get_or_error(job_id)
+        except ExportService.ExportJobNotFoundError as exc:
+            raise NotFound() from exc
+
+        self.check_object_permissions(request, job)
+
+        try:
+            path = ExportService.get_file_path(job)
+        except ExportService.ExportNotReadyError as exc:
+            raise exceptions.ExportNotReadyError() from exc
+
+        return FileResponse(path.open('rb'), as_attachment=True, filename=job.file_name)
@@ -1,7 +1,39 @@
+import datetime
+import functools
+from operator import itemgetter
+from typing import Callable, Iterable, Mapping, Sequence, cast
+
+from django.db.models import QuerySet
+from django.utils.duration import duration_string
 from rest_framework import serializers
 
+from server.apps.issues.models import Issue
+
+from ..utils import SparseFieldsSerializer
+
+ValuesRow = Mapping[str, object]
+
+# Estimated and logged durations of issues repeat a lot, so formatted values are cached.
+_format_duration = functools.lru_cache(maxsize=4096)(duration_string)
+
+
+def _duration(lookup: str) -> Callable[[ValuesRow], str]:
+    def get(row: ValuesRow) -> str:
+        return _format_duration(cast(datetime.timedelta, row[lookup]))
+
+    return get
+
+
+def _remaining_time(row: ValuesRow) -> str:
+    estimated_time = cast(datetime.timedelta, row['estimated_time'])
+    logged_time = cast(datetime.timedelta, row['logged_time'])
+    if estimated_time < logged_time:
+        return _format_duration(datetime.timedelta(seconds=0))
+
+    return _format_duration(estimated_time - logged_time)
 
-class IssueOutputSerializer(serializers.Serializer):
+
+class IssueOutputSerializer(SparseFieldsSerializer):
     """Serializer for full output of issue."""
 
     title = serializers.CharField()
@@ -15,3 +47,58 @@ class IssueOutputSerializer(serializers.Serializer):
     project = serializers.CharField(source='project.code')
     status = serializers.CharField()
     release = serializers.CharField(source='get_release_version')
+
+    # Fast path: lookups of values() rows and accessors building the same representation.
+    values_fields: dict[str, tuple[tuple[str, ...], Callable[[ValuesRow], object]]] = {
+        'title': (('title',), itemgetter('title')),
+        'code': (('code',), itemgetter('code')),
+        'description': (('description',), itemgetter('description')),
+        'estimated_time': (('estimated_time',), _duration('estimated_time')),
+        'logged_time': (('logged_time',), _duration('logged_time')),
+        'remaining_time': (('estimated_time', 'logged_time'), _remaining_time),
+        'author': (('author_id',), itemgetter('author_id')),
+        'assignee': (('assignee_id',), itemgetter('assignee_id')),
+        'project': (('project__code',), itemgetter('project__code')),
+        'status': (('status',), itemgetter('status')),
+        'release': (('release__version',), itemgetter('release__version')),
+    }
+
+    field_lookups = {name: lookups for name, (lookups, _) in values_fields.items()}
+
+    @classmethod
+    def get_values_lookups(cls, fields: Sequence[str] | None = None) -> list[str]:
+        """Get lookups of values() rows required by fast serialization of fields."""
+        return list(dict.fromkeys(
+            lookup for name in fields or cls.values_fields for lookup in cls.values_fields[name][0]
+        ))
+
+    @classmethod
+    def represent_values(
+        cls,
+        rows: Iterable[ValuesRow],
+        fields: Sequence[str] | None = None,
+    ) -> list[dict[str, object]]:
+        """Build representations of issues (all or given fields) directly from values() rows."""
+        accessors = [
+            (name, accessor) for name, (_, accessor) in cls.values_fields.items()
+            if fields is None or name in fields
+        ]
+
+        return [{name: accessor(row) for name, accessor in accessors} for row in rows]
+
+    @classmethod
+    def serialize_queryset(
+        cls,
+        queryset: QuerySet[Issue],
+        fields: Sequence[str] | None = None,
+    ) -> list[dict[str, object]]:
+        """
+        Serialize issues many times faster than with many=True, output is the same.
+
+        Rows are fetched with values() and represented by precomputed accessors, so neither
+        model instances nor serializer fields are involved. Only lookups of given fields are
+        fetched if provided.
+        """
+        rows = queryset.values(*cls.get_values_lookups(fields))
+
+        return cls.represent_values(rows, fields)
@@ -1,17 +1,23 @@
 import datetime
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import serializers, status
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from server.apps.core.instrumentation import timer
 from server.apps.issues.enums import IssueStatusEnum
+from server.apps.issues.exports import ISSUE_EXPORT_COLUMNS, stream_csv, stream_ndjson
 from server.apps.issues.services import (CommentService, IssueService, ProjectService,
                                          ReleaseService)
 from server.apps.users.services import UserService
 
 from .. import permissions
+from ..pagination import EstimatedCountPagination
+from ..utils import SparseFieldsSerializer, get_requested_fields
 from .serializers import IssueOutputSerializer
 
 
@@ -43,26 +49,85 @@ class IssueCreateApi(APIView):
 
 
 class IssueDetailApi(APIView):
-    """API for getting issues."""
+    """API for getting issues. Query parameter 'fields' limits output to given fields."""
 
     def get(self, request: Request, issue_id: int) -> Response:  # noqa: D102
+        fields = get_requested_fields(request, IssueOutputSerializer)
         try:
-            issue = IssueService.get_by_id(issue_id)
+            issue = IssueService.get_by_id(
+                issue_id,
+                only=IssueOutputSerializer.get_only_lookups(fields),
+            )
         except IssueService.IssueNotFoundError as exc:
             raise NotFound() from exc
 
-        data = IssueOutputSerializer(issue).data
+        with timer('serialize'):
+            data = IssueOutputSerializer(issue, fields=fields).data
         return Response(data)
 
 
 class IssueListApi(APIView):
-    """API for getting issues list."""
+    """
+    API for getting issues list. Query parameter 'fields' limits output to given fields.
+
+    List is paginated when query parameter 'limit' is given, see EstimatedCountPagination.
+    """
+
+    throttle_scope = 'expensive'
 
     def get(self, request: Request) -> Response:  # noqa: D102
+        fields = get_requested_fields(request, IssueOutputSerializer)
         issues = IssueService.get_list()
-        data = IssueOutputSerializer(issues, many=True).data
+        paginator = EstimatedCountPagination()
+        page = paginator.paginate_queryset(issues, request, view=self)
+        with timer('serialize'):
+            data = IssueOutputSerializer.serialize_queryset(
+                issues if page is None else page, fields=fields,
+            )
 
-        return Response(data)
+        if page is None:
+            return Response(data)
+
+        return paginator.get_paginated_response(data)
+
+
+class IssueExportApi(APIView):
+    """
+    API for export of issues list.
+
+    Issues are streamed in CSV or NDJSON format (query parameter 'format') while they are fetched
+    from database by chunks, so memory usage does not depend on number of issues.
+    """
+
+    throttle_scope = 'expensive'
+    formats = {
+        'csv': (stream_csv, 'text/csv'),
+        'ndjson': (stream_ndjson, 'application/x-ndjson'),
+    }
+
+    class InputSerializer(serializers.Serializer):
+        format = serializers.ChoiceField(choices=['csv', 'ndjson'], default='csv')
+
+    def perform_content_negotiation(self, request: Request, force: bool = False):  # noqa: D102
+        # Query parameter 'format' selects export format instead of renderer.
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request: Request) -> StreamingHttpResponse:  # noqa: D102
+        serializer = self.InputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        export_format = serializer.validated_data['format']
+
+        stream, content_type = self.formats[export_format]
+        chunk_size = settings.ISSUE_EXPORT_CHUNK_SIZE
+        rows = IssueService.get_export_rows(IssueService.get_list(), chunk_size=chunk_size)
+
+        response = StreamingHttpResponse(
+            stream(list(ISSUE_EXPORT_COLUMNS), rows, batch_size=chunk_size),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="issues.{export_format}"'
+
+        return response
 
 
 class IssueUpdateApi(APIView):
@@ -138,20 +203,26 @@ class CommentCreateApi(APIView):
 
 
 class CommentDetailApi(APIView):
-    """API for getting comments."""
+    """API for getting comments. Query parameter 'fields' limits output to given fields."""
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(SparseFieldsSerializer):
         text = serializers.CharField()
         author_id = serializers.IntegerField()
         created_at = serializers.DateTimeField(format='%Y-%m-%d %H:%M')
 
     def get(self, request: Request, issue_id: int, comment_id: int) -> Response:   # noqa: D102
+        fields = get_requested_fields(request, self.OutputSerializer)
         try:
-            comment = CommentService.get_or_error(comment_id=comment_id, issue_id=issue_id)
+            comment = CommentService.get_or_error(
+                comment_id=comment_id,
+                issue_id=issue_id,
+                only=self.OutputSerializer.get_only_lookups(fields),
+            )
         except CommentService.CommentNotFoundError as exc:
             raise NotFound() from exc
 
-        data = self.OutputSerializer(comment).data
+        with timer('serialize'):
+            data = self.OutputSerializer(comment, fields=fields).data
         return Response(data)
 
 
@@ -173,26 +244,31 @@ class CommentUpdateApi(APIView):
             raise NotFound() from exc
 
         self.check_object_permissions(request, comment)
-        CommentService.update(comment=comment, **serializer.validated_data)
+        CommentService.update(comment=comment, user=request.user, **serializer.validated_data)
 
         return Response({})
 
 
 class CommentListApi(APIView):
-    """API for getting comments list."""
+    """API for getting comments list. Query parameter 'fields' limits output to given fields."""
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(SparseFieldsSerializer):
         text = serializers.CharField()
         author_id = serializers.IntegerField()
         created_at = serializers.DateTimeField(format='%Y-%m-%d %H:%M')
 
     def get(self, request: Request, issue_id: int) -> Response:  # noqa: D102
+        fields = get_requested_fields(request, self.OutputSerializer)
         try:
-            comments = CommentService.get_list(issue_id=issue_id)
+            comments = CommentService.get_list(
+                issue_id=issue_id,
+                only=self.OutputSerializer.get_only_lookups(fields),
+            )
         except IssueService.IssueNotFoundError as exc:
             raise NotFound() from exc
 
-        data = self.OutputSerializer(comments, many=True).data
+        with timer('serialize'):
+            data = self.OutputSerializer(comments, many=True, fields=fields).data
 
         return Response(data)
 
@@ -209,6 +285,6 @@ class CommentDeleteApi(APIView):
             raise NotFound() from exc
 
         self.check_object_permissions(request, comment)
-        CommentService.delete(comment=comment)
+        CommentService.delete(comment=comment, user=request.user)
 
         return Response({})
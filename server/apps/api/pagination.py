@@ -0,0 +1,60 @@
+from typing import TypeVar
+
+from django.db.models import Model, QuerySet
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from server.apps.core.pagination import estimate_count
+
+ModelT = TypeVar('ModelT', bound=Model)
+
+
+class EstimatedCountPagination(LimitOffsetPagination):
+    """
+    Pagination by query parameters 'limit' and 'offset' with estimated count of large tables.
+
+    Total is counted exactly below COUNT_ESTIMATE_THRESHOLD and estimated by PostgreSQL planner
+    otherwise, response field 'count_is_exact' tells which one is returned. Queryset is paginated
+    only when 'limit' is given.
+    """
+
+    max_limit = 1000
+
+    def __init__(self) -> None:
+        self.count_is_exact = True
+
+    def get_count(self, queryset: QuerySet[Model]) -> int:  # noqa: D102
+        estimate = estimate_count(queryset)
+        self.count_is_exact = estimate.exact
+
+        return estimate.count
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet[ModelT],
+        request: Request,
+        view: object = None,
+    ) -> QuerySet[ModelT] | None:
+        """Get page of queryset as lazy queryset, so it can be serialized with values()."""
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+
+        self.count = self.get_count(queryset)
+        self.offset = self.get_offset(request)
+
+        return queryset[self.offset:self.offset + self.limit]
+
+    def get_paginated_response(self, data: object) -> Response:  # noqa: D102
+        return Response({
+            'count': self.count,
+            'count_is_exact': self.count_is_exact,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
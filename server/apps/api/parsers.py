@@ -0,0 +1,24 @@
+from typing import IO, Mapping
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """Parser of UTF-8 JSON with orjson. Like JSONParser it rejects NaN and Infinity."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(  # noqa: D102
+        self,
+        stream: IO[bytes],
+        media_type: str | None = None,
+        parser_context: Mapping[str, object] | None = None,
+    ) -> object:
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -1,38 +1,112 @@
-from rest_framework.permissions import BasePermission
+import abc
+from typing import TypeVar
 
+from django.db.models import Model, Q, QuerySet
+from rest_framework.permissions import AND, OR, BasePermission, BasePermissionMetaclass
+from rest_framework.request import Request
+from rest_framework.views import APIView
 
-class IsAdmin(BasePermission):
+ModelT = TypeVar('ModelT', bound=Model)
+
+# Filters matching all and no rows. Empty Q() can not be used for all rows since it is dropped
+# when combined with '|'. Django skips the query entirely for empty 'in' lookup.
+EVERYTHING = Q(pk__isnull=False)
+NOTHING = Q(pk__in=[])
+
+
+class FilterPermissionMetaclass(BasePermissionMetaclass, abc.ABCMeta):
+    """Metaclass of permissions composable with '|' and '&' and having abstract methods."""
+
+
+class FilterPermission(BasePermission, metaclass=FilterPermissionMetaclass):
+    """Permission which is also expressed as filter of permitted objects in SQL."""
+
+    @abc.abstractmethod
+    def get_filter(self, request: Request, view: APIView) -> Q:
+        """Get filter matching objects permitted to user."""
+
+
+class IsAdmin(FilterPermission):
     """Check whether user is admin."""
 
     def has_permission(self, request, view):  # noqa: D102
         return request.user.is_admin
 
+    def get_filter(self, request: Request, view: APIView) -> Q:  # noqa: D102
+        return EVERYTHING if request.user.is_admin else NOTHING
 
-class IsAssignee(BasePermission):
+
+class IsAssignee(FilterPermission):
     """Check whether user is assignee of issue."""
 
     def has_object_permission(self, request, view, obj):  # noqa: D102
-        user = request.user
-        return obj.assignee == user
+        return obj.assignee_id == request.user.id
+
+    def get_filter(self, request: Request, view: APIView) -> Q:  # noqa: D102
+        return Q(assignee_id=request.user.id)
 
 
-class IsAuthor(BasePermission):
+class IsAuthor(FilterPermission):
     """Check whether user is author of comment or issue."""
 
     def has_object_permission(self, request, view, obj):  # noqa: D102
-        user = request.user
-        return obj.author == user
+        return obj.author_id == request.user.id
 
+    def get_filter(self, request: Request, view: APIView) -> Q:  # noqa: D102
+        return Q(author_id=request.user.id)
 
-class IsUserProfileOwner(BasePermission):
+
+class IsUserProfileOwner(FilterPermission):
     """Check whether user is owner of profile."""
 
     def has_object_permission(self, request, view, obj):  # noqa: D102
-        return obj == request.user
+        return obj.pk == request.user.id
+
+    def get_filter(self, request: Request, view: APIView) -> Q:  # noqa: D102
+        return Q(pk=request.user.id)
 
 
-class IsProjectOwner(BasePermission):
+class IsProjectOwner(FilterPermission):
     """Check whether user is project owner."""
 
     def has_object_permission(self, request, view, obj):  # noqa: D102
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
+
+    def get_filter(self, request: Request, view: APIView) -> Q:  # noqa: D102
+        return Q(owner_id=request.user.id)
+
+
+def get_permission_filter(request: Request, view: APIView, permission: BasePermission) -> Q:
+    """Build filter of permitted objects from permission composed with '|' and '&'."""
+    if isinstance(permission, FilterPermission):
+        return permission.get_filter(request, view)
+    if isinstance(permission, OR):
+        return (
+            get_permission_filter(request, view, permission.op1)
+            | get_permission_filter(request, view, permission.op2)
+        )
+    if isinstance(permission, AND):
+        return (
+            get_permission_filter(request, view, permission.op1)
+            & get_permission_filter(request, view, permission.op2)
+        )
+
+    raise TypeError(f'{type(permission).__name__} can not be expressed as queryset filter.')
+
+
+def filter_permitted(
+    request: Request,
+    view: APIView,
+    queryset: QuerySet[ModelT],
+) -> QuerySet[ModelT]:
+    """
+    Filter queryset to objects permitted by object permissions of view.
+
+    It is the SQL counterpart of check_object_permissions for list and bulk endpoints: every
+    permission of view must be FilterPermission or their composition with '|' and '&'.
+    """
+    permission_filter = Q()
+    for permission in view.get_permissions():
+        permission_filter &= get_permission_filter(request, view, permission)
+
+    return queryset.filter(permission_filter)
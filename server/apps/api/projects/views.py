@@ -4,11 +4,12 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from server.apps.core.instrumentation import timer
 from server.apps.issues.enums import ReleaseStatusEnum
 from server.apps.issues.services import ProjectService, ReleaseService
 
 from .. import permissions
-from ..utils import inline_serializer
+from ..utils import SparseFieldsSerializer, get_requested_fields, inline_serializer
 from . import exceptions
 
 
@@ -69,9 +70,9 @@ class ProjectUpdateApi(APIView):
 
 
 class ProjectDetailApi(APIView):
-    """API for getting project."""
+    """API for getting project. Query parameter 'fields' limits output to given fields."""
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(SparseFieldsSerializer):
         title = serializers.CharField()
         code = serializers.CharField()
         description = serializers.CharField()
@@ -86,13 +87,20 @@ class ProjectDetailApi(APIView):
             }),
         )
 
+        field_lookups = {'issues': ()}
+
     def get(self, request: Request, project_id: int) -> Response:  # noqa: D102
+        fields = get_requested_fields(request, self.OutputSerializer)
         try:
-            project = ProjectService.get_project_info(project_id)
+            project = ProjectService.get_project_info(
+                project_id,
+                only=self.OutputSerializer.get_only_lookups(fields),
+            )
         except ProjectService.ProjectNotFoundError as exc:
             raise NotFound() from exc
 
-        data = self.OutputSerializer(project).data
+        with timer('serialize'):
+            data = self.OutputSerializer(project, fields=fields).data
         return Response(data)
 
 
@@ -126,21 +134,27 @@ class ReleaseCreateApi(APIView):
 
 
 class ReleaseDetailApi(APIView):
-    """API for creating release."""
+    """API for getting release. Query parameter 'fields' limits output to given fields."""
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(SparseFieldsSerializer):
         version = serializers.CharField()
         description = serializers.CharField()
         release_date = serializers.DateField(allow_null=True)
         status = serializers.CharField()
 
     def get(self, request: Request, release_id: int, project_id: int) -> Response:  # noqa: D102
+        fields = get_requested_fields(request, self.OutputSerializer)
         try:
-            release = ReleaseService.get_by_id(project_id=project_id, release_id=release_id)
+            release = ReleaseService.get_by_id(
+                project_id=project_id,
+                release_id=release_id,
+                only=self.OutputSerializer.get_only_lookups(fields),
+            )
         except ReleaseService.ReleaseNotFoundError as exc:
             raise NotFound() from exc
 
-        data = self.OutputSerializer(release).data
+        with timer('serialize'):
+            data = self.OutputSerializer(release, fields=fields).data
         return Response(data)
 
 
@@ -0,0 +1,42 @@
+from typing import Mapping
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# Characters valid in JSON but not in JavaScript, escaped by stdlib based renderer.
+_JS_ESCAPES = (
+    ('\u2028'.encode(), b'\\u2028'),
+    ('\u2029'.encode(), b'\\u2029'),
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer of JSON with orjson producing the same output as stdlib based JSONRenderer.
+
+    Datetime, date, time, timedelta, decimal and other values unsupported by orjson natively are
+    converted by encoder of JSONRenderer. Rendering with indent or with non-default unicode or
+    compact settings falls back to JSONRenderer.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(  # noqa: D102
+        self,
+        data: object,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, object] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        content = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        for char, escaped in _JS_ESCAPES:
+            if char in content:
+                content = content.replace(char, escaped)
+
+        return content
@@ -8,6 +8,13 @@ from server.apps.issues.tests.factories import (CommentFactory, IssueFactory, Pr
 from server.apps.users.tests.factories import UserFactory
 
 
+@pytest.fixture(autouse=True)
+def _no_throttling():
+    """Allow all requests, so tests do not depend on state of Redis buckets."""
+    with mock.patch('server.apps.api.throttling.take_token', return_value=0):
+        yield
+
+
 @pytest.fixture()
 def user():
     """User fixture."""
@@ -72,6 +72,19 @@ class TestLoginApi:
             'detail': 'Invalid password was provided.',
         }
 
+    def test_login_busy(self, mock_login):
+        """Login is rejected when all login slots are busy."""
+        mock_login.side_effect = AuthService.LoginBusyError()
+
+        response = self.client.post(
+            reverse('auth:login'),
+            self.default_payload,
+            format='json',
+        )
+
+        assert response.status_code == 503
+        assert response['Retry-After'] == '1'
+
     def test_method_not_allowed(self):
         """Incorrect HTTP method."""
         response = self.client.get(
@@ -150,9 +163,9 @@ class TestRefreshTokenApi:
             'refresh_token': 'fake_refresh_token',
         }
 
-    def test_user_not_found(self, mock_refresh_token):
-        """User with provided email not found."""
-        mock_refresh_token.side_effect = UserService.UserNotFoundError()
+    def test_refresh_unavailable(self, mock_refresh_token):
+        """Refreshing fails with retry when use of token can not be recorded."""
+        mock_refresh_token.side_effect = AuthService.RefreshUnavailableError()
 
         response = self.client.post(
             reverse('auth:token_refresh'),
@@ -160,10 +173,8 @@ class TestRefreshTokenApi:
             format='json',
         )
 
-        assert response.status_code == 404
-        assert response.json() == {
-            'detail': 'Not found.',
-        }
+        assert response.status_code == 503
+        assert response['Retry-After'] == '5'
 
     def test_refreshing_error(self, mock_refresh_token):
         """User with provided email not found."""
@@ -0,0 +1,132 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from server.apps.issues.enums import ExportJobStatusEnum
+from server.apps.issues.models import ExportJob
+from server.apps.users.tests.factories import UserFactory
+
+
+@pytest.fixture()
+def export_job(user):
+    """Export job fixture."""
+    return ExportJob.objects.create(author=user, total_rows=10, processed_rows=4)
+
+
+@pytest.mark.django_db()
+class TestExportJobCreateApi:
+    """Testing ExportJobCreateApi."""
+
+    @pytest.fixture()
+    def mock_export_task(self):
+        """Mock-fixture export_data_task."""
+        with mock.patch('server.apps.issues.tasks.export_data_task.delay') as mock_task:
+            yield mock_task
+
+    def test_success(self, admin_client, mock_export_task):
+        """Success response."""
+        response = admin_client.post(reverse('exports:create'))
+
+        job = ExportJob.objects.get()
+        assert response.status_code == 201
+        assert response.json() == {'id': job.id}
+        assert job.author.is_admin
+        assert job.status == ExportJobStatusEnum.PENDING
+        mock_export_task.assert_called_once_with(job_id=job.id)
+
+    def test_pinned_to_primary(self, admin_client, mock_export_task):
+        """Author is pinned to primary, so polling the job reads it from there."""
+        with mock.patch('server.apps.core.replicas.pin_to_primary') as mock_pin:
+            response = admin_client.post(reverse('exports:create'))
+
+        assert response.status_code == 201
+        mock_pin.assert_called_once_with(ExportJob.objects.get().author_id)
+
+    def test_permission_denied(self, authorized_client, mock_export_task):
+        """Only admins export full dump of data."""
+        response = authorized_client.post(reverse('exports:create'))
+
+        assert response.status_code == 403
+        assert not ExportJob.objects.exists()
+        mock_export_task.assert_not_called()
+
+    def test_auth_fail(self):
+        """Non authenticated response."""
+        response = APIClient().post(reverse('exports:create'))
+
+        assert response.status_code == 401
+
+
+@pytest.mark.django_db()
+class TestExportJobDetailApi:
+    """Testing ExportJobDetailApi."""
+
+    def test_success(self, authorized_client, export_job):
+        """Success response."""
+        response = authorized_client.get(reverse('exports:detail', args=[export_job.id]))
+
+        assert response.status_code == 200
+        assert response.json() == {
+            'id': export_job.id,
+            'status': 'pending',
+            'progress': 40,
+            'created_at': export_job.created_at.strftime('%Y-%m-%d %H:%M'),
+        }
+
+    def test_not_found(self, authorized_client):
+        """Export job does not exist."""
+        response = authorized_client.get(reverse('exports:detail', args=[999]))
+
+        assert response.status_code == 404
+
+    def test_not_author(self, export_job):
+        """Export job of another user."""
+        client = APIClient()
+        client.force_authenticate(UserFactory(email='another@email.com'))
+
+        response = client.get(reverse('exports:detail', args=[export_job.id]))
+
+        assert response.status_code == 403
+
+    def test_admin(self, admin_client, export_job):
+        """Admin can get export job of any user."""
+        response = admin_client.get(reverse('exports:detail', args=[export_job.id]))
+
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db()
+class TestExportJobDownloadApi:
+    """Testing ExportJobDownloadApi."""
+
+    def test_success(self, authorized_client, export_job, settings, tmp_path):
+        """Success response."""
+        settings.EXPORT_ROOT = str(tmp_path)
+        (tmp_path / 'export.zip').write_bytes(b'content')
+        export_job.status = ExportJobStatusEnum.DONE
+        export_job.file_name = 'export.zip'
+        export_job.save()
+
+        response = authorized_client.get(reverse('exports:download', args=[export_job.id]))
+
+        assert response.status_code == 200
+        assert response['Content-Disposition'] == 'attachment; filename="export.zip"'
+        assert b''.join(response.streaming_content) == b'content'
+
+    def test_not_ready(self, authorized_client, export_job):
+        """Export is in progress."""
+        response = authorized_client.get(reverse('exports:download', args=[export_job.id]))
+
+        assert response.status_code == 409
+        assert response.json() == {'detail': 'Export has not been finished yet or failed.'}
+
+    def test_not_author(self, export_job):
+        """Export job of another user."""
+        client = APIClient()
+        client.force_authenticate(UserFactory(email='another@email.com'))
+
+        response = client.get(reverse('exports:download', args=[export_job.id]))
+
+        assert response.status_code == 403
@@ -1,11 +1,14 @@
 import copy
 import datetime
+import json
 from unittest import mock
 
 import pytest
 from django.urls import reverse
+from rest_framework.fields import DateTimeField
 from rest_framework.test import APIClient
 
+from server.apps.core.pagination import CountEstimate
 from server.apps.issues.models import Comment, Issue
 from server.apps.issues.services import (CommentService, IssueService, ProjectService,
                                          ReleaseService)
@@ -13,6 +16,9 @@ from server.apps.issues.tests.factories import CommentFactory, IssueFactory
 from server.apps.users.services import UserService
 from server.apps.users.tests.factories import UserFactory
 
+# Datetimes are exported as they are rendered by API.
+to_api_datetime = DateTimeField().to_representation
+
 
 @pytest.mark.django_db()
 class TestIssueCreateApi:
@@ -281,12 +287,42 @@ class TestIssueListApi:
 
     def test_empty_issues_list(self, authorized_client, mock_get_list):
         """Issue does not exist."""
-        mock_get_list.return_value = []
+        mock_get_list.return_value = Issue.objects.none()
         response = authorized_client.get(reverse('issues:list'))
 
         assert response.status_code == 200
         assert response.json() == []
 
+    def test_paginated(self, authorized_client, mock_get_list):
+        """Issues are paginated by limit and offset with exact count of small table."""
+        issues = IssueFactory.create_batch(3)
+        mock_get_list.return_value = Issue.objects.all()
+        response = authorized_client.get(
+            reverse('issues:list'), {'limit': 1, 'offset': 1, 'fields': 'code'},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            'count': 3,
+            'count_is_exact': True,
+            'next': 'http://testserver/api/issues/?fields=code&limit=1&offset=2',
+            'previous': 'http://testserver/api/issues/?fields=code&limit=1',
+            'results': [{'code': issues[1].code}],
+        }
+
+    def test_paginated_estimated_count(self, authorized_client, mock_get_list):
+        """Estimated count of large table is marked as not exact."""
+        mock_get_list.return_value = Issue.objects.all()
+        with mock.patch(
+            'server.apps.api.pagination.estimate_count',
+            return_value=CountEstimate(250_000, exact=False),
+        ):
+            response = authorized_client.get(reverse('issues:list'), {'limit': 10})
+
+        assert response.status_code == 200
+        assert response.json()['count'] == 250_000
+        assert response.json()['count_is_exact'] is False
+
     def test_auth_fail(self):
         """Non authenticated response."""
         client = APIClient()
@@ -317,6 +353,88 @@ class TestIssueListApi:
         }
 
 
+@pytest.mark.django_db()
+class TestIssueExportApi:
+    """Testing IssueExportApi."""
+
+    header = (
+        'id,code,title,description,status,estimated_time,logged_time,project,release,author,'
+        'assignee,created_at,updated_at'
+    )
+
+    def test_csv(self, authorized_client, issue):
+        """Export in CSV format."""
+        issue_without_release = IssueFactory(project=issue.project, release=None)
+
+        response = authorized_client.get(reverse('issues:export'), {'format': 'csv'})
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'text/csv'
+        assert response['Content-Disposition'] == 'attachment; filename="issues.csv"'
+        assert b''.join(response.streaming_content).decode().splitlines() == [
+            self.header,
+            f'{issue.id},TT-1,test_issue,easy_issue,open,04:00:00,00:00:00,TT,'
+            f'{issue.release.version},test@email.com,assignee@email.com,'
+            f'{to_api_datetime(issue.created_at)},{to_api_datetime(issue.updated_at)}',
+            f'{issue_without_release.id},TT-2,test_issue,easy_issue,open,04:00:00,00:00:00,TT,,'
+            f'author@email.com,assignee@email.com,'
+            f'{to_api_datetime(issue_without_release.created_at)},'
+            f'{to_api_datetime(issue_without_release.updated_at)}',
+        ]
+
+    def test_ndjson(self, authorized_client, issue):
+        """Export in NDJSON format."""
+        response = authorized_client.get(reverse('issues:export'), {'format': 'ndjson'})
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/x-ndjson'
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line) for line in lines] == [{
+            'id': issue.id,
+            'code': 'TT-1',
+            'title': 'test_issue',
+            'description': 'easy_issue',
+            'status': 'open',
+            'estimated_time': '04:00:00',
+            'logged_time': '00:00:00',
+            'project': 'TT',
+            'release': issue.release.version,
+            'author': 'test@email.com',
+            'assignee': 'assignee@email.com',
+            'created_at': to_api_datetime(issue.created_at),
+            'updated_at': to_api_datetime(issue.updated_at),
+        }]
+
+    def test_streamed_by_batches(self, authorized_client, issue, settings):
+        """Rows are fetched and streamed by chunks."""
+        settings.ISSUE_EXPORT_CHUNK_SIZE = 1
+        IssueFactory(project=issue.project)
+
+        response = authorized_client.get(reverse('issues:export'), {'format': 'ndjson'})
+
+        assert len(list(response.streaming_content)) == 2
+
+    def test_no_issues(self, authorized_client):
+        """Export without issues contains only header."""
+        response = authorized_client.get(reverse('issues:export'))
+
+        assert response.status_code == 200
+        assert b''.join(response.streaming_content).decode() == self.header + '\r\n'
+
+    def test_wrong_format(self, authorized_client):
+        """Unsupported export format."""
+        response = authorized_client.get(reverse('issues:export'), {'format': 'xml'})
+
+        assert response.status_code == 400
+        assert response.json() == {'detail': {'format': ['"xml" is not a valid choice.']}}
+
+    def test_auth_fail(self):
+        """Non authenticated response."""
+        response = APIClient().get(reverse('issues:export'))
+
+        assert response.status_code == 401
+
+
 @pytest.mark.django_db()
 class TestIssueUpdateApi:
     """Testing IssueUpdateApi."""
@@ -763,7 +881,14 @@ class TestCommentUpdateApi:
         with mock.patch('server.apps.issues.services.CommentService.update') as mock_method:
             yield mock_method
 
-    def test_success(self, authorized_client, mock_update, mock_comment_get_or_error, comment):
+    def test_success(
+        self,
+        authorized_client,
+        user,
+        mock_update,
+        mock_comment_get_or_error,
+        comment,
+    ):
         """Successful updating comment."""
         response = authorized_client.patch(
             reverse('issues:comments_update', args=[22, 55]),
@@ -774,7 +899,7 @@ class TestCommentUpdateApi:
         assert response.status_code == 200
         assert response.json() == {}
         mock_comment_get_or_error.assert_called_with(comment_id=55, issue_id=22)
-        mock_update.assert_called_with(comment=comment, text='corrected_text')
+        mock_update.assert_called_with(comment=comment, user=user, text='corrected_text')
 
     def test_comment_not_found(
         self,
@@ -843,7 +968,7 @@ class TestCommentUpdateApi:
             'detail': 'You do not have permission to perform this action.',
         }
 
-    def test_admin_access(self, mock_comment_get_or_error):
+    def test_admin_access(self, mock_comment_get_or_error, comment, mock_update):
         """Response from admin user."""
         user = UserFactory(email='another@user.com', is_admin=True)
         client = APIClient()
@@ -857,6 +982,7 @@ class TestCommentUpdateApi:
 
         assert response.status_code == 200
         assert response.json() == {}
+        mock_update.assert_called_with(comment=comment, user=user, text='corrected_text')
 
     def test_method_not_allowed(self, authorized_client):
         """Incorrect HTTP method."""
@@ -892,14 +1018,21 @@ class TestCommentDeleteApi:
         with mock.patch('server.apps.issues.services.CommentService.delete') as mock_method:
             yield mock_method
 
-    def test_success(self, authorized_client, mock_comment_get_or_error, mock_delete, comment):
+    def test_success(
+        self,
+        authorized_client,
+        user,
+        mock_comment_get_or_error,
+        mock_delete,
+        comment,
+    ):
         """Successful response."""
         response = authorized_client.delete(reverse('issues:comments_delete', args=[22, 55]))
 
         assert response.status_code == 200
         assert response.json() == {}
         mock_comment_get_or_error.assert_called_with(comment_id=55, issue_id=22)
-        mock_delete.assert_called_with(comment=comment)
+        mock_delete.assert_called_with(comment=comment, user=user)
 
     def test_comment_not_found(
         self,
@@ -946,7 +1079,7 @@ class TestCommentDeleteApi:
 
         response = client.delete(reverse('issues:comments_delete', args=[22, 55]))
 
-        mock_delete.assert_called_with(comment=comment)
+        mock_delete.assert_called_with(comment=comment, user=user)
         assert response.status_code == 200
         assert response.json() == {}
 
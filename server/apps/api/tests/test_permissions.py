@@ -0,0 +1,69 @@
+import pytest
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from server.apps.issues.models import Issue
+from server.apps.issues.tests.factories import IssueFactory
+from server.apps.users.models import User
+from server.apps.users.tests.factories import UserFactory
+
+from ..issues.views import IssueUpdateApi
+from ..permissions import FilterPermission, filter_permitted
+
+
+def make_request(user: User) -> Request:
+    """Build API request of user."""
+    request = Request(APIRequestFactory().get('/'))
+    request.user = user
+
+    return request
+
+
+@pytest.mark.django_db()
+class TestPermissions:
+    """Testing object and queryset permissions."""
+
+    def test_object_permission_without_queries(self, user, django_assert_num_queries):
+        """Related users of issue are not loaded to check permissions."""
+        issue = Issue.objects.get(id=IssueFactory(assignee=user).id)
+        view = IssueUpdateApi()
+
+        with django_assert_num_queries(0):
+            view.check_object_permissions(make_request(user), issue)
+
+    def test_filter_permitted(self, user):
+        """Only authored and assigned issues are permitted to user."""
+        authored = IssueFactory(author=user)
+        assigned = IssueFactory(assignee=user)
+        IssueFactory()
+
+        issues = filter_permitted(make_request(user), IssueUpdateApi(), Issue.objects.all())
+
+        assert set(issues) == {authored, assigned}
+
+    def test_filter_permitted_admin(self, user):
+        """All issues are permitted to admin."""
+        IssueFactory(author=user)
+        IssueFactory()
+        admin = UserFactory(email='admin@admin.com', is_admin=True)
+
+        issues = filter_permitted(make_request(admin), IssueUpdateApi(), Issue.objects.all())
+
+        assert issues.count() == 2
+
+    def test_filter_not_supported(self, user):
+        """Permission without queryset filter can not be used."""
+        view = IssueUpdateApi()
+        view.permission_classes = [IsAuthenticated]
+
+        with pytest.raises(TypeError):
+            filter_permitted(make_request(user), view, Issue.objects.all())
+
+    def test_filter_required(self):
+        """Permission without filter of objects can not be created."""
+        class NoFilter(FilterPermission):
+            """Permission not implementing get_filter."""
+
+        with pytest.raises(TypeError):
+            NoFilter()
@@ -580,7 +580,7 @@ class TestReleaseDetailApi:
             'release_date': '2024-01-01',
             'status': 'unreleased',
         }
-        mock_get_by_id.assert_called_with(release_id=888, project_id=999)
+        mock_get_by_id.assert_called_with(release_id=888, project_id=999, only=None)
 
     def test_release_not_found(self, authorized_client, mock_get_by_id):
         """Release does not exist."""
@@ -0,0 +1,104 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from server.apps.issues.models import Issue
+from server.apps.issues.tests.factories import IssueFactory
+
+from ..issues.serializers import IssueOutputSerializer
+from ..parsers import ORJSONParser
+from ..renderers import ORJSONRenderer
+
+DATA = [
+    None,
+    {},
+    [1, 'text', True, False, None],
+    {'unicode': 'Задача №1 ✓', 'quote': 'say "hi"\n\t\\', 'separators': 'a b c'},
+    {1: 'int key', 'nested': ReturnDict({'a': [{'b': ()}]}, serializer=None)},
+    {
+        'datetime': datetime.datetime(2023, 5, 1, 10, 20, 30, 1234, tzinfo=datetime.timezone.utc),
+        'naive': datetime.datetime(2023, 5, 1, 10, 20, 30),
+        'date': datetime.date(2023, 5, 1),
+        'time': datetime.time(10, 20, 30, 5000),
+        'timedelta': datetime.timedelta(days=1, hours=2, microseconds=7),
+        'decimal': decimal.Decimal('1.5'),
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'bytes': b'bytes',
+    },
+]
+
+
+class TestORJSONRenderer:
+    """Testing orjson based renderer."""
+
+    @pytest.mark.parametrize('data', DATA)
+    def test_same_output(self, data):
+        """Output is the same as of JSONRenderer."""
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indent(self):
+        """Indented output is rendered by JSONRenderer."""
+        media_type = 'application/json; indent=4'
+
+        result = ORJSONRenderer().render({'a': [1]}, accepted_media_type=media_type)
+
+        assert result == JSONRenderer().render({'a': [1]}, accepted_media_type=media_type)
+
+    @pytest.mark.django_db()
+    def test_issues_output(self):
+        """Output of issues serializers is the same as of JSONRenderer."""
+        IssueFactory.create_batch(3)
+        issues = Issue.objects.select_related('project', 'release')
+        data = IssueOutputSerializer(issues, many=True).data
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+class TestORJSONParser:
+    """Testing orjson based parser."""
+
+    @pytest.mark.parametrize('content', [
+        b'{"title": "\\u0417\\u0430\\u0434\\u0430\\u0447\\u0430", "time": "04:00:00"}',
+        '[1, 2.5, null, true, {"a": "Задача"}]'.encode(),
+    ])
+    def test_same_result(self, content):
+        """Parsed data is the same as of JSONParser."""
+        expected = JSONParser().parse(io.BytesIO(content))
+
+        assert ORJSONParser().parse(io.BytesIO(content)) == expected
+
+    @pytest.mark.parametrize('content', [b'{"a": ', b'[NaN]', b'\xff'])
+    def test_invalid(self, content):
+        """Invalid JSON raises parse error."""
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(content))
+
+
+@pytest.mark.django_db()
+class TestSettings:
+    """Testing switching of JSON backend."""
+
+    def test_enabled(self, authorized_client, issue):
+        """API renders and parses JSON with orjson by default."""
+        response = authorized_client.get(reverse('issues:list'))
+
+        assert isinstance(response.accepted_renderer, ORJSONRenderer)
+        assert response.json()[0]['code'] == issue.code
+
+    def test_invalid_body(self, authorized_client, issue):
+        """Invalid JSON body is rejected with 400."""
+        response = authorized_client.patch(
+            reverse('issues:update', kwargs={'issue_id': issue.id}),
+            data=b'{"title": ',
+            content_type='application/json',
+        )
+
+        assert response.status_code == 400
@@ -0,0 +1,103 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from server.apps.issues.tests.factories import CommentFactory
+
+
+def _get(client: APIClient, url: str, fields: str) -> tuple[Response, str]:
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, {'fields': fields})
+
+    return response, ' '.join(query['sql'] for query in context.captured_queries)
+
+
+@pytest.mark.django_db()
+class TestSparseFields:
+    """Testing query parameter 'fields' of read API."""
+
+    def test_issue_detail(self, authorized_client, issue):
+        """Only requested fields are returned and fetched."""
+        url = reverse('issues:detail', kwargs={'issue_id': issue.id})
+
+        response, sql = _get(authorized_client, url, 'code,title,status')
+
+        assert response.status_code == 200
+        assert response.json() == {'code': issue.code, 'title': issue.title, 'status': 'open'}
+        assert '"description"' not in sql
+        assert 'JOIN' not in sql
+
+    def test_issue_detail_related_fields(self, authorized_client, issue):
+        """Related and computed fields load their lookups."""
+        url = reverse('issues:detail', kwargs={'issue_id': issue.id})
+
+        response, sql = _get(authorized_client, url, 'project,release,remaining_time')
+
+        assert response.json() == {
+            'project': issue.project.code,
+            'release': issue.release.version,
+            'remaining_time': '04:00:00',
+        }
+        assert '"description"' not in sql
+
+    def test_issue_list(self, authorized_client, issue):
+        """List is narrowed in fast serialization path."""
+        response, sql = _get(authorized_client, reverse('issues:list'), 'code, title')
+
+        assert response.json() == [{'title': issue.title, 'code': issue.code}]
+        assert '"description"' not in sql
+
+    def test_comments(self, authorized_client, issue, user):
+        """Comments list and detail are narrowed."""
+        comment = CommentFactory(issue=issue, author=user)
+        list_url = reverse('issues:comments_list', kwargs={'issue_id': issue.id})
+        detail_url = reverse(
+            'issues:comments_detail',
+            kwargs={'issue_id': issue.id, 'comment_id': comment.id},
+        )
+
+        list_response, list_sql = _get(authorized_client, list_url, 'author_id')
+        detail_response, detail_sql = _get(authorized_client, detail_url, 'author_id')
+
+        assert list_response.json() == [{'author_id': user.id}]
+        assert detail_response.json() == {'author_id': user.id}
+        assert '"text"' not in list_sql + detail_sql
+
+    def test_project(self, authorized_client, project):
+        """Project issues are not fetched when not requested."""
+        url = reverse('projects:detail', kwargs={'project_id': project.id})
+
+        response, sql = _get(authorized_client, url, 'code')
+
+        assert response.json() == {'code': project.code}
+        assert '"description"' not in sql
+        assert '"issues"' not in sql
+
+    def test_release(self, authorized_client, release):
+        """Release is narrowed."""
+        url = reverse('projects:release_detail', args=[release.project_id, release.id])
+
+        response, sql = _get(authorized_client, url, 'version,status')
+
+        assert response.json() == {'version': release.version, 'status': 'unreleased'}
+        assert '"description"' not in sql
+
+    def test_user(self, authorized_client, user):
+        """User issues are not fetched when not requested."""
+        url = reverse('users:detail', kwargs={'user_id': user.id})
+
+        response, sql = _get(authorized_client, url, 'email')
+
+        assert response.json() == {'email': user.email}
+        assert '"first_name"' not in sql
+        assert '"issues"' not in sql
+
+    @pytest.mark.parametrize('fields', ['', 'code,unknown'])
+    def test_unknown_fields(self, authorized_client, issue, fields):
+        """Unknown or empty fields are rejected."""
+        response = authorized_client.get(reverse('issues:list'), {'fields': fields})
+
+        assert response.status_code == 400
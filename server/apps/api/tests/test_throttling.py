@@ -0,0 +1,145 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from server.apps.core.ratelimit import Bucket
+
+from ..throttling import parse_rate
+
+
+@pytest.fixture()
+def mock_take_token():
+    """Mock fixture taking tokens from Redis buckets."""
+    with mock.patch('server.apps.api.throttling.take_token', return_value=0) as mock_function:
+        yield mock_function
+
+
+@pytest.fixture()
+def mock_login():
+    """Mock fixture login method of AuthService."""
+    with mock.patch('server.apps.auth.services.AuthService.login') as login_mock:
+        login_mock.return_value = {'access_token': 'access', 'refresh_token': 'refresh'}
+        yield login_mock
+
+
+class TestAuthThrottle:
+    """Testing throttling of auth endpoints."""
+
+    client = APIClient()
+
+    def test_buckets(self, mock_take_token, mock_login):
+        """Login takes tokens of IP, email and global buckets at once."""
+        response = self.client.post(
+            reverse('auth:login'),
+            {'email': 'Test@Email.com', 'password': 'fake_password'},  # noqa: S106
+            format='json',
+        )
+
+        assert response.status_code == 200
+        buckets = mock_take_token.call_args.args[0]
+        assert [bucket.key.rsplit(':', 1)[0] for bucket in buckets] == [
+            'throttle:login.ip',
+            'throttle:login',
+            'throttle:login.email',
+        ]
+        assert buckets[0] == Bucket('throttle:login.ip:127.0.0.1', 20 / 60, 20)
+
+    def test_forwarded_for_ignored(self, mock_take_token, mock_login):
+        """Client changing X-Forwarded-For keeps bucket of its address without trusted proxies."""
+        for forwarded_for in ('10.0.0.1', '10.0.0.2, 10.0.0.3'):
+            self.client.post(
+                reverse('auth:login'),
+                {'email': 'test@email.com', 'password': 'fake_password'},  # noqa: S106
+                format='json',
+                HTTP_X_FORWARDED_FOR=forwarded_for,
+            )
+
+        keys = [call.args[0][0].key for call in mock_take_token.call_args_list]
+        assert keys == ['throttle:login.ip:127.0.0.1'] * 2
+
+    def test_trusted_proxy(self, settings, mock_take_token, mock_login):
+        """Client address is taken from X-Forwarded-For set by trusted proxy."""
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}
+
+        self.client.post(
+            reverse('auth:login'),
+            {'email': 'test@email.com', 'password': 'fake_password'},  # noqa: S106
+            format='json',
+            HTTP_X_FORWARDED_FOR='10.0.0.1, 10.0.0.2',
+        )
+
+        assert mock_take_token.call_args.args[0][0].key == 'throttle:login.ip:10.0.0.2'
+
+    def test_throttled(self, mock_take_token, mock_login):
+        """Throttled request gets Retry-After header and is not processed."""
+        mock_take_token.return_value = 2.5
+
+        response = self.client.post(
+            reverse('auth:login'),
+            {'email': 'test@email.com', 'password': 'fake_password'},  # noqa: S106
+            format='json',
+        )
+
+        assert response.status_code == 429
+        assert response['Retry-After'] == '3'
+        mock_login.assert_not_called()
+
+    def test_rate_not_configured(self, mock_take_token, mock_login, settings):
+        """Buckets of scopes without rate are not used."""
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {'login': '10/s'},
+        }
+
+        self.client.post(
+            reverse('auth:login'),
+            {'email': 'test@email.com', 'password': 'fake_password'},  # noqa: S106
+            format='json',
+        )
+
+        mock_take_token.assert_called_once_with([Bucket('throttle:login:all', 10, 10)])
+
+
+@pytest.mark.django_db()
+class TestScopedUserThrottle:
+    """Testing throttling of users by endpoints."""
+
+    def test_expensive_scope(self, authorized_client, user, mock_take_token):
+        """Expensive endpoint has its own scope and bucket of user."""
+        mock_take_token.return_value = 4.2
+
+        response = authorized_client.get(reverse('issues:list'))
+
+        assert response.status_code == 429
+        assert response['Retry-After'] == '5'
+        mock_take_token.assert_called_once_with(
+            [Bucket(f'throttle:expensive.user:{user.id}:IssueListApi', 0.5, 30)],
+        )
+
+    def test_admin_rates(self, admin_client, mock_take_token):
+        """Rates of admins are taken from admin scopes."""
+        admin_client.get(reverse('issues:list'))
+
+        bucket = mock_take_token.call_args.args[0][0]
+        assert bucket.key.startswith('throttle:expensive.admin:')
+        assert bucket.capacity == 120
+
+    @pytest.mark.parametrize(('method', 'scope'), [('get', 'read'), ('post', 'write')])
+    def test_default_scopes(self, authorized_client, mock_take_token, method, scope):
+        """Safe methods are reads, other methods are writes."""
+        getattr(authorized_client, method)(reverse('issues:create'))
+
+        bucket = mock_take_token.call_args.args[0][0]
+        assert bucket.key.startswith(f'throttle:{scope}.user:')
+
+
+@pytest.mark.parametrize(('rate', 'expected'), [
+    ('10/s', (10, 10)),
+    ('30/min', (0.5, 30)),
+    ('7200/hour', (2, 7200)),
+])
+def test_parse_rate(rate, expected):
+    """Rate is converted to tokens per second and capacity."""
+    assert parse_rate(rate) == expected
@@ -0,0 +1,101 @@
+import abc
+import hashlib
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from server.apps.core.ratelimit import Bucket, take_token
+
+if TYPE_CHECKING:
+    # Throttles are imported by rest_framework.views for DEFAULT_THROTTLE_CLASSES.
+    from rest_framework.views import APIView
+
+# Scope of rate and identity of client in the scope.
+ScopedIdent = tuple[str, str]
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate: str) -> tuple[float, int]:
+    """Parse rate like '20/min' to tokens per second and capacity of bucket."""
+    number, period = rate.split('/')
+    capacity = int(number)
+
+    return capacity / PERIODS[period[0]], capacity
+
+
+class TokenBucketThrottle(BaseThrottle, abc.ABC):
+    """
+    Throttle with token buckets in Redis, checked and taken with single round-trip.
+
+    Rates of buckets are taken from DEFAULT_THROTTLE_RATES by scope, buckets of scopes without
+    rate are not used.
+    """
+
+    def __init__(self) -> None:
+        self.wait_time = 0.0
+
+    @abc.abstractmethod
+    def get_buckets(self, request: Request, view: 'APIView') -> list[ScopedIdent]:
+        """Get scopes of rates and identities of client in them."""
+
+    def allow_request(self, request, view):  # noqa: D102
+        rates = api_settings.DEFAULT_THROTTLE_RATES
+        buckets = []
+        for scope, identity in self.get_buckets(request, view):
+            if rates.get(scope):
+                rate, capacity = parse_rate(rates[scope])
+                buckets.append(Bucket(f'throttle:{scope}:{identity}', rate, capacity))
+
+        self.wait_time = take_token(buckets)
+
+        return self.wait_time == 0
+
+    def wait(self):  # noqa: D102
+        return self.wait_time
+
+
+class AuthThrottle(TokenBucketThrottle):
+    """
+    Throttle of unauthenticated auth endpoints by client IP, by email and globally.
+
+    Scopes are '<throttle_scope>.ip', '<throttle_scope>.email' and '<throttle_scope>' of view.
+    """
+
+    def get_buckets(self, request: Request, view: 'APIView') -> list[ScopedIdent]:  # noqa: D102
+        scope = getattr(view, 'throttle_scope', 'auth')
+        buckets = [(f'{scope}.ip', self.get_ident(request)), (scope, 'all')]
+
+        email = request.data.get('email') if isinstance(request.data, Mapping) else None
+        if isinstance(email, str) and email:
+            digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+            buckets.append((f'{scope}.email', digest))
+
+        return buckets
+
+
+class ScopedUserThrottle(TokenBucketThrottle):
+    """
+    Throttle of every user on every endpoint separately.
+
+    Scope of endpoint is 'throttle_scope' of view, 'read' for safe methods and 'write' for
+    others by default. Rates are of '<scope>.admin' scope for admins and '<scope>.user' scope
+    for other users, e.g. 'expensive.user'.
+    """
+
+    def get_buckets(self, request: Request, view: 'APIView') -> list[ScopedIdent]:  # noqa: D102
+        scope = getattr(view, 'throttle_scope', None)
+        if scope is None:
+            scope = 'read' if request.method in SAFE_METHODS else 'write'
+
+        user = request.user
+        if not getattr(user, 'pk', None):
+            return [(f'{scope}.user', f'ip:{self.get_ident(request)}:{type(view).__name__}')]
+
+        role = 'admin' if getattr(user, 'is_admin', False) else 'user'
+
+        return [(f'{scope}.{role}', f'{user.pk}:{type(view).__name__}')]
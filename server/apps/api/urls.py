@@ -5,4 +5,5 @@ urlpatterns = [
     path('projects/', include('server.apps.api.projects.urls', namespace='projects')),
     path('issues/', include('server.apps.api.issues.urls', namespace='issues')),
     path('auth/', include('server.apps.api.auth.urls', namespace='auth')),
+    path('exports/', include('server.apps.api.exports.urls', namespace='exports')),
 ]
@@ -4,10 +4,11 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from server.apps.core.instrumentation import timer
 from server.apps.users.services import UserService
 
 from .. import permissions
-from ..utils import inline_serializer
+from ..utils import SparseFieldsSerializer, get_requested_fields, inline_serializer
 from . import exceptions
 
 
@@ -36,9 +37,9 @@ class UserCreateApi(APIView):
 
 
 class UserDetailApi(APIView):
-    """API for getting user."""
+    """API for getting user. Query parameter 'fields' limits output to given fields."""
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(SparseFieldsSerializer):
         email = serializers.EmailField()
         first_name = serializers.CharField()
         last_name = serializers.CharField()
@@ -51,13 +52,20 @@ class UserDetailApi(APIView):
             }),
         )
 
+        field_lookups = {'issues': ()}
+
     def get(self, request: Request, user_id: int) -> Response:  # noqa: D102
+        fields = get_requested_fields(request, self.OutputSerializer)
         try:
-            user = UserService.get_user_info(user_id)
+            user = UserService.get_user_info(
+                user_id,
+                only=self.OutputSerializer.get_only_lookups(fields),
+            )
         except UserService.UserNotFoundError as exc:
             raise NotFound() from exc
 
-        data = self.OutputSerializer(user).data
+        with timer('serialize'):
+            data = self.OutputSerializer(user, fields=fields).data
         return Response(data)
 
 
@@ -114,5 +122,6 @@ class UserGetAssignedIssuesApi(APIView):
     def get(self, request: Request) -> Response:  # noqa: D102
         issues = UserService.get_assigned_issues(request.user)
 
-        data = self.OutputSerializer(issues).data
+        with timer('serialize'):
+            data = self.OutputSerializer(issues).data
         return Response(data)
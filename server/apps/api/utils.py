@@ -1,4 +1,8 @@
+from typing import Sequence
+
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
 
 
 def _create_serializer_class(name, fields) -> type[serializers.Serializer]:
@@ -13,3 +17,55 @@ def inline_serializer(*, fields, data=None, **kwargs) -> serializers.Serializer:
         return serializer_class(data=data, **kwargs)
 
     return serializer_class(**kwargs)
+
+
+class SparseFieldsSerializer(serializers.Serializer):
+    """
+    Serializer limiting output to fields given in keyword argument 'fields'.
+
+    Attribute 'field_lookups' maps output fields to model field lookups when they are not
+    derived from source of field, e.g. for properties and methods.
+    """
+
+    field_lookups: dict[str, tuple[str, ...]] = {}
+
+    def __init__(self, *args, fields: Sequence[str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_only_lookups(cls, fields: Sequence[str] | None) -> list[str] | None:
+        """Get lookups of model fields required for output of fields, None for all fields."""
+        if fields is None:
+            return None
+
+        lookups: list[str] = []
+        for name in fields:
+            if name in cls.field_lookups:
+                lookups.extend(cls.field_lookups[name])
+            else:
+                source = cls._declared_fields[name].source or name
+                lookups.append(source.replace('.', '__'))
+
+        return list(dict.fromkeys(lookups))
+
+
+def get_requested_fields(
+    request: Request,
+    serializer_class: type[SparseFieldsSerializer],
+) -> list[str] | None:
+    """Get fields requested with query parameter 'fields' separated by commas."""
+    value = request.query_params.get('fields')
+    if value is None:
+        return None
+
+    fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in serializer_class._declared_fields]
+    if not fields or unknown:
+        available = ', '.join(serializer_class._declared_fields)
+        raise ValidationError({'fields': [f'Unknown fields requested, available: {available}.']})
+
+    return fields
@@ -6,14 +6,23 @@ from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.request import Request
 
+from server.apps.core import replicas
+from server.apps.core.metrics import TOKEN_CACHE_LOOKUPS
 from server.apps.users.models import User
 from server.apps.users.services import UserService
 
+from .token_cache import Claims, token_cache
+
 logger = logging.getLogger(__name__)
 
 
 class TokenAuthentication(BaseAuthentication):
-    """Authentication class with JWT Tokens."""
+    """
+    Authentication class with JWT Tokens.
+
+    Access tokens are not revocable: only refresh tokens are revoked, so access tokens stay
+    valid until their expiration and are checked without Redis.
+    """
 
     def authenticate(self, request: Request) -> tuple[User, None]:
         """User authentication."""
@@ -22,17 +31,10 @@ class TokenAuthentication(BaseAuthentication):
             raise AuthenticationFailed()
 
         token = auth_header.split()[1]
-        try:
-            decoded = jwt.decode(
-                token,
-                settings.JWT_TOKEN_SECRET,
-                algorithms=['HS256'],
-            )
-        except jwt.InvalidTokenError:
-            raise AuthenticationFailed()
+        decoded = self._decode(token)
 
         try:
-            user_email = decoded['user_email']
+            user_email = str(decoded['user_email'])
             token_type = decoded['type']
         except KeyError:
             raise AuthenticationFailed()
@@ -48,8 +50,31 @@ class TokenAuthentication(BaseAuthentication):
         if token_type != 'access':  # noqa: S105
             raise AuthenticationFailed()
 
+        replicas.route_user(user.pk)
+
         return user, None
 
+    def _decode(self, token: str) -> Claims:
+        """Get verified claims of token, tokens seen before are taken from in-process cache."""
+        cached = token_cache.get(token)
+        if cached is not None:
+            TOKEN_CACHE_LOOKUPS.labels('hit').inc()
+            return cached
+
+        TOKEN_CACHE_LOOKUPS.labels('miss').inc()
+        try:
+            decoded = jwt.decode(
+                token,
+                settings.JWT_TOKEN_SECRET,
+                algorithms=['HS256'],
+            )
+        except jwt.InvalidTokenError:
+            raise AuthenticationFailed()
+
+        token_cache.set(token, decoded)
+
+        return decoded
+
     def authenticate_header(self, request: Request) -> str:
         """Return string for header WWW-Authenticate."""
         return 'Unauthorized'
@@ -0,0 +1,32 @@
+import logging
+import math
+import time
+
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Revoked token ids are kept in cache (Redis) until tokens expire, so checks do not touch
+# database and the set does not grow beyond tokens still alive.
+REVOKED_KEY = 'auth:revoked:{jti}'
+
+
+class RevocationUnavailableError(Exception):
+    """Token can not be revoked, Redis is unavailable."""
+
+
+def revoke(jti: str, exp: int) -> bool:
+    """
+    Revoke token till its expiration. Return False if token was already revoked.
+
+    Raise RevocationUnavailableError when Redis is unavailable: single-use tokens must not be
+    accepted when their use can not be recorded.
+    """
+    timeout = max(1, math.ceil(exp - time.time()))
+
+    try:
+        return cache.add(REVOKED_KEY.format(jti=jti), 1, timeout)
+    except RedisError as exc:
+        logger.warning('Token is not revoked, Redis is unavailable.', exc_info=True)
+        raise RevocationUnavailableError() from exc
@@ -1,13 +1,18 @@
 import datetime
-import hashlib
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
 
 import jwt
 from django.conf import settings
 from django.utils import timezone
 
 from server.apps.core.exceptions import BaseServiceError
+from server.apps.core.passwords import needs_rehash, verify_password
 from server.apps.users.services import UserService
 
+from . import revocation
 from .constants import ACCESS_TOKEN_LIFETIME_DAYS, REFRESH_TOKEN_LIFETIME_DAYS
 
 
@@ -20,45 +25,86 @@ class AuthService:
     class InvalidRefreshTokenError(BaseServiceError):
         """Invalid refresh token was provided."""
 
+    class LoginBusyError(BaseServiceError):
+        """Too many logins are processed at once."""
+
+    class RefreshUnavailableError(BaseServiceError):
+        """Refresh token can not be used now, its use can not be recorded."""
+
+    _login_semaphore: threading.BoundedSemaphore | None = None
+    _login_semaphore_lock = threading.Lock()
+
     @classmethod
     def login(cls, email: str, password: str) -> dict[str, str]:
-        """Log in."""
-        user = UserService.get_by_email(email)
+        """Log in. Password hash of legacy or weaker version is upgraded on success."""
+        with cls._login_slot():
+            user = UserService.get_by_email(email)
 
-        hashed_password = cls._hash_password(password=password, email=email)
-        if user.password != hashed_password:
-            raise cls.InvalidPasswordError()
+            if not verify_password(password=password, email=email, encoded=user.password):
+                raise cls.InvalidPasswordError()
+
+            if needs_rehash(user.password):
+                UserService.set_password(user, password)
 
         return cls._generate_jwt_tokens(email)
 
     @classmethod
     def refresh_token(cls, refresh_token: str) -> dict[str, str]:
-        """Update access token by refresh token."""
+        """
+        Issue new pair of tokens by refresh token, refresh token can be used only once.
+
+        Used refresh tokens are revoked in cache till their expiration, so refreshing does not
+        query database. Token used again is rejected. Refreshing fails when Redis is unavailable,
+        otherwise stolen token could be reused during outage. Existence of user is not checked, so
+        deleted user can rotate tokens until refresh token expires, access tokens of such user
+        are rejected by authentication.
+        """
         try:
             decoded = jwt.decode(refresh_token, settings.JWT_TOKEN_SECRET, algorithms=['HS256'])
-        except jwt.ExpiredSignatureError as exc:
+        except jwt.InvalidTokenError as exc:
             raise cls.InvalidRefreshTokenError() from exc
 
         try:
             user_email = decoded['user_email']
             token_type = decoded['type']
+            jti = decoded['jti']
+            exp = decoded['exp']
         except KeyError as exc:
             raise cls.InvalidRefreshTokenError() from exc
 
-        UserService.get_by_email(user_email)
         if token_type != 'refresh':  # noqa: S105
             raise cls.InvalidRefreshTokenError()
 
+        try:
+            revoked = revocation.revoke(jti, exp)
+        except revocation.RevocationUnavailableError as exc:
+            raise cls.RefreshUnavailableError() from exc
+
+        if not revoked:
+            raise cls.InvalidRefreshTokenError()
+
         return cls._generate_jwt_tokens(user_email)
 
     @classmethod
-    def _hash_password(cls, password: str, email: str) -> str:
-        """Hash user password to save into database."""
-        secret = settings.AUTH_SECRET
-        string = secret + password + email
-        hashed_password = hashlib.sha256(string.encode())
-
-        return hashed_password.hexdigest()
+    @contextmanager
+    def _login_slot(cls) -> Iterator[None]:
+        """
+        Limit number of logins processed at once by process.
+
+        Password hashing is CPU-bound, so storm of logins would occupy all API workers. Logins
+        waiting for free slot longer than LOGIN_SLOT_TIMEOUT seconds are rejected.
+        """
+        with cls._login_semaphore_lock:
+            if cls._login_semaphore is None:
+                cls._login_semaphore = threading.BoundedSemaphore(settings.LOGIN_MAX_CONCURRENCY)
+            semaphore = cls._login_semaphore
+
+        if not semaphore.acquire(timeout=settings.LOGIN_SLOT_TIMEOUT):
+            raise cls.LoginBusyError()
+        try:
+            yield
+        finally:
+            semaphore.release()
 
     @classmethod
     def _generate_jwt_tokens(cls, email: str) -> dict[str, str]:
@@ -71,6 +117,7 @@ class AuthService:
                 'type': 'access',
                 'user_email': email,
                 'exp': access_exp_time,
+                'jti': uuid.uuid4().hex,
             },
             settings.JWT_TOKEN_SECRET,
             algorithm='HS256',
@@ -80,6 +127,7 @@ class AuthService:
                 'type': 'refresh',
                 'user_email': email,
                 'exp': refresh_exp_time,
+                'jti': uuid.uuid4().hex,
             },
             settings.JWT_TOKEN_SECRET,
             algorithm='HS256',
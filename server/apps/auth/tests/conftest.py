@@ -1,6 +1,9 @@
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
+
+from ..token_cache import token_cache
 
 
 @pytest.fixture()
@@ -9,3 +12,11 @@ def mock_jwt_encode():
     with mock.patch('jwt.encode') as mock_encode:
         mock_encode.side_effect = ['first_token', 'second_token']
         yield mock_encode
+
+
+@pytest.fixture(autouse=True)
+def _local_cache(settings):
+    """Use local memory cache instead of Redis, start with empty caches."""
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    cache.clear()
+    token_cache.clear()
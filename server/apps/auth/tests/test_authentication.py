@@ -0,0 +1,100 @@
+import time
+from unittest import mock
+
+import jwt
+import pytest
+from django.conf import settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from server.apps.users.tests.factories import UserFactory
+
+from ..authentication import TokenAuthentication
+from ..token_cache import DecodedTokenCache
+
+
+def make_request(token: str) -> Request:
+    """Build API request with token in Authorization header."""
+    return Request(APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+
+
+def make_claims(jti: str = 'token_id', lifetime: int = 60) -> dict[str, object]:
+    """Build claims of access token."""
+    return {
+        'type': 'access',
+        'user_email': 'test@email.com',
+        'jti': jti,
+        'exp': int(time.time()) + lifetime,
+    }
+
+
+class TestDecodedTokenCache:
+    """Testing LRU cache of decoded tokens."""
+
+    def test_get(self):
+        """Claims are cached by token."""
+        token_cache = DecodedTokenCache()
+        claims = make_claims()
+        token_cache.set('token', claims)
+
+        assert token_cache.get('token') == claims
+        assert token_cache.get('other_token') is None
+
+    def test_least_recently_used_evicted(self, settings):
+        """The least recently used token is evicted over size."""
+        settings.JWT_CACHE_SIZE = 2
+        token_cache = DecodedTokenCache()
+        token_cache.set('first', make_claims('first'))
+        token_cache.set('second', make_claims('second'))
+        token_cache.get('first')
+        token_cache.set('third', make_claims('third'))
+
+        assert len(token_cache) == 2
+        assert token_cache.get('second') is None
+        assert token_cache.get('first') is not None
+
+    def test_expired(self, settings):
+        """Expired tokens and tokens cached longer than TTL are not returned."""
+        token_cache = DecodedTokenCache()
+        token_cache.set('expired', make_claims(lifetime=-1))
+        settings.JWT_CACHE_TTL = 0
+        token_cache.set('stale', make_claims())
+
+        assert token_cache.get('expired') is None
+        assert token_cache.get('stale') is None
+        assert not len(token_cache)
+
+    def test_disabled(self, settings):
+        """Nothing is cached with zero size."""
+        settings.JWT_CACHE_SIZE = 0
+        token_cache = DecodedTokenCache()
+        token_cache.set('token', make_claims())
+
+        assert token_cache.get('token') is None
+
+
+@pytest.mark.django_db()
+class TestTokenAuthentication:
+    """Testing authentication by JWT."""
+
+    @pytest.fixture()
+    def token(self):
+        """Access token of existing user."""
+        UserFactory(email='test@email.com')
+        return jwt.encode(make_claims(), settings.JWT_TOKEN_SECRET)
+
+    def test_decoded_once(self, token):
+        """Repeated token is not decoded again."""
+        with mock.patch('jwt.decode', wraps=jwt.decode) as mock_decode:
+            first_user, _ = TokenAuthentication().authenticate(make_request(token))
+            second_user, _ = TokenAuthentication().authenticate(make_request(token))
+
+        assert first_user == second_user
+        mock_decode.assert_called_once()
+
+    def test_cache_backend_not_queried(self, token):
+        """Access tokens are not revocable, so authentication does not wait for Redis."""
+        with mock.patch('django.core.cache.cache.get') as mock_get:
+            TokenAuthentication().authenticate(make_request(token))
+
+        mock_get.assert_not_called()
@@ -1,8 +1,15 @@
+import hashlib
+import threading
+import time
 from unittest import mock
 
 import jwt
 import pytest
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import ConnectionError as RedisConnectionError
 
+from server.apps.core.passwords import verify_password
 from server.apps.users.services import UserService
 from server.apps.users.tests.factories import UserFactory
 
@@ -43,6 +50,34 @@ class TestAuthServiceLogin:
         with pytest.raises(AuthService.InvalidPasswordError):
             AuthService.login(email=self.email, password='incorrect_password')  # noqa: S106
 
+    def test_malformed_hash(self, mock_jwt_encode):
+        """Malformed stored hash fails login as incorrect password."""
+        UserFactory(email=self.email, password='pbkdf2_sha256$broken')  # noqa: S106
+
+        with pytest.raises(AuthService.InvalidPasswordError):
+            AuthService.login(email=self.email, password=self.password)
+
+    def test_legacy_hash_upgraded(self, mock_jwt_encode, settings):
+        """Legacy hash is replaced with PBKDF2 hash on successful login."""
+        string = settings.AUTH_SECRET + self.password + self.email
+        user = UserFactory(email=self.email, password=hashlib.sha256(string.encode()).hexdigest())
+
+        AuthService.login(email=self.email, password=self.password)
+
+        user.refresh_from_db()
+        assert user.password.startswith('pbkdf2_sha256$')
+        assert verify_password(self.password, self.email, user.password)
+
+    def test_login_busy(self, settings):
+        """Login waiting for free slot too long is rejected."""
+        settings.LOGIN_SLOT_TIMEOUT = 0
+        semaphore = threading.BoundedSemaphore(1)
+        semaphore.acquire()
+
+        with mock.patch.object(AuthService, '_login_semaphore', semaphore):
+            with pytest.raises(AuthService.LoginBusyError):
+                AuthService.login(email=self.email, password=self.password)
+
 
 @pytest.mark.django_db()
 class TestAuthServiceRefreshToken:
@@ -57,19 +92,57 @@ class TestAuthServiceRefreshToken:
         with mock.patch('jwt.decode') as mock_decode:
             yield mock_decode
 
-    def test_success_refresh(self, mock_jwt_encode, mock_jwt_decode):
-        """Success refreshing."""
-        UserFactory(email=self.email)
-        mock_jwt_decode.return_value = {
+    @pytest.fixture()
+    def payload(self):
+        """Payload of refresh token."""
+        return {
             'user_email': self.email,
             'type': 'refresh',
+            'jti': 'token_id',
+            'exp': int(time.time()) + 60,
         }
+
+    def test_success_refresh(self, mock_jwt_encode, mock_jwt_decode, payload):
+        """Success refreshing."""
+        mock_jwt_decode.return_value = payload
         result = AuthService.refresh_token(self.refresh_token)
         assert result == {
             'access_token': 'first_token',
             'refresh_token': 'second_token',
         }
 
+    def test_token_reused(self, mock_jwt_decode, payload):
+        """Refresh token can not be used twice."""
+        mock_jwt_decode.return_value = payload
+
+        AuthService.refresh_token(self.refresh_token)
+        with pytest.raises(AuthService.InvalidRefreshTokenError):
+            AuthService.refresh_token(self.refresh_token)
+
+    def test_redis_unavailable(self, mock_jwt_decode, payload):
+        """Refresh token is not accepted when its use can not be recorded."""
+        mock_jwt_decode.return_value = payload
+
+        with mock.patch.object(cache, 'add', side_effect=RedisConnectionError()):
+            with pytest.raises(AuthService.RefreshUnavailableError):
+                AuthService.refresh_token(self.refresh_token)
+
+    def test_rotation(self, payload):
+        """New refresh token is issued and works once, the used one is rejected."""
+        tokens = AuthService.refresh_token(jwt.encode(payload, settings.JWT_TOKEN_SECRET))
+        new_tokens = AuthService.refresh_token(tokens['refresh_token'])
+
+        decoded = jwt.decode(tokens['refresh_token'], options={'verify_signature': False})
+        assert decoded['jti'] != payload['jti']
+        assert new_tokens['refresh_token'] != tokens['refresh_token']
+        with pytest.raises(AuthService.InvalidRefreshTokenError):
+            AuthService.refresh_token(tokens['refresh_token'])
+
+    def test_invalid_signature(self, payload):
+        """Token signed with other secret is rejected."""
+        with pytest.raises(AuthService.InvalidRefreshTokenError):
+            AuthService.refresh_token(jwt.encode(payload, 'other_secret'))
+
     def test_expired_token(self, mock_jwt_decode):
         """Refresh token is expired."""
         mock_jwt_decode.side_effect = jwt.ExpiredSignatureError()
@@ -84,13 +157,9 @@ class TestAuthServiceRefreshToken:
         with pytest.raises(AuthService.InvalidRefreshTokenError):
             AuthService.refresh_token(self.refresh_token)
 
-    def test_incorrect_token_type(self, mock_jwt_decode):
+    def test_incorrect_token_type(self, mock_jwt_decode, payload):
         """Incorrect type of token."""
-        UserFactory(email=self.email)
-        mock_jwt_decode.return_value = {
-            'user_email': self.email,
-            'type': 'access',
-        }
+        mock_jwt_decode.return_value = {**payload, 'type': 'access'}
 
         with pytest.raises(AuthService.InvalidRefreshTokenError):
             AuthService.refresh_token(self.refresh_token)
@@ -0,0 +1,76 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Mapping
+
+from django.conf import settings
+
+Claims = Mapping[str, object]
+
+
+class DecodedTokenCache:
+    """
+    Thread-safe LRU cache of verified claims of tokens, keyed by digest of token.
+
+    Entries live until token expires but not longer than JWT_CACHE_TTL seconds. At most
+    JWT_CACHE_SIZE tokens are kept, zero size disables cache.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[bytes, tuple[float, Claims]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Claims | None:
+        """Get claims of cached token if it is still valid."""
+        key = self._get_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return claims
+
+    def set(self, token: str, claims: Claims) -> None:
+        """Cache verified claims of token."""
+        maxsize = settings.JWT_CACHE_SIZE
+        if maxsize <= 0:
+            return
+
+        exp = claims.get('exp')
+        expires_at = time.time() + settings.JWT_CACHE_TTL
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        key = self._get_key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get number of cached tokens."""
+        return len(self._entries)
+
+    def _remove(self, key: bytes) -> None:
+        del self._entries[key]
+
+    @staticmethod
+    def _get_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+
+token_cache = DecodedTokenCache()
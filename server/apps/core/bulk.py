@@ -0,0 +1,151 @@
+import datetime
+import itertools
+from typing import Iterable, Iterator, Sequence
+
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils import timezone
+from django.utils.duration import duration_iso_string
+
+TIMESTAMP_FIELDS = ('created_at', 'updated_at')
+
+
+def format_copy_value(value: object) -> str:
+    """Format value as CSV field of COPY, None is unquoted empty string meaning NULL."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        text = 't' if value else 'f'
+    elif isinstance(value, datetime.timedelta):
+        text = duration_iso_string(value)
+    elif isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+
+    return '"' + text.replace('"', '""') + '"'
+
+
+class CopyStream:
+    """File-like object reading CSV lines of COPY generated from rows on demand."""
+
+    def __init__(self, rows: Iterable[Sequence[object]]) -> None:
+        self.lines = (','.join(map(format_copy_value, row)) + '\n' for row in rows)
+        self.buffer = b''
+        self.rows = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read at least size bytes of lines, all lines if size is negative."""
+        while size < 0 or len(self.buffer) < size:
+            line = next(self.lines, None)
+            if line is None:
+                break
+            self.buffer += line.encode()
+            self.rows += 1
+
+        if size < 0:
+            size = len(self.buffer)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+
+        return data
+
+
+def _get_fields(model: type[models.Model]) -> dict[str, models.Field]:  # type: ignore[type-arg]
+    return {
+        field.attname: field for field in model._meta.get_fields()
+        if isinstance(field, models.Field) and field.concrete
+    }
+
+
+def _get_columns(model: type[models.Model]) -> dict[str, str]:
+    return {attname: field.column for attname, field in _get_fields(model).items()}
+
+
+def get_copy_sql(
+    model: type[models.Model],
+    fields: Sequence[str],
+    connection: BaseDatabaseWrapper,
+) -> str:
+    """Build COPY statement loading CSV into columns of model fields."""
+    quote = connection.ops.quote_name
+    model_columns = _get_columns(model)
+    columns = ', '.join(quote(model_columns[field]) for field in fields)
+
+    return f'COPY {quote(model._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)'
+
+
+def get_insert_sql(
+    model: type[models.Model],
+    fields: Sequence[str],
+    connection: BaseDatabaseWrapper,
+) -> str:
+    """Build INSERT statement with placeholders of values of model fields."""
+    quote = connection.ops.quote_name
+    model_columns = _get_columns(model)
+    columns = ', '.join(quote(model_columns[field]) for field in fields)
+    placeholders = ', '.join(['%s'] * len(fields))
+
+    table = quote(model._meta.db_table)
+
+    return f'INSERT INTO {table} ({columns}) VALUES ({placeholders})'  # noqa: S608
+
+
+def _with_timestamps(
+    model: type[models.Model],
+    fields: Sequence[str],
+    rows: Iterable[Sequence[object]],
+) -> tuple[list[str], Iterator[Sequence[object]]]:
+    missing = [
+        field for field in TIMESTAMP_FIELDS
+        if field not in fields and field in _get_columns(model)
+    ]
+    if not missing:
+        return list(fields), iter(rows)
+
+    now = timezone.now()
+    defaults = (now,) * len(missing)
+
+    return [*fields, *missing], (tuple(row) + defaults for row in rows)
+
+
+def bulk_insert(
+    model: type[models.Model],
+    fields: Sequence[str],
+    rows: Iterable[Sequence[object]],
+    batch_size: int = 5_000,
+    using: str = DEFAULT_DB_ALIAS,
+) -> int:
+    """
+    Insert rows of values of fields to table of model. Return number of inserted rows.
+
+    Fields are attribute names of model fields, e.g. 'issue_id' for foreign key. Timestamps
+    'created_at' and 'updated_at' of BaseModel are set to current time when not given and are
+    kept when given. On PostgreSQL rows are streamed to the single COPY statement without
+    building model instances, other databases fall back to executemany() of INSERT statement by
+    batches of batch_size.
+    """
+    fields, rows = _with_timestamps(model, fields, rows)
+    connection = connections[using]
+
+    if connection.vendor == 'postgresql':
+        stream = CopyStream(rows)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(get_copy_sql(model, fields, connection), stream)
+
+        return stream.rows
+
+    # Values are prepared by model fields without pre_save(), so given timestamps are not
+    # replaced by auto_now_add and auto_now, the same as with COPY.
+    model_fields = [_get_fields(model)[field] for field in fields]
+    sql = get_insert_sql(model, fields, connection)
+    inserted = 0
+    with connection.cursor() as cursor:
+        while batch := list(itertools.islice(rows, batch_size)):
+            cursor.executemany(sql, [
+                [field.get_db_prep_save(value, connection)
+                 for field, value in zip(model_fields, row)]
+                for row in batch
+            ])
+            inserted += len(batch)
+
+    return inserted
@@ -0,0 +1,44 @@
+from typing import Iterable
+
+from django.core.cache.backends.base import BaseCache
+from django_redis.cache import RedisCache
+
+from .metrics import CACHE_LOOKUPS
+
+_missing = object()
+
+
+def get_key_prefix(key: str) -> str:
+    """Get first part of colon separated key, e.g. 'replicas' of 'replicas:pinned:1'."""
+    return key.split(':', 1)[0]
+
+
+class InstrumentedCacheMixin(BaseCache):
+    """
+    Mixin of cache backend counting hits and misses of lookups by prefix of key.
+
+    Only get() is counted, get_many() of BaseCache calls it for every key.
+    """
+
+    def get(self, key: str, default: object = None, version: int | None = None) -> object:
+        """Get value of key, default when it is missing."""
+        value = super().get(key, _missing, version=version)
+        if value is _missing:
+            CACHE_LOOKUPS.labels(get_key_prefix(key), 'miss').inc()
+            return default
+
+        CACHE_LOOKUPS.labels(get_key_prefix(key), 'hit').inc()
+        return value
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    """Redis cache exporting hit ratio of lookups to Prometheus."""
+
+    def get_many(self, keys: Iterable[str], version: int | None = None) -> dict[str, object]:
+        """Get values of found keys."""
+        keys = list(keys)
+        values = super().get_many(keys, version=version)
+        for key in keys:
+            CACHE_LOOKUPS.labels(get_key_prefix(key), 'hit' if key in values else 'miss').inc()
+
+        return values
@@ -0,0 +1,104 @@
+import gzip
+import zlib
+from typing import Iterable, Iterator, Protocol
+
+import brotli
+
+GZIP = 'gzip'
+BROTLI = 'br'
+
+
+class StreamCompressor(Protocol):
+    """Incremental compressor of streamed content."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress chunk of data and flush it so client can decompress it immediately."""
+
+    def finish(self) -> bytes:
+        """Get the rest of compressed data."""
+
+
+class GzipStreamCompressor:
+    """Incremental gzip compressor."""
+
+    def __init__(self, level: int) -> None:
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:  # noqa: D102
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:  # noqa: D102
+        return self.compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliStreamCompressor:
+    """Incremental brotli compressor."""
+
+    def __init__(self, quality: int) -> None:
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:  # noqa: D102
+        return self.compressor.process(data) + self.compressor.flush()
+
+    def finish(self) -> bytes:  # noqa: D102
+        return self.compressor.finish()
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse Accept-Encoding header to quality values of codings."""
+    codings = {}
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        name, _, value = params.partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        codings[coding] = quality
+
+    return codings
+
+
+def choose_encoding(header: str) -> str | None:
+    """Choose brotli or gzip coding accepted by client, brotli is preferred on equal quality."""
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get('*', 0.0)
+    candidates = [
+        (codings.get(coding, wildcard), coding == BROTLI, coding) for coding in (BROTLI, GZIP)
+    ]
+    quality, _, coding = max(candidates)
+
+    return coding if quality > 0 else None
+
+
+def compress(content: bytes, coding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    """Compress whole content."""
+    if coding == BROTLI:
+        return brotli.compress(content, quality=brotli_quality)
+
+    return gzip.compress(content, compresslevel=gzip_level, mtime=0)
+
+
+def compress_stream(
+    chunks: Iterable[bytes],
+    coding: str,
+    gzip_level: int,
+    brotli_quality: int,
+) -> Iterator[bytes]:
+    """Compress streamed content chunk by chunk, every chunk is flushed to client."""
+    compressor: StreamCompressor
+    if coding == BROTLI:
+        compressor = BrotliStreamCompressor(brotli_quality)
+    else:
+        compressor = GzipStreamCompressor(gzip_level)
+
+    for chunk in chunks:
+        if chunk:
+            yield compressor.compress(chunk)
+    yield compressor.finish()
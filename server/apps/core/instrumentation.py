@@ -0,0 +1,98 @@
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+from celery.signals import after_task_publish, before_task_publish
+from django.http import HttpRequest
+
+_current_metrics: ContextVar['RequestMetrics | None'] = ContextVar(
+    'current_request_metrics',
+    default=None,
+)
+
+
+class RequestMetrics:
+    """Timings collected during processing of a single request."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_time = 0.0
+        self.timings: dict[str, float] = {}
+        self._started: dict[str, list[tuple[float, float]]] = {}
+
+    def start(self, name: str) -> None:
+        """Start measuring of named segment."""
+        self._started.setdefault(name, []).append((time.perf_counter(), self.db_time))
+
+    def stop(self, name: str) -> None:
+        """Stop measuring of named segment. SQL time spent inside the segment is excluded."""
+        if not self._started.get(name):
+            return
+
+        started, db_time = self._started[name].pop()
+        elapsed = time.perf_counter() - started - (self.db_time - db_time)
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """Database execute wrapper counting queries and their time."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started
+
+
+def get_current() -> RequestMetrics | None:
+    """Get metrics of request being processed in the running context."""
+    return _current_metrics.get()
+
+
+def activate(metrics: RequestMetrics) -> Callable[[], None]:
+    """Make metrics current for the running context. Return function for deactivation."""
+    token = _current_metrics.set(metrics)
+    return lambda: _current_metrics.reset(token)
+
+
+@contextlib.contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Measure named segment of request processing if instrumentation is active."""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    metrics.start(name)
+    try:
+        yield
+    finally:
+        metrics.stop(name)
+
+
+def get_view_name(request: HttpRequest) -> str:
+    """Get name of view class or function processed the request."""
+    match = request.resolver_match
+    if match is None:
+        return '<unresolved>'
+
+    view = getattr(match.func, 'view_class', match.func)
+    return view.__name__
+
+
+def _on_before_task_publish(**kwargs) -> None:
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.start('celery')
+
+
+def _on_after_task_publish(**kwargs) -> None:
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.stop('celery')
+
+
+def connect_celery_signals() -> None:
+    """Measure time of enqueuing celery tasks."""
+    before_task_publish.connect(_on_before_task_publish, dispatch_uid='instrumentation_before')
+    after_task_publish.connect(_on_after_task_publish, dispatch_uid='instrumentation_after')
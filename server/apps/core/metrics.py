@@ -0,0 +1,173 @@
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from celery import Celery
+from celery.signals import (task_failure, task_postrun, task_prerun, task_retry, task_success,
+                            worker_init, worker_process_shutdown)
+from django.conf import settings
+from prometheus_client import (REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess,
+                               start_http_server)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+REQUESTS = Counter(
+    'http_requests',
+    'Processed HTTP requests.',
+    ['view', 'method', 'status'],
+)
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Latency of HTTP requests.',
+    ['view', 'method'],
+)
+DB_QUERIES = Counter(
+    'db_queries',
+    'Executed database queries.',
+    ['view'],
+)
+DB_QUERY_TIME = Counter(
+    'db_query_duration_seconds',
+    'Time spent in database queries.',
+    ['view'],
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups',
+    'Lookups of keys in Django cache by prefix of key and result (hit, miss).',
+    ['prefix', 'result'],
+)
+TOKEN_CACHE_LOOKUPS = Counter(
+    'auth_token_cache_lookups',
+    'Lookups of decoded JWT in in-process cache by result (hit, miss).',
+    ['result'],
+)
+TASKS = Counter(
+    'celery_tasks',
+    'Finished celery task runs by state (success, failure, retry).',
+    ['task', 'state'],
+)
+TASK_LATENCY = Histogram(
+    'celery_task_duration_seconds',
+    'Execution time of celery tasks.',
+    ['task'],
+)
+
+_task_started: dict[str, float] = {}
+
+
+class QueryCounter:
+    """Database execute wrapper counting queries and their time."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):  # noqa: D102
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.duration += time.perf_counter() - started
+
+
+class QueueDepthCollector(Collector):
+    """Collect number of messages waiting in celery queues on every scrape."""
+
+    def __init__(self, app: Celery, queues: Iterable[str]) -> None:
+        self.app = app
+        self.queues = queues
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:  # noqa: D102
+        gauge = GaugeMetricFamily(
+            'celery_queue_length',
+            'Messages waiting in celery queue.',
+            labels=['queue'],
+        )
+        try:
+            with self.app.connection_for_read() as connection:
+                channel = connection.default_channel
+                for queue in self.queues:
+                    _, length, _ = channel.queue_declare(queue=queue, passive=True)
+                    gauge.add_metric([queue], length)
+        except Exception as exc:
+            logger.warning('Failed to get celery queues length: %s', exc)
+
+        yield gauge
+
+
+def observe_request(
+    view: str,
+    method: str,
+    status: int,
+    duration: float,
+    query_counter: QueryCounter,
+) -> None:
+    """Save metrics of processed request."""
+    REQUESTS.labels(view, method, status).inc()
+    REQUEST_LATENCY.labels(view, method).observe(duration)
+    DB_QUERIES.labels(view).inc(query_counter.queries)
+    DB_QUERY_TIME.labels(view).inc(query_counter.duration)
+
+
+def get_registry() -> CollectorRegistry:
+    """Get registry aggregating metrics of all processes when multiprocess mode is on."""
+    if MULTIPROCESS_DIR_ENV not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return registry
+
+
+@task_prerun.connect
+def _on_task_prerun(task_id: str, **kwargs) -> None:
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _on_task_postrun(task_id: str, task, **kwargs) -> None:
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        TASK_LATENCY.labels(task.name).observe(time.perf_counter() - started)
+
+
+@task_success.connect
+def _on_task_success(sender, **kwargs) -> None:
+    TASKS.labels(sender.name, 'success').inc()
+
+
+@task_failure.connect
+def _on_task_failure(sender, **kwargs) -> None:
+    TASKS.labels(sender.name, 'failure').inc()
+
+
+@task_retry.connect
+def _on_task_retry(sender, **kwargs) -> None:
+    TASKS.labels(sender.name, 'retry').inc()
+
+
+@worker_init.connect
+def _on_worker_init(**kwargs) -> None:
+    if not settings.PROMETHEUS_WORKER_PORT:
+        return
+
+    multiprocess_dir = os.environ.get(MULTIPROCESS_DIR_ENV)
+    if multiprocess_dir:
+        for path in Path(multiprocess_dir).glob('*.db'):
+            path.unlink()
+
+    start_http_server(settings.PROMETHEUS_WORKER_PORT, registry=get_registry())
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(pid: int, **kwargs) -> None:
+    if MULTIPROCESS_DIR_ENV in os.environ:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,288 @@
+import contextlib
+import json
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Iterator, cast
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.middleware.csrf import CsrfViewMiddleware
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import patch_vary_headers
+
+from . import compression, instrumentation, metrics, replicas
+
+logger = logging.getLogger(__name__)
+
+MiddlewareResult = HttpResponseBase | Awaitable[HttpResponseBase]
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Collect query count, SQL time, named segment timings and total latency of requests.
+
+    Timings are returned in header Server-Timing. Requests slower than threshold are always
+    logged, others are logged with configured sample rate. Middleware is not loaded at all
+    when instrumentation is disabled.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.REQUEST_INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.slow_threshold = settings.REQUEST_INSTRUMENTATION_SLOW_MS / 1000
+        self.sample_rate = settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE
+        instrumentation.connect_celery_signals()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:  # noqa: D102
+        metrics = instrumentation.RequestMetrics()
+        deactivate = instrumentation.activate(metrics)
+        started = time.perf_counter()
+        try:
+            with contextlib.ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.execute_wrapper))
+                response = self.get_response(request)
+        finally:
+            deactivate()
+        total = time.perf_counter() - started
+
+        response['Server-Timing'] = self._server_timing(metrics, total)
+
+        slow = total >= self.slow_threshold
+        if slow or random.random() < self.sample_rate:  # noqa: S311
+            timings = metrics.timings.items()
+            record = {
+                'view': instrumentation.get_view_name(request),
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'queries': metrics.queries,
+                'db_ms': round(metrics.db_time * 1000, 3),
+                **{f'{name}_ms': round(value * 1000, 3) for name, value in timings},
+                'total_ms': round(total * 1000, 3),
+            }
+            logger.log(logging.WARNING if slow else logging.INFO, json.dumps(record))
+
+        return response
+
+    def process_template_response(
+        self,
+        request: HttpRequest,
+        response: SimpleTemplateResponse,
+    ) -> SimpleTemplateResponse:
+        """Measure rendering of response content."""
+        metrics = instrumentation.get_current()
+        if metrics is not None:
+            metrics.start('render')
+            response.add_post_render_callback(lambda _: metrics.stop('render'))
+
+        return response
+
+    def _server_timing(self, metrics: instrumentation.RequestMetrics, total: float) -> str:
+        entries = [f'db;dur={metrics.db_time * 1000:.3f};desc="{metrics.queries} queries"']
+        entries.extend(
+            f'{name};dur={value * 1000:.3f}' for name, value in metrics.timings.items()
+        )
+        entries.append(f'total;dur={total * 1000:.3f}')
+
+        return ', '.join(entries)
+
+
+class PrometheusMetricsMiddleware:
+    """Collect request rate, latency and database queries count per view for Prometheus."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.PROMETHEUS_METRICS_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:  # noqa: D102
+        query_counter = metrics.QueryCounter()
+        started = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(query_counter))
+            response = self.get_response(request)
+
+        metrics.observe_request(
+            view=instrumentation.get_view_name(request),
+            method=request.method or '',
+            status=response.status_code,
+            duration=time.perf_counter() - started,
+            query_counter=query_counter,
+        )
+
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip depending on header Accept-Encoding of request.
+
+    Regular responses are compressed when they are larger than threshold, streamed ones (e.g.
+    exports) are compressed chunk by chunk. Responses out of configured path prefixes, not
+    modified, already encoded or with incompressible content type are left as is.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]) -> None:
+        if not settings.COMPRESSION_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.path_prefixes = tuple(settings.COMPRESSION_PATH_PREFIXES)
+        self.content_types = set(settings.COMPRESSION_CONTENT_TYPES)
+        self.gzip_level = settings.COMPRESSION_GZIP_LEVEL
+        self.brotli_quality = settings.COMPRESSION_BROTLI_QUALITY
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:  # noqa: D102
+        response = self.get_response(request)
+        if not self._is_compressible(request, response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = compression.choose_encoding(request.headers.get('Accept-Encoding', ''))
+        if coding is None:
+            return response
+
+        if isinstance(response, StreamingHttpResponse):
+            response.streaming_content = compression.compress_stream(
+                cast(Iterator[bytes], response.streaming_content),
+                coding,
+                gzip_level=self.gzip_level,
+                brotli_quality=self.brotli_quality,
+            )
+            del response['Content-Length']
+        elif isinstance(response, HttpResponse):
+            content = compression.compress(
+                response.content,
+                coding,
+                gzip_level=self.gzip_level,
+                brotli_quality=self.brotli_quality,
+            )
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response['Content-Length'] = str(len(content))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag  # compressed content is not byte-identical
+        response['Content-Encoding'] = coding
+
+        return response
+
+    def _is_compressible(self, request: HttpRequest, response: HttpResponseBase) -> bool:
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+
+        return (
+            request.path.startswith(self.path_prefixes)
+            and 200 <= response.status_code < 300
+            and response.status_code != 204
+            and not response.has_header('Content-Encoding')
+            and content_type in self.content_types
+            and (
+                isinstance(response, StreamingHttpResponse) and not response.is_async
+                or isinstance(response, HttpResponse) and len(response.content) >= self.min_size
+            )
+        )
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Route reads of safe API requests to read replicas.
+
+    Streamed responses keep reading from replicas while they are consumed. Users are routed to
+    primary after their writes by authentication. Middleware is not loaded at all without
+    replicas.
+    """
+
+    safe_methods = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]) -> None:
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:  # noqa: D102
+        if (
+            request.method not in self.safe_methods
+            or not request.path_info.startswith(settings.API_PATH_PREFIX)
+        ):
+            return self.get_response(request)
+
+        deactivate = replicas.activate()
+        try:
+            response = self.get_response(request)
+            from_replica = replicas.is_reading_from_replica()
+        finally:
+            deactivate()
+
+        if from_replica and isinstance(response, StreamingHttpResponse) and not response.is_async:
+            response.streaming_content = replicas.stream_from_replica(
+                cast(Iterator[bytes], response.streaming_content),
+            )
+
+        return response
+
+
+def is_api_profile_request(request: HttpRequest) -> bool:
+    """Check request goes to JWT authenticated API processed by minimal middleware chain."""
+    return settings.API_PROFILE_ENABLED and request.path_info.startswith(settings.API_PATH_PREFIX)
+
+
+class ApiBypassSessionMiddleware(SessionMiddleware):
+    """Session middleware not loading and saving sessions for API requests."""
+
+    def __call__(self, request: HttpRequest) -> MiddlewareResult:  # noqa: D102
+        if is_api_profile_request(request):
+            return self.get_response(request)
+
+        return super().__call__(request)
+
+
+class ApiBypassCsrfViewMiddleware(CsrfViewMiddleware):
+    """CSRF middleware skipping API requests which are authenticated with tokens, not cookies."""
+
+    def __call__(self, request: HttpRequest) -> MiddlewareResult:  # noqa: D102
+        if is_api_profile_request(request):
+            return self.get_response(request)
+
+        return super().__call__(request)
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):  # noqa: D102
+        if is_api_profile_request(request):
+            return None
+
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class ApiBypassAuthenticationMiddleware(AuthenticationMiddleware):
+    """Authentication middleware skipping API requests which are authenticated by DRF."""
+
+    def __call__(self, request: HttpRequest) -> MiddlewareResult:  # noqa: D102
+        if is_api_profile_request(request):
+            return self.get_response(request)
+
+        return super().__call__(request)
+
+
+class ApiBypassMessageMiddleware(MessageMiddleware):
+    """Message middleware not loading and saving messages for API requests."""
+
+    def __call__(self, request: HttpRequest) -> MiddlewareResult:  # noqa: D102
+        if is_api_profile_request(request):
+            return self.get_response(request)
+
+        return super().__call__(request)
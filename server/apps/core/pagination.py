@@ -0,0 +1,75 @@
+import json
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils.functional import cached_property
+
+
+@dataclass(frozen=True)
+class CountEstimate:
+    """Number of rows of queryset, exact or estimated by query planner."""
+
+    count: int
+    exact: bool
+
+
+def _get_planner_estimate(
+    queryset: models.QuerySet[models.Model],
+    connection: BaseDatabaseWrapper,
+) -> int:
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.is_sliced and not query.combinator:
+            # table statistics, negative when table was never analyzed
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            if row is not None and row[0] >= 0:
+                return int(row[0])
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def estimate_count(
+    queryset: models.QuerySet[models.Model],
+    threshold: int | None = None,
+) -> CountEstimate:
+    """
+    Count rows of queryset exactly when there are few of them, estimate otherwise.
+
+    On PostgreSQL rows of unfiltered table are estimated by statistics of table (reltuples),
+    rows of other querysets by EXPLAIN. Querysets estimated below threshold (default is
+    COUNT_ESTIMATE_THRESHOLD) and querysets of other databases are counted exactly.
+    """
+    threshold = settings.COUNT_ESTIMATE_THRESHOLD if threshold is None else threshold
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        estimate = _get_planner_estimate(queryset, connection)
+        if estimate >= threshold:
+            return CountEstimate(estimate, exact=False)
+
+    return CountEstimate(queryset.count(), exact=True)
+
+
+class EstimatedCountPaginator(Paginator):  # type: ignore[type-arg]
+    """Paginator of querysets counting rows of large tables approximately."""
+
+    @cached_property  # type: ignore[override]
+    def count(self) -> int:
+        """Get exact or estimated number of objects."""
+        if isinstance(self.object_list, models.QuerySet):
+            return estimate_count(self.object_list).count
+
+        return super().count
@@ -0,0 +1,79 @@
+import base64
+import hashlib
+import logging
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Hashes are stored as '<algorithm>$<iterations>$<salt>$<hash>', legacy hashes are plain
+# hexdigest of unsalted SHA-256 without separators.
+ALGORITHM = 'pbkdf2_sha256'
+SALT_BYTES = 16
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix='password-hash',
+            )
+
+    return _executor
+
+
+def _pbkdf2(password: str, salt: str, iterations: int) -> str:
+    # PBKDF2 of hashlib releases GIL, so bounded pool caps CPU spent on hashing by process
+    # while request threads only wait for result.
+    future = _get_executor().submit(
+        hashlib.pbkdf2_hmac, 'sha256', password.encode(), salt.encode(), iterations,
+    )
+
+    return base64.b64encode(future.result()).decode('ascii')
+
+
+def _legacy_hash(password: str, email: str) -> str:
+    string = settings.AUTH_SECRET + password + email
+    return hashlib.sha256(string.encode()).hexdigest()
+
+
+def hash_password(password: str, iterations: int | None = None) -> str:
+    """Hash user password to save into database with salted PBKDF2."""
+    iterations = iterations or settings.PASSWORD_HASH_ITERATIONS
+    salt = secrets.token_urlsafe(SALT_BYTES)
+    hashed = _pbkdf2(password, salt, iterations)
+
+    return f'{ALGORITHM}${iterations}${salt}${hashed}'
+
+
+def verify_password(password: str, email: str, encoded: str) -> bool:
+    """Check password against stored hash of any supported version, malformed one never matches."""
+    try:
+        if '$' not in encoded:
+            return secrets.compare_digest(_legacy_hash(password, email), encoded)
+
+        algorithm, iterations, salt, hashed = encoded.split('$', 3)
+        if algorithm != ALGORITHM:
+            return False
+
+        return secrets.compare_digest(_pbkdf2(password, salt, int(iterations)), hashed)
+    except (ValueError, TypeError):  # compare_digest() raises TypeError for non-ASCII strings
+        logger.warning('Password hash of user %s is malformed.', email)
+        return False
+
+
+def needs_rehash(encoded: str) -> bool:
+    """Check whether hash is of legacy version or is weaker than configured."""
+    parts = encoded.split('$', 3)
+    if len(parts) != 4 or parts[0] != ALGORITHM or not parts[1].isdigit():
+        return True
+
+    return int(parts[1]) < settings.PASSWORD_HASH_ITERATIONS
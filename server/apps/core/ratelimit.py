@@ -0,0 +1,92 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from django_redis import get_redis_connection
+from redis.commands.core import Script
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Refill and take one token from every bucket atomically, nothing is taken when any bucket is
+# empty. Returns seconds to wait for a token of the most exhausted bucket, '0' when allowed.
+# KEYS are buckets, ARGV are pairs of rate (tokens per second) and capacity of every bucket.
+BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local capacity = tonumber(ARGV[i * 2])
+    local bucket = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local available = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+    available = math.min(capacity, available + math.max(0, now - updated_at) * rate)
+    if available < 1 then
+        wait = math.max(wait, (1 - available) / rate)
+    end
+    tokens[i] = available
+end
+if wait == 0 then
+    for i, key in ipairs(KEYS) do
+        local rate = tonumber(ARGV[i * 2 - 1])
+        local capacity = tonumber(ARGV[i * 2])
+        redis.call('HSET', key, 'tokens', tokens[i] - 1, 'updated_at', now)
+        redis.call('EXPIRE', key, math.ceil(capacity / rate))
+    end
+end
+return tostring(wait)
+"""
+
+# Redis is not called for a while after failure, so its outage does not add timeouts to
+# every request.
+RETRY_INTERVAL = 5
+
+_script: Script | None = None
+_unavailable_until = 0.0
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """Token bucket refilled with rate tokens per second up to capacity."""
+
+    key: str
+    rate: float
+    capacity: int
+
+
+def _get_script() -> Script:
+    global _script
+
+    if _script is None:
+        _script = get_redis_connection('default').register_script(BUCKET_SCRIPT)
+
+    return _script
+
+
+def take_token(buckets: Sequence[Bucket]) -> float:
+    """
+    Take token from every bucket with single call of Lua script.
+
+    Return 0 when tokens were taken, otherwise seconds to wait for the next token. Requests are
+    allowed when Redis is unavailable, so outage of Redis does not take API down.
+    """
+    global _unavailable_until
+
+    if not buckets or time.monotonic() < _unavailable_until:
+        return 0
+
+    args: list[float] = []
+    for bucket in buckets:
+        args.extend((bucket.rate, bucket.capacity))
+
+    try:
+        wait = _get_script()(keys=[bucket.key for bucket in buckets], args=args)
+    except RedisError:
+        logger.warning('Rate limiting is skipped, Redis is unavailable.', exc_info=True)
+        _unavailable_until = time.monotonic() + RETRY_INTERVAL
+        return 0
+
+    return float(wait)
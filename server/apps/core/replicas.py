@@ -0,0 +1,106 @@
+import logging
+import random
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+_read_from_replica: ContextVar[bool] = ContextVar('read_from_replica', default=False)
+
+
+def is_reading_from_replica() -> bool:
+    """Check reads of the running context are routed to replicas."""
+    return _read_from_replica.get() and bool(settings.DATABASE_REPLICAS)
+
+
+def activate() -> Callable[[], None]:
+    """Route reads of the running context to replicas. Return function for deactivation."""
+    token = _read_from_replica.set(True)
+    return lambda: _read_from_replica.reset(token)
+
+
+def use_primary() -> None:
+    """Route the rest of reads of the running context to primary database."""
+    _read_from_replica.set(False)
+
+
+def _pin_key(user_id: int) -> str:
+    return f'replicas:pinned:{user_id}'
+
+
+def pin_to_primary(user_id: int) -> None:
+    """Route reads of user to primary for a while after write, so user reads own writes."""
+    use_primary()
+    if not settings.DATABASE_REPLICAS:
+        return
+
+    try:
+        cache.set(_pin_key(user_id), 1, timeout=settings.DATABASE_REPLICA_PIN_SECONDS)
+    except RedisError:
+        logger.warning('User is not pinned to primary, Redis is unavailable.', exc_info=True)
+
+
+def route_user(user_id: int) -> None:
+    """Route reads of request to primary when user has written recently."""
+    if not is_reading_from_replica():
+        return
+
+    try:
+        pinned = cache.get(_pin_key(user_id)) is not None
+    except RedisError:
+        logger.warning('Reads are routed to primary, Redis is unavailable.', exc_info=True)
+        pinned = True
+
+    if pinned:
+        use_primary()
+
+
+def stream_from_replica(content: Iterator[bytes]) -> Iterator[bytes]:
+    """Read from replicas while streamed response is consumed after request processing."""
+    iterator = iter(content)
+    while True:
+        token = _read_from_replica.set(True)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _read_from_replica.reset(token)
+
+        yield chunk
+
+
+class ReplicaRouter:
+    """
+    Database router sending reads of safe API requests to random replica.
+
+    Writes, reads inside transactions and reads out of requests routed with activate() go to
+    primary database. Migrations are applied to primary only.
+    """
+
+    def db_for_read(self, model: type[models.Model], **hints: object) -> str | None:
+        """Get replica for read, None for primary."""
+        if is_reading_from_replica() and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return random.choice(settings.DATABASE_REPLICAS)  # noqa: S311
+
+        return None
+
+    def db_for_write(self, model: type[models.Model], **hints: object) -> str | None:
+        """Get primary database for write."""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: models.Model, obj2: models.Model, **hints: object) -> bool:
+        """Allow relations between objects of primary and replicas having the same data."""
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: object) -> bool | None:
+        """Migrate primary database only."""
+        if db in settings.DATABASE_REPLICAS:
+            return False
+
+        return None
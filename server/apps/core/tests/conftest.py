@@ -0,0 +1,9 @@
+import pytest
+
+from server.apps.users.tests.factories import UserFactory
+
+
+@pytest.fixture()
+def user():
+    """User fixture."""
+    return UserFactory()
@@ -0,0 +1,67 @@
+from unittest import mock
+
+import pytest
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ..middleware import (ApiBypassAuthenticationMiddleware, ApiBypassMessageMiddleware,
+                          ApiBypassSessionMiddleware)
+
+
+class TestApiBypassMiddlewares:
+    """Testing middlewares skipping API requests."""
+
+    @pytest.mark.parametrize('middleware_class', [
+        ApiBypassSessionMiddleware,
+        ApiBypassAuthenticationMiddleware,
+        ApiBypassMessageMiddleware,
+    ])
+    def test_api_request(self, middleware_class):
+        """API request passes middleware untouched."""
+        request = RequestFactory().get('/api/issues/')
+
+        middleware_class(lambda _: HttpResponse())(request)
+
+        assert not hasattr(request, 'session')
+        assert not hasattr(request, 'user')
+        assert not hasattr(request, '_messages')
+
+    def test_disabled(self, settings):
+        """All requests are processed when API profile is disabled."""
+        settings.API_PROFILE_ENABLED = False
+        request = RequestFactory().get('/api/issues/')
+
+        ApiBypassSessionMiddleware(lambda _: HttpResponse())(request)
+
+        assert hasattr(request, 'session')
+
+
+@pytest.mark.django_db()
+class TestApiProfile:
+    """Testing API and admin requests with API profile."""
+
+    def test_api_without_session(self, user):
+        """API request does not touch session storage."""
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        with mock.patch('django.contrib.sessions.backends.db.SessionStore.load') as mock_load:
+            client.cookies['sessionid'] = 'session'
+            response = client.get(reverse('issues:list'))
+
+        assert response.status_code == 200
+        assert 'sessionid' not in response.cookies
+        mock_load.assert_not_called()
+
+    def test_admin_keeps_csrf(self):
+        """Admin is still protected by CSRF and uses session."""
+        client = Client(enforce_csrf_checks=True)
+
+        page = client.get(reverse('admin:login'))
+        response = client.post(reverse('admin:login'), {'username': 'a', 'password': 'b'})
+
+        assert page.status_code == 200
+        assert 'csrftoken' in page.cookies
+        assert response.status_code == 403
@@ -0,0 +1,99 @@
+import datetime
+from unittest import mock
+
+import pytest
+from django.db import connection
+
+from server.apps.issues.models import Comment
+from server.apps.issues.tests.factories import IssueFactory
+
+from ..bulk import CopyStream, bulk_insert, format_copy_value, get_copy_sql, get_insert_sql
+
+
+class TestCopyFormat:
+    """Testing formatting of rows for COPY."""
+
+    @pytest.mark.parametrize(('value', 'expected'), [
+        (None, ''),
+        ('', '""'),
+        ('say "hi",\nbye', '"say ""hi"",\nbye"'),
+        (15, '"15"'),
+        (True, '"t"'),
+        (datetime.timedelta(days=1, hours=2), '"P1DT02H00M00S"'),
+        (datetime.date(2023, 5, 1), '"2023-05-01"'),
+    ])
+    def test_format_value(self, value, expected):
+        """NULL is unquoted empty field, other values are quoted."""
+        assert format_copy_value(value) == expected
+
+    def test_stream_reads_by_size(self):
+        """Lines are generated lazily and returned by chunks of requested size."""
+        stream = CopyStream(([number, None] for number in range(3)))
+
+        chunks = [stream.read(5) for _ in range(4)]
+
+        assert b''.join(chunks) == b'"0",\n"1",\n"2",\n'
+        assert chunks[-1] == b''
+        assert stream.rows == 3
+
+    def test_copy_sql(self):
+        """Statement uses table and columns of model fields."""
+        sql = get_copy_sql(Comment, ['issue_id', 'text'], connection)
+
+        assert sql == 'COPY "comments" ("issue_id", "text") FROM STDIN WITH (FORMAT csv)'
+
+    def test_insert_sql(self):
+        """Fallback statement has placeholder of every field."""
+        sql = get_insert_sql(Comment, ['issue_id', 'text'], connection)
+
+        assert sql == 'INSERT INTO "comments" ("issue_id", "text") VALUES (%s, %s)'
+
+
+@pytest.mark.django_db()
+class TestBulkInsert:
+    """Testing bulk insert of rows."""
+
+    def test_fallback_to_executemany(self, user):
+        """Rows are inserted by batches with timestamps when database is not PostgreSQL."""
+        issue = IssueFactory()
+        rows = ((f'comment {number}', user.id, issue.id) for number in range(5))
+
+        inserted = bulk_insert(Comment, ['text', 'author_id', 'issue_id'], rows, batch_size=2)
+
+        assert inserted == 5
+        comments = Comment.objects.order_by('id')
+        assert [comment.text for comment in comments] == [f'comment {i}' for i in range(5)]
+        assert all(comment.created_at and comment.updated_at for comment in comments)
+
+    def test_given_timestamps_kept(self, user):
+        """Given timestamps are not replaced by auto_now_add and auto_now."""
+        issue = IssueFactory()
+        created_at = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+        bulk_insert(
+            Comment,
+            ['text', 'author_id', 'issue_id', 'created_at', 'updated_at'],
+            [('old', user.id, issue.id, created_at, created_at)],
+        )
+
+        comment = Comment.objects.get()
+        assert comment.created_at == created_at
+        assert comment.updated_at == created_at
+
+    def test_copy(self):
+        """Rows with timestamps are streamed to COPY on PostgreSQL."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.__enter__.return_value.copy_expert.side_effect = lambda sql, file: file.read()
+
+        with (
+            mock.patch.object(connection, 'vendor', 'postgresql'),
+            mock.patch.object(connection, 'cursor', return_value=mock_cursor),
+        ):
+            inserted = bulk_insert(Comment, ['text', 'issue_id'], [('a', 1), ('b', 2)])
+
+        assert inserted == 2
+        sql, stream = mock_cursor.__enter__.return_value.copy_expert.call_args.args
+        assert sql == (
+            'COPY "comments" ("text", "issue_id", "created_at", "updated_at") '
+            'FROM STDIN WITH (FORMAT csv)'
+        )
@@ -0,0 +1,56 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+from prometheus_client import REGISTRY
+
+from ..cache import InstrumentedCacheMixin, InstrumentedRedisCache
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    """In-memory cache counting lookups."""
+
+
+def get_lookups(prefix: str, result: str) -> float:
+    """Get number of cache lookups of key prefix by result."""
+    value = REGISTRY.get_sample_value('cache_lookups_total', {'prefix': prefix, 'result': result})
+    return value or 0.0
+
+
+class TestInstrumentedCache:
+    """Testing cache backend counting hits and misses."""
+
+    def test_get(self):
+        """Hits and misses are counted by prefix of key, stored None is a hit."""
+        cache = InstrumentedLocMemCache('test_get', {})
+        cache.set('tests:none', None)
+        hits, misses = get_lookups('tests', 'hit'), get_lookups('tests', 'miss')
+
+        assert cache.get('tests:none', 'default') is None
+        assert cache.get('tests:missing', 'default') == 'default'
+        assert get_lookups('tests', 'hit') == hits + 1
+        assert get_lookups('tests', 'miss') == misses + 1
+
+    def test_get_many(self):
+        """Each key of get_many is counted once."""
+        cache = InstrumentedLocMemCache('test_get_many', {})
+        cache.set('many:first', 1)
+        hits, misses = get_lookups('many', 'hit'), get_lookups('many', 'miss')
+
+        assert cache.get_many(['many:first', 'many:second']) == {'many:first': 1}
+        assert get_lookups('many', 'hit') == hits + 1
+        assert get_lookups('many', 'miss') == misses + 1
+
+    def test_redis_get_many(self):
+        """Keys of get_many of Redis, which does not call get, are counted."""
+        cache = caches.create_connection('default')
+        assert isinstance(cache, InstrumentedRedisCache)
+        hits, misses = get_lookups('redis', 'hit'), get_lookups('redis', 'miss')
+
+        with mock.patch.object(RedisCache, 'get_many', return_value={'redis:first': 1}):
+            values = cache.get_many(['redis:first', 'redis:second'])
+
+        assert values == {'redis:first': 1}
+        assert get_lookups('redis', 'hit') == hits + 1
+        assert get_lookups('redis', 'miss') == misses + 1
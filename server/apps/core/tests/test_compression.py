@@ -0,0 +1,116 @@
+import gzip
+import zlib
+
+import brotli
+import pytest
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.test import RequestFactory
+
+from ..compression import choose_encoding, compress_stream
+from ..middleware import CompressionMiddleware
+
+CONTENT = b'{"title": "issue", "status": "open"}' * 100
+
+
+class TestChooseEncoding:
+    """Testing negotiation of content coding."""
+
+    @pytest.mark.parametrize(('header', 'expected'), [
+        ('gzip, deflate, br', 'br'),
+        ('gzip', 'gzip'),
+        ('br;q=0.5, gzip;q=0.8', 'gzip'),
+        ('*', 'br'),
+        ('gzip;q=0, br;q=0', None),
+        ('identity', None),
+        ('', None),
+    ])
+    def test_choose(self, header, expected):
+        """Brotli is preferred on equal quality, zero quality refuses coding."""
+        assert choose_encoding(header) == expected
+
+
+class TestCompressStream:
+    """Testing compression of streamed content."""
+
+    def test_gzip(self):
+        """Every chunk is flushed and whole stream is valid gzip."""
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = list(compress_stream([b'first', b'', b'second'], 'gzip', 6, 5))
+
+        assert decompressor.decompress(chunks[0]) == b'first'
+        assert gzip.decompress(b''.join(chunks)) == b'firstsecond'
+
+    def test_brotli(self):
+        """Whole stream is valid brotli."""
+        chunks = compress_stream([b'first', b'second'], 'br', 6, 5)
+
+        assert brotli.decompress(b''.join(chunks)) == b'firstsecond'
+
+
+class TestCompressionMiddleware:
+    """Testing CompressionMiddleware."""
+
+    @pytest.fixture()
+    def request_factory(self, settings):
+        """Request factory with compression settings."""
+        settings.COMPRESSION_MIN_SIZE = 1024
+        settings.COMPRESSION_PATH_PREFIXES = ['/api/']
+
+        return RequestFactory(headers={'Accept-Encoding': 'gzip, br'})
+
+    def _process(self, request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+        return CompressionMiddleware(lambda _: response)(request)
+
+    def test_brotli(self, request_factory):
+        """Large JSON response is compressed with brotli."""
+        response = HttpResponse(CONTENT, content_type='application/json')
+        response['ETag'] = '"abc"'
+
+        result = self._process(request_factory.get('/api/issues/'), response)
+
+        assert isinstance(result, HttpResponse)
+        assert result['Content-Encoding'] == 'br'
+        assert result['Vary'] == 'Accept-Encoding'
+        assert result['ETag'] == 'W/"abc"'
+        assert int(result['Content-Length']) == len(result.content)
+        assert brotli.decompress(result.content) == CONTENT
+
+    def test_gzip_streaming(self, request_factory):
+        """Streamed response is compressed by chunks."""
+        response = StreamingHttpResponse(iter([CONTENT, CONTENT]), content_type='text/csv')
+        request = request_factory.get('/api/issues/export', headers={'Accept-Encoding': 'gzip'})
+
+        result = self._process(request, response)
+
+        assert result['Content-Encoding'] == 'gzip'
+        assert isinstance(result, StreamingHttpResponse)
+        assert gzip.decompress(b''.join(result)) == CONTENT * 2
+
+    @pytest.mark.parametrize(('path', 'status', 'content', 'content_type'), [
+        ('/api/issues/', 200, b'{}', 'application/json'),
+        ('/api/issues/', 304, b'', 'application/json'),
+        ('/api/exports/1/download', 200, CONTENT, 'application/zip'),
+        ('/admin/', 200, CONTENT, 'application/json'),
+    ])
+    def test_not_compressed(self, request_factory, path, status, content, content_type):
+        """Small, not modified, incompressible responses and other paths are left as is."""
+        response = HttpResponse(content, status=status, content_type=content_type)
+
+        result = self._process(request_factory.get(path), response)
+
+        assert isinstance(result, HttpResponse)
+        assert not result.has_header('Content-Encoding')
+        assert result.content == content
+
+    def test_not_accepted(self, request_factory):
+        """Response is not compressed without accepted coding but varies on it."""
+        response = HttpResponse(CONTENT, content_type='application/json')
+        request = request_factory.get('/api/issues/', headers={'Accept-Encoding': 'identity'})
+
+        result = self._process(request, response)
+
+        assert isinstance(result, HttpResponse)
+        assert not result.has_header('Content-Encoding')
+        assert result.content == CONTENT
+        assert result['Vary'] == 'Accept-Encoding'
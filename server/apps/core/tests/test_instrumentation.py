@@ -0,0 +1,70 @@
+import logging
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from server.apps.issues.tests.factories import IssueFactory
+
+from ..instrumentation import RequestMetrics, activate, timer
+
+
+class TestTimer:
+    """Testing timer of request segments."""
+
+    def test_no_active_metrics(self):
+        """Timer does nothing outside of instrumented request."""
+        with timer('serialize'):
+            pass
+
+    def test_sql_time_excluded(self):
+        """SQL time inside segment is not counted twice."""
+        metrics = RequestMetrics()
+        deactivate = activate(metrics)
+        try:
+            with mock.patch('time.perf_counter', side_effect=[10.0, 15.0]):
+                with timer('serialize'):
+                    metrics.db_time += 3
+        finally:
+            deactivate()
+
+        assert metrics.timings == {'serialize': 2}
+
+
+@pytest.mark.django_db()
+class TestRequestInstrumentationMiddleware:
+    """Testing RequestInstrumentationMiddleware."""
+
+    @pytest.fixture()
+    def client(self, settings, user):
+        """Authenticate client with enabled instrumentation."""
+        settings.REQUEST_INSTRUMENTATION_ENABLED = True
+        settings.REQUEST_INSTRUMENTATION_SLOW_MS = 0
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        return client
+
+    def test_server_timing(self, client, user, caplog):
+        """Timings are returned in header and logged for slow request."""
+        IssueFactory(author=user)
+
+        with caplog.at_level(logging.INFO, logger='server.apps.core.middleware'):
+            response = client.get(reverse('issues:list'))
+
+        assert response.status_code == 200
+        entries = [entry.split(';')[0] for entry in response['Server-Timing'].split(', ')]
+        assert entries == ['db', 'serialize', 'render', 'total']
+        assert '"view": "IssueListApi"' in caplog.text
+        assert '"queries": 1' in caplog.text
+
+    def test_disabled(self, settings, user):
+        """Disabled instrumentation adds no header."""
+        settings.REQUEST_INSTRUMENTATION_ENABLED = False
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(reverse('issues:list'))
+
+        assert 'Server-Timing' not in response
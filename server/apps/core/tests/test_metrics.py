@@ -0,0 +1,45 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from server.apps.issues.tests.factories import IssueFactory
+
+
+@pytest.mark.django_db()
+class TestMetricsView:
+    """Testing endpoint with Prometheus metrics."""
+
+    @pytest.fixture()
+    def mock_queue_declare(self):
+        """Mock-fixture of getting celery queue length."""
+        with mock.patch('server.celery.app.connection_for_read') as mock_connection:
+            channel = mock_connection.return_value.__enter__.return_value.default_channel
+            channel.queue_declare.return_value = ('notifications', 3, 0)
+            yield channel.queue_declare
+
+    def test_request_metrics(self, user, mock_queue_declare):
+        """Metrics of processed requests and queues length are exposed."""
+        client = APIClient()
+        client.force_authenticate(user=user)
+        IssueFactory(author=user)
+        client.get(reverse('issues:list'))
+
+        response = client.get(reverse('metrics'))
+
+        assert response.status_code == 200
+        content = response.content.decode()
+        assert 'http_requests_total{method="GET",status="200",view="IssueListApi"}' in content
+        assert 'http_request_duration_seconds_bucket{' in content
+        assert 'db_queries_total{view="IssueListApi"}' in content
+        assert 'celery_queue_length{queue="notifications"} 3.0' in content
+        mock_queue_declare.assert_any_call(queue='exports', passive=True)
+
+    def test_broker_unavailable(self, user):
+        """Metrics are exposed even if broker is unavailable."""
+        with mock.patch('server.celery.app.connection_for_read', side_effect=OSError()):
+            response = APIClient().get(reverse('metrics'))
+
+        assert response.status_code == 200
+        assert 'celery_queue_length' in response.content.decode()
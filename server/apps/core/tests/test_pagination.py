@@ -0,0 +1,52 @@
+from unittest import mock
+
+import pytest
+
+from server.apps.issues.models import Issue
+from server.apps.issues.tests.factories import IssueFactory
+
+from ..pagination import CountEstimate, EstimatedCountPaginator, estimate_count
+
+
+@pytest.fixture()
+def mock_estimate():
+    """Mock fixture of PostgreSQL planner estimate."""
+    with mock.patch('django.db.backends.sqlite3.base.DatabaseWrapper.vendor', 'postgresql'):
+        with mock.patch('server.apps.core.pagination._get_planner_estimate') as mock_estimate:
+            yield mock_estimate
+
+
+@pytest.mark.django_db()
+class TestEstimateCount:
+    """Testing exact and estimated counts of querysets."""
+
+    def test_exact_count(self):
+        """Rows are counted exactly on databases without planner estimates."""
+        IssueFactory.create_batch(3)
+
+        assert estimate_count(Issue.objects.all(), threshold=0) == CountEstimate(3, exact=True)
+
+    def test_estimated_count(self, mock_estimate):
+        """Estimate is used for querysets of many rows."""
+        mock_estimate.return_value = 500
+
+        assert estimate_count(Issue.objects.all(), threshold=100) == CountEstimate(
+            500, exact=False,
+        )
+
+    def test_small_estimate(self, mock_estimate):
+        """Rows are counted exactly when estimate is below threshold."""
+        IssueFactory.create_batch(2)
+        mock_estimate.return_value = 50
+
+        assert estimate_count(Issue.objects.all(), threshold=100) == CountEstimate(2, exact=True)
+
+    def test_paginator(self, mock_estimate, settings):
+        """Paginator uses estimated count of queryset."""
+        settings.COUNT_ESTIMATE_THRESHOLD = 100
+        mock_estimate.return_value = 1000
+
+        paginator = EstimatedCountPaginator(Issue.objects.order_by('id'), 100)
+
+        assert paginator.count == 1000
+        assert paginator.num_pages == 10
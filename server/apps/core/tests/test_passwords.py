@@ -0,0 +1,70 @@
+import hashlib
+
+import pytest
+
+from ..passwords import hash_password, needs_rehash, verify_password
+
+
+@pytest.fixture(autouse=True)
+def _fast_hashing(settings):
+    """Lower hashing cost to keep tests fast."""
+    settings.PASSWORD_HASH_ITERATIONS = 1000
+
+
+class TestPasswords:
+    """Testing hashing and verification of passwords."""
+
+    email = 'test@email.com'
+    password = 'secret_password'  # noqa: S105
+
+    def test_hash_format(self):
+        """Hash is salted and contains algorithm and iterations."""
+        encoded = hash_password(self.password)
+
+        algorithm, iterations, salt, hashed = encoded.split('$')
+        assert (algorithm, iterations) == ('pbkdf2_sha256', '1000')
+        assert salt
+        assert hashed
+        assert hash_password(self.password) != encoded
+
+    def test_verify(self):
+        """Only the same password matches hash."""
+        encoded = hash_password(self.password)
+
+        assert verify_password(self.password, self.email, encoded)
+        assert not verify_password('other_password', self.email, encoded)
+        assert not verify_password(self.password, self.email, 'md5$1$salt$hash')
+
+    def test_verify_legacy(self, settings):
+        """Unsalted SHA-256 hashes are still verified."""
+        string = settings.AUTH_SECRET + self.password + self.email
+        encoded = hashlib.sha256(string.encode()).hexdigest()
+
+        assert verify_password(self.password, self.email, encoded)
+        assert not verify_password(self.password, 'other@email.com', encoded)
+
+    @pytest.mark.parametrize('encoded', [
+        'pbkdf2_sha256$',
+        'pbkdf2_sha256$1000$salt',
+        'pbkdf2_sha256$many$salt$hash',
+        'pbkdf2_sha256$0$salt$hash',
+    ])
+    def test_malformed_hash(self, encoded):
+        """Malformed hash does not match any password and is replaced on login."""
+        assert not verify_password(self.password, self.email, encoded)
+        assert needs_rehash(encoded)
+
+    @pytest.mark.parametrize('encoded', ['pbkdf2_sha256$1000$salt$хэш', 'хэш'])
+    def test_non_ascii_hash(self, encoded):
+        """Hash with non-ASCII characters does not match any password."""
+        assert not verify_password(self.password, self.email, encoded)
+
+    def test_needs_rehash(self, settings):
+        """Legacy and weaker hashes need rehash."""
+        encoded = hash_password(self.password)
+
+        assert not needs_rehash(encoded)
+        assert needs_rehash(hashlib.sha256(b'legacy').hexdigest())
+
+        settings.PASSWORD_HASH_ITERATIONS = 2000
+        assert needs_rehash(encoded)
@@ -0,0 +1,40 @@
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from ..ratelimit import Bucket, take_token
+
+
+@pytest.fixture()
+def mock_script():
+    """Mock fixture Lua script of token buckets."""
+    with mock.patch('server.apps.core.ratelimit._unavailable_until', 0):
+        with mock.patch('server.apps.core.ratelimit._get_script') as mock_get_script:
+            yield mock_get_script.return_value
+
+
+class TestTakeToken:
+    """Testing taking tokens from Redis buckets."""
+
+    buckets = [Bucket('a', 0.5, 30), Bucket('b', 10, 10)]
+
+    def test_single_call(self, mock_script):
+        """All buckets are checked with one script call."""
+        mock_script.return_value = b'1.5'
+
+        assert take_token(self.buckets) == 1.5
+        mock_script.assert_called_once_with(keys=['a', 'b'], args=[0.5, 30, 10, 10])
+
+    def test_no_buckets(self, mock_script):
+        """Redis is not called without buckets."""
+        assert take_token([]) == 0
+        mock_script.assert_not_called()
+
+    def test_redis_unavailable(self, mock_script):
+        """Requests are allowed and Redis is not called for a while after failure."""
+        mock_script.side_effect = RedisConnectionError()
+
+        assert take_token(self.buckets) == 0
+        assert take_token(self.buckets) == 0
+        mock_script.assert_called_once()
@@ -0,0 +1,128 @@
+from typing import Iterator
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from server.apps.issues.models import Issue
+
+from .. import replicas
+from ..middleware import ReplicaRoutingMiddleware
+
+
+@pytest.fixture()
+def replica_settings(settings):
+    """Configure replica and local cache of pins."""
+    settings.DATABASE_REPLICAS = ['replica_0']
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    yield settings
+    cache.clear()
+
+
+def read_database(request) -> HttpResponse:
+    """View responding with database of reads."""
+    return HttpResponse(replicas.ReplicaRouter().db_for_read(Issue) or '')
+
+
+class TestReplicaRouter:
+    """Testing routing of reads to replicas."""
+
+    def test_primary_by_default(self, replica_settings):
+        """Reads out of activated context go to primary."""
+        assert replicas.ReplicaRouter().db_for_read(Issue) is None
+
+    def test_replica(self, replica_settings):
+        """Activated reads go to replica."""
+        deactivate = replicas.activate()
+        try:
+            assert replicas.ReplicaRouter().db_for_read(Issue) == 'replica_0'
+        finally:
+            deactivate()
+
+        assert replicas.ReplicaRouter().db_for_read(Issue) is None
+
+    def test_no_replicas(self, settings):
+        """Reads go to primary without configured replicas."""
+        settings.DATABASE_REPLICAS = []
+        deactivate = replicas.activate()
+        try:
+            assert replicas.ReplicaRouter().db_for_read(Issue) is None
+        finally:
+            deactivate()
+
+    def test_transaction(self, replica_settings):
+        """Reads inside transaction go to primary."""
+        deactivate = replicas.activate()
+        try:
+            with mock.patch.object(connection, 'in_atomic_block', True):
+                assert replicas.ReplicaRouter().db_for_read(Issue) is None
+        finally:
+            deactivate()
+
+    def test_migrate(self, replica_settings):
+        """Replicas are not migrated."""
+        router = replicas.ReplicaRouter()
+
+        assert router.allow_migrate('replica_0', 'issues') is False
+        assert router.allow_migrate('default', 'issues') is None
+
+
+class TestPinToPrimary:
+    """Testing pinning of users to primary after writes."""
+
+    def test_pinned_user(self, replica_settings):
+        """User having written recently reads from primary."""
+        replicas.pin_to_primary(1)
+        deactivate = replicas.activate()
+        try:
+            replicas.route_user(2)
+            assert replicas.is_reading_from_replica()
+
+            replicas.route_user(1)
+            assert not replicas.is_reading_from_replica()
+        finally:
+            deactivate()
+
+    def test_redis_unavailable(self, replica_settings):
+        """User reads from primary when pins can not be checked."""
+        deactivate = replicas.activate()
+        try:
+            with mock.patch.object(cache, 'get', side_effect=RedisConnectionError()):
+                replicas.route_user(1)
+
+            assert not replicas.is_reading_from_replica()
+        finally:
+            deactivate()
+
+
+class TestReplicaRoutingMiddleware:
+    """Testing routing of API requests by middleware."""
+
+    @pytest.mark.parametrize(('method', 'path', 'database'), [
+        ('get', '/api/issues/', b'replica_0'),
+        ('post', '/api/issues/', b''),
+        ('get', '/admin/', b''),
+    ])
+    def test_routing(self, replica_settings, method, path, database):
+        """Only safe API requests read from replicas."""
+        request = getattr(RequestFactory(), method)(path)
+        response = ReplicaRoutingMiddleware(read_database)(request)
+
+        assert isinstance(response, HttpResponse)
+        assert response.content == database
+        assert not replicas.is_reading_from_replica()
+
+    def test_streaming(self, replica_settings):
+        """Streamed content is read from replicas after request is processed."""
+        def stream() -> Iterator[bytes]:
+            yield (replicas.ReplicaRouter().db_for_read(Issue) or '').encode()
+
+        middleware = ReplicaRoutingMiddleware(lambda request: StreamingHttpResponse(stream()))
+        response = middleware(RequestFactory().get('/api/issues/export/'))
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert response.getvalue() == b'replica_0'
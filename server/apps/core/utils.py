@@ -1,12 +1,25 @@
-import hashlib
+from typing import Sequence, TypeVar
 
-from django.conf import settings
+from django.db import models
 
+_ModelT = TypeVar('_ModelT', bound=models.Model)
 
-def hash_password(password: str, email: str) -> str:
-    """Hash user password to save into database."""
-    secret = settings.AUTH_SECRET
-    string = secret + password + email
-    hashed_password = hashlib.sha256(string.encode())
 
-    return hashed_password.hexdigest()
+def load_only(
+    queryset: models.QuerySet[_ModelT],
+    lookups: Sequence[str] | None,
+) -> models.QuerySet[_ModelT]:
+    """
+    Load only fields of lookups if given, primary key only for empty lookups.
+
+    Relations not used by lookups are not joined.
+    """
+    if lookups is None:
+        return queryset
+
+    related = {lookup.rsplit('__', 1)[0] for lookup in lookups if '__' in lookup}
+    queryset = queryset.select_related(None)
+    if related:
+        queryset = queryset.select_related(*related)
+
+    return queryset.only(*lookups or ['pk'])
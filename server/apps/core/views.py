@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+
+from server.celery import app
+
+from .metrics import QueueDepthCollector, get_registry
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Expose metrics in Prometheus text format."""
+    queues_registry = CollectorRegistry()
+    queues_registry.register(QueueDepthCollector(app, settings.PROMETHEUS_CELERY_QUEUES))
+
+    content = generate_latest(get_registry()) + generate_latest(queues_registry)
+    return HttpResponse(content, content_type=CONTENT_TYPE_LATEST)
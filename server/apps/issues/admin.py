@@ -1,4 +1,8 @@
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+from server.apps.core.pagination import EstimatedCountPaginator
 
 from .models import Comment, Issue, Project, Release
 
@@ -8,6 +12,7 @@ class ProjectAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     """Project representation on admin site."""
 
     list_display = ('id', 'title', 'code')
+    search_fields = ('title', 'code')
     fields = ('id', 'title', 'code', 'description')
     readonly_fields = ('id',)
 
@@ -17,15 +22,28 @@ class ReleaseAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     """Release representation on admin site."""
 
     list_display = ('id', 'project', 'version', 'release_date', 'status')
+    list_select_related = ('project',)
+    search_fields = ('version', 'project__code')
+    autocomplete_fields = ('project',)
     fields = ('id', 'project', 'version', 'release_date', 'status')
     readonly_fields = ('id',)
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Release]:
+        """Get releases with projects used by their text representation, e.g. in autocomplete."""
+        return super().get_queryset(request).select_related('project')
+
 
 @admin.register(Issue)
 class IssueAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     """Issue representation on admin site."""
 
     list_display = ('project', 'title', 'status', 'author', 'assignee')
+    list_select_related = ('project', 'author', 'assignee')
+    search_fields = ('code',)
+    autocomplete_fields = ('author', 'assignee', 'project', 'release')
+    # table is huge, so rows are counted approximately and only once
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = ('code', 'id')
     fields = (
         'id',
@@ -47,3 +65,8 @@ class CommentAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     """Comment representation on admin site."""
 
     list_display = ('issue', 'author')
+    list_select_related = ('issue', 'author')
+    raw_id_fields = ('issue',)
+    autocomplete_fields = ('author',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -16,3 +16,12 @@ class IssueStatusEnum(models.TextChoices):
     CLOSED = 'closed'
     REOPENED = 'reopened'
     RESOLVED = 'resolved'
+
+
+class ExportJobStatusEnum(models.TextChoices):
+    """Enum of export job status."""
+
+    PENDING = 'pending'
+    IN_PROGRESS = 'in_progress'
+    DONE = 'done'
+    FAILED = 'failed'
@@ -0,0 +1,191 @@
+import csv
+import datetime
+import io
+import json
+import zipfile
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence
+
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.duration import duration_string
+
+from .enums import ExportJobStatusEnum
+from .models import Comment, ExportJob, Issue, Release
+
+ExportValue = str | int | None
+
+ISSUE_EXPORT_COLUMNS = {
+    'id': 'id',
+    'code': 'code',
+    'title': 'title',
+    'description': 'description',
+    'status': 'status',
+    'estimated_time': 'estimated_time',
+    'logged_time': 'logged_time',
+    'project': 'project__code',
+    'release': 'release__version',
+    'author': 'author__email',
+    'assignee': 'assignee__email',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+RELEASE_EXPORT_COLUMNS = {
+    'id': 'id',
+    'project': 'project__code',
+    'version': 'version',
+    'description': 'description',
+    'release_date': 'release_date',
+    'status': 'status',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+COMMENT_EXPORT_COLUMNS = {
+    'id': 'id',
+    'issue': 'issue__code',
+    'author': 'author__email',
+    'text': 'text',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+ARCHIVE_FILES: dict[str, tuple[type[Issue] | type[Release] | type[Comment], dict[str, str]]] = {
+    'issues.csv': (Issue, ISSUE_EXPORT_COLUMNS),
+    'releases.csv': (Release, RELEASE_EXPORT_COLUMNS),
+    'comments.csv': (Comment, COMMENT_EXPORT_COLUMNS),
+}
+
+
+def format_value(value: object) -> ExportValue:
+    """
+    Format value of database row the same way as API does.
+
+    Datetimes are converted to current timezone and UTC offset is rendered as 'Z' like by
+    DateTimeField of DRF, which is not imported here to keep workers free of it.
+    """
+    if isinstance(value, datetime.timedelta):
+        return duration_string(value)
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        formatted = value.isoformat()
+        return formatted[:-6] + 'Z' if formatted.endswith('+00:00') else formatted
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if value is None or isinstance(value, int):
+        return value
+
+    return str(value)
+
+
+def iter_rows(
+    queryset: QuerySet,  # type: ignore[type-arg]
+    columns: Sequence[str],
+    chunk_size: int,
+) -> Iterator[tuple[ExportValue, ...]]:
+    """Iterate over formatted rows fetching them from database by chunks."""
+    rows = queryset.order_by('id').values_list(*columns).iterator(chunk_size=chunk_size)
+    for row in rows:
+        yield tuple(format_value(value) for value in row)
+
+
+def iter_issue_rows(
+    queryset: QuerySet[Issue],
+    chunk_size: int,
+) -> Iterator[tuple[ExportValue, ...]]:
+    """Iterate over rows of issues joined with project, release and users."""
+    return iter_rows(queryset, list(ISSUE_EXPORT_COLUMNS.values()), chunk_size)
+
+
+def stream_csv(
+    header: Sequence[str],
+    rows: Iterable[Sequence[ExportValue]],
+    batch_size: int,
+) -> Iterator[str]:
+    """Stream rows in CSV format yielding batches of lines."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    for number, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if number % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def stream_ndjson(
+    header: Sequence[str],
+    rows: Iterable[Sequence[ExportValue]],
+    batch_size: int,
+) -> Iterator[str]:
+    """Stream rows as JSON objects separated by newlines yielding batches of lines."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(header, row)), ensure_ascii=False))
+        if len(lines) == batch_size:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def count_archive_rows() -> int:
+    """Count rows to be written to export archive."""
+    return sum(model.objects.count() for model, _ in ARCHIVE_FILES.values())
+
+
+def write_archive(path: Path, chunk_size: int, on_progress: Callable[[int], object]) -> None:
+    """
+    Write issues, releases and comments to compressed CSV files of zip archive.
+
+    Rows are fetched from database and written to archive by chunks. Callback 'on_progress'
+    is called with number of written rows after every chunk.
+    """
+    processed = 0
+
+    def count(rows: Iterator[tuple[ExportValue, ...]]) -> Iterator[tuple[ExportValue, ...]]:
+        nonlocal processed
+        for row in rows:
+            processed += 1
+            yield row
+
+    temp_path = path.with_suffix('.tmp')
+    with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for file_name, (model, columns) in ARCHIVE_FILES.items():
+            rows = iter_rows(model.objects.all(), list(columns.values()), chunk_size)
+            with archive.open(file_name, 'w') as archive_file:
+                for chunk in stream_csv(list(columns), count(rows), batch_size=chunk_size):
+                    archive_file.write(chunk.encode())
+                    on_progress(processed)
+
+    temp_path.replace(path)
+
+
+def get_archive_name(job_id: int) -> str:
+    """Get file name of export archive of job."""
+    return f'export-{job_id}.zip'
+
+
+def delete_expired_archives(export_root: Path, retention: datetime.timedelta) -> int:
+    """
+    Delete export jobs finished longer than retention ago with their archives.
+
+    Partially written archives of failed jobs are deleted too. Return number of deleted jobs.
+    """
+    expired = ExportJob.objects.filter(
+        status__in=[ExportJobStatusEnum.DONE, ExportJobStatusEnum.FAILED],
+        updated_at__lt=timezone.now() - retention,
+    )
+    job_ids = list(expired.values_list('id', flat=True))
+    for job_id in job_ids:
+        path = export_root / get_archive_name(job_id)
+        path.unlink(missing_ok=True)
+        path.with_suffix('.tmp').unlink(missing_ok=True)
+
+    ExportJob.objects.filter(id__in=job_ids).delete()
+
+    return len(job_ids)
@@ -0,0 +1,279 @@
+import csv
+import itertools
+import json
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils.dateparse import parse_duration
+
+from server.apps.core.bulk import bulk_insert
+from server.apps.users.models import User
+
+from .enums import IssueStatusEnum
+from .models import Comment, Issue, Project, Release
+from .tasks import send_notification_task
+
+ImportRow = tuple[int, Mapping[str, object]]
+
+ISSUE_IMPORT_FIELDS = (
+    'code',
+    'title',
+    'description',
+    'status',
+    'estimated_time',
+    'logged_time',
+    'project_id',
+    'release_id',
+    'author_id',
+    'assignee_id',
+)
+IMPORT_FORMATS = {
+    '.csv': 'csv',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+}
+
+
+class ImportRowError(ValueError):
+    """Row of imported file is invalid."""
+
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f'Line {line}: {message}')
+
+
+def detect_format(path: Path) -> str | None:
+    """Detect format of imported file by its extension."""
+    return IMPORT_FORMATS.get(path.suffix.lower())
+
+
+def read_rows(path: Path, file_format: str) -> Iterator[ImportRow]:
+    """Stream rows of CSV or NDJSON file together with their line numbers."""
+    with path.open(newline='', encoding='utf-8') as file:
+        if file_format == 'csv':
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for number, line in enumerate(file, start=1):
+            if line.strip():
+                yield number, json.loads(line)
+
+
+def _batched(rows: Iterable[ImportRow], batch_size: int) -> Iterator[list[ImportRow]]:
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+def _get(row: Mapping[str, object], key: str) -> str:
+    value = row.get(key)
+    return '' if value is None else str(value).strip()
+
+
+class IssueImporter:
+    """
+    Import issues and comments by batches with bulk inserts (COPY on PostgreSQL).
+
+    Users, projects and releases are resolved by email, code and version with one query per
+    batch for unknown values only, resolved ids are kept in memory. Codes of issues are
+    allocated in blocks per project in the transaction of batch. Issue codes of source tracker
+    are mapped to allocated ones so that imported comments can reference them.
+    """
+
+    def __init__(self, batch_size: int, notify: bool = True) -> None:
+        self.batch_size = batch_size
+        self.notify = notify
+        self.users: dict[str, int] = {}
+        self.projects: dict[str, int] = {}
+        self.project_codes: dict[int, str] = {}
+        self.releases: dict[tuple[int, str], int] = {}
+        self.issue_codes: dict[str, str] = {}
+
+    def import_issues(
+        self,
+        rows: Iterable[ImportRow],
+        on_progress: Callable[[int], object],
+    ) -> int:
+        """Import issues. Callback 'on_progress' is called with number of imported issues."""
+        imported = 0
+        for batch in _batched(rows, self.batch_size):
+            self._import_issue_batch(batch)
+            imported += len(batch)
+            on_progress(imported)
+
+        return imported
+
+    def import_comments(
+        self,
+        rows: Iterable[ImportRow],
+        on_progress: Callable[[int], object],
+    ) -> int:
+        """Import comments. Callback 'on_progress' is called with number of imported comments."""
+        imported = 0
+        for batch in _batched(rows, self.batch_size):
+            self._import_comment_batch(batch)
+            imported += len(batch)
+            on_progress(imported)
+
+        return imported
+
+    def _import_issue_batch(self, batch: list[ImportRow]) -> None:
+        self._load_users(
+            email for _, row in batch for email in (_get(row, 'author'), _get(row, 'assignee'))
+        )
+        self._load_projects(_get(row, 'project') for _, row in batch)
+        self._load_releases(
+            (self.projects.get(_get(row, 'project')), _get(row, 'release')) for _, row in batch
+        )
+
+        issues = [self._build_issue(line, row) for line, row in batch]
+        with transaction.atomic():
+            self._allocate_codes(issues)
+            bulk_insert(
+                Issue,
+                ISSUE_IMPORT_FIELDS,
+                ([getattr(issue, field) for field in ISSUE_IMPORT_FIELDS] for issue in issues),
+            )
+
+        for (_, row), issue in zip(batch, issues):
+            if source_code := _get(row, 'code'):
+                self.issue_codes[source_code] = issue.code
+
+        if self.notify:
+            created: dict[str, list[str]] = {}
+            for (_, row), issue in zip(batch, issues):
+                if issue.author_id != issue.assignee_id:
+                    created.setdefault(_get(row, 'assignee'), []).append(
+                        f'{issue.code} {issue.title}',
+                    )
+            for email, lines in created.items():
+                send_notification_task.delay(
+                    emails=[email],
+                    subject='New issues',
+                    message='Issues created:\n' + '\n'.join(lines),
+                )
+
+    def _import_comment_batch(self, batch: list[ImportRow]) -> None:
+        self._load_users(_get(row, 'author') for _, row in batch)
+        codes = {self.issue_codes.get(_get(row, 'issue'), _get(row, 'issue')) for _, row in batch}
+        issues = {
+            code: (issue_id, {assignee_email, author_email})
+            for code, issue_id, assignee_email, author_email in Issue.objects.filter(
+                code__in=codes,
+            ).values_list('code', 'id', 'assignee__email', 'author__email')
+        }
+
+        comments: list[tuple[int, int, str]] = []
+        commented: dict[str, set[str]] = {}
+        for line, row in batch:
+            code = self.issue_codes.get(_get(row, 'issue'), _get(row, 'issue'))
+            if code not in issues:
+                raise ImportRowError(line, f'issue "{code}" does not exist')
+            issue_id, emails = issues[code]
+            author = _get(row, 'author')
+            comments.append((issue_id, self._get_user_id(line, author), _get(row, 'text')))
+            for email in emails - {author}:
+                commented.setdefault(email, set()).add(code)
+
+        with transaction.atomic():
+            bulk_insert(Comment, ('issue_id', 'author_id', 'text'), comments)
+
+        if self.notify:
+            for email, issue_codes in commented.items():
+                send_notification_task.delay(
+                    emails=[email],
+                    subject='New comments',
+                    message='Issues were commented:\n' + '\n'.join(sorted(issue_codes)),
+                )
+
+    def _build_issue(self, line: int, row: Mapping[str, object]) -> Issue:
+        title = _get(row, 'title')
+        if not title:
+            raise ImportRowError(line, 'title is required')
+
+        status = _get(row, 'status') or IssueStatusEnum.OPEN
+        if status not in IssueStatusEnum.values:
+            raise ImportRowError(line, f'unknown status "{status}"')
+
+        estimated_time = parse_duration(_get(row, 'estimated_time'))
+        if estimated_time is None:
+            raise ImportRowError(line, 'estimated_time is required duration')
+        logged_time = parse_duration(_get(row, 'logged_time') or '0')
+        if logged_time is None:
+            raise ImportRowError(line, 'logged_time is invalid duration')
+
+        project_code = _get(row, 'project')
+        if project_code not in self.projects:
+            raise ImportRowError(line, f'project "{project_code}" does not exist')
+        project_id = self.projects[project_code]
+
+        release_id = None
+        if version := _get(row, 'release'):
+            if (project_id, version) not in self.releases:
+                raise ImportRowError(line, f'release "{version}" does not exist')
+            release_id = self.releases[project_id, version]
+
+        return Issue(
+            title=title,
+            description=_get(row, 'description'),
+            status=status,
+            estimated_time=estimated_time,
+            logged_time=logged_time,
+            project_id=project_id,
+            release_id=release_id,
+            author_id=self._get_user_id(line, _get(row, 'author')),
+            assignee_id=self._get_user_id(line, _get(row, 'assignee')),
+        )
+
+    def _get_user_id(self, line: int, email: str) -> int:
+        if email not in self.users:
+            raise ImportRowError(line, f'user "{email}" does not exist')
+
+        return self.users[email]
+
+    def _allocate_codes(self, issues: list[Issue]) -> None:
+        project_ids = {issue.project_id for issue in issues}
+        # lock projects so that concurrent imports allocate blocks of codes one after another
+        list(Project.objects.select_for_update().filter(id__in=project_ids).values_list('id'))
+        counters = dict(
+            Issue.objects.filter(project_id__in=project_ids)
+            .values_list('project_id')
+            .annotate(Count('id'))
+            .order_by(),
+        )
+        for issue in issues:
+            counters[issue.project_id] = counters.get(issue.project_id, 0) + 1
+            issue.code = f'{self.project_codes[issue.project_id]}-{counters[issue.project_id]}'
+
+    def _load_users(self, emails: Iterable[str]) -> None:
+        missing = set(emails) - self.users.keys()
+        if missing:
+            self.users.update(
+                User.objects.filter(email__in=missing).values_list('email', 'id'),
+            )
+
+    def _load_projects(self, codes: Iterable[str]) -> None:
+        missing = set(codes) - self.projects.keys()
+        if missing:
+            for code, project_id in Project.objects.filter(code__in=missing).values_list(
+                'code',
+                'id',
+            ):
+                self.projects[code] = project_id
+                self.project_codes[project_id] = code
+
+    def _load_releases(self, keys: Iterable[tuple[int | None, str]]) -> None:
+        missing = {
+            (project_id, version) for project_id, version in keys
+            if project_id is not None and version
+        } - self.releases.keys()
+        if missing:
+            releases = Release.objects.filter(
+                project_id__in={project_id for project_id, _ in missing},
+                version__in={version for _, version in missing},
+            ).values_list('project_id', 'version', 'id')
+            for project_id, version, release_id in releases:
+                self.releases[project_id, version] = release_id
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from server.apps.issues import partitions
+
+
+class Command(BaseCommand):
+    """The command creating monthly partitions of comments ahead of time."""
+
+    help = (
+        'Create partitions of comments for the current month and months ahead, to be run '
+        'periodically (e.g. daily by cron) when COMMENTS_PARTITIONING_ENABLED is set.'
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=settings.COMMENTS_PARTITIONS_AHEAD,
+            help='Number of months after the current one to create partitions for',
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        """Command execution."""
+        connection = connections[options['database']]
+        if not partitions.is_partitioned(connection):
+            raise CommandError(
+                'Comments table is not partitioned, it is partitioned by migrations on '
+                'PostgreSQL with COMMENTS_PARTITIONING_ENABLED.',
+            )
+
+        created = partitions.create_partitions(connection, options['months_ahead'] + 1)
+        for name in created:
+            self.stdout.write(f'Created partition {name}')
+        self.stdout.write(f'Partitions created: {len(created)}')
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from server.apps.issues.imports import ImportRowError, IssueImporter, detect_format, read_rows
+
+
+class Command(BaseCommand):
+    """The command for bulk import of issues and comments from CSV or NDJSON files."""
+
+    help = (
+        'Import issues and optionally their comments from CSV or NDJSON files. '
+        'Columns are the same as in export: title, description, status, estimated_time, '
+        'logged_time, project (code), release (version), author and assignee (emails) and '
+        'optional code of issue in source tracker. Comments have columns issue (code of '
+        'imported or existing issue), author (email) and text.'
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument('file', type=Path, help='File with issues')
+        parser.add_argument('--comments', type=Path, help='File with comments')
+        parser.add_argument('--format', choices=['csv', 'ndjson'], help='Format of files')
+        parser.add_argument('--batch-size', type=int, default=1_000)
+        parser.add_argument(
+            '--no-notifications',
+            action='store_false',
+            dest='notify',
+            help='Do not notify assignees and authors of imported issues',
+        )
+
+    def handle(self, *args, **options):
+        """Command execution."""
+        importer = IssueImporter(batch_size=options['batch_size'], notify=options['notify'])
+
+        try:
+            issues = importer.import_issues(
+                read_rows(options['file'], self._get_format(options['file'], options['format'])),
+                on_progress=lambda count: self.stdout.write(f'Issues: {count}'),
+            )
+            comments = 0
+            if options['comments']:
+                comments = importer.import_comments(
+                    read_rows(
+                        options['comments'],
+                        self._get_format(options['comments'], options['format']),
+                    ),
+                    on_progress=lambda count: self.stdout.write(f'Comments: {count}'),
+                )
+        except (ImportRowError, json.JSONDecodeError, OSError) as exc:
+            raise CommandError(f'Import failed, previous batches were saved. {exc}')
+
+        self.stdout.write(f'Imported {issues} issues and {comments} comments.')
+
+    def _get_format(self, path: Path, file_format: str | None) -> str:
+        file_format = file_format or detect_format(path)
+        if file_format is None:
+            raise CommandError(f'Unknown format of {path}, use option --format.')
+
+        return file_format
@@ -0,0 +1,118 @@
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Iterable
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Code importing everything a process loads before it can handle the first request or task,
+# targets are values of PROCESS_ROLE.
+TARGETS = {
+    'web': (
+        'from server.wsgi import application; '
+        'import server.urls'
+    ),
+    'worker': (
+        'import django; django.setup(); '
+        'from server.celery import app; '
+        'app.loader.import_default_modules()'
+    ),
+}
+
+
+@dataclass
+class ImportRecord:
+    """Import of a module reported by python -X importtime."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(lines: Iterable[str]) -> list[ImportRecord]:
+    """Parse lines of -X importtime report, other lines are ignored."""
+    records = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header
+
+        records.append(ImportRecord(
+            module=fields[2].strip(),
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+        ))
+
+    return records
+
+
+def summarize_packages(records: Iterable[ImportRecord]) -> dict[str, int]:
+    """Sum self import time of modules by top-level package, the slowest first."""
+    packages: dict[str, int] = {}
+    for record in records:
+        package = record.module.split('.')[0]
+        packages[package] = packages.get(package, 0) + record.self_us
+
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
+
+
+class Command(BaseCommand):
+    """The command for profiling import time of web and celery worker processes."""
+
+    help = 'Report import time of web or worker process startup measured with -X importtime'
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument('--target', choices=list(TARGETS), default='web')
+        parser.add_argument('--limit', type=int, default=20, help='Number of reported modules')
+        parser.add_argument('--json', action='store_true', help='Print report as JSON')
+
+    def handle(self, *args, **options):
+        """Command execution."""
+        target = options['target']
+        env = {**os.environ, 'PROCESS_ROLE': target}
+
+        started = time.perf_counter()
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, '-X', 'importtime', '-c', TARGETS[target]],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        if result.returncode != 0:
+            raise CommandError(f'Startup of {target} failed:\n{result.stderr[-2000:]}')
+
+        records = parse_importtime(result.stderr.splitlines())
+        slowest = sorted(records, key=lambda record: record.cumulative_us, reverse=True)
+        report = {
+            'target': target,
+            'startup_ms': elapsed_ms,
+            'modules': len(records),
+            'import_ms': round(sum(record.self_us for record in records) / 1000, 1),
+            'packages_ms': {
+                package: round(value / 1000, 1)
+                for package, value in list(summarize_packages(records).items())[:options['limit']]
+            },
+            'slowest': [asdict(record) for record in slowest[:options['limit']]],
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f'{target}: startup {report["startup_ms"]}ms, {report["modules"]} modules '
+            f'imported in {report["import_ms"]}ms',
+        )
+        self.stdout.write('Self import time by package, ms:')
+        for package, value in report['packages_ms'].items():
+            self.stdout.write(f'  {package:<30} {value:>10}')
+        self.stdout.write('Slowest imports (cumulative), ms:')
+        for record in slowest[:options['limit']]:
+            self.stdout.write(f'  {record.module:<60} {record.cumulative_us / 1000:>10.1f}')
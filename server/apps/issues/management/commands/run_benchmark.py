@@ -0,0 +1,178 @@
+import json
+import statistics
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import URLPattern, URLResolver, reverse
+
+from server.apps.api import urls as api_urls
+from server.apps.auth.services import AuthService
+from server.apps.issues.models import Comment
+from server.apps.users.services import UserService
+
+from .seed_benchmark import BENCHMARK_PASSWORD, benchmark_email
+
+
+def iter_api_endpoints(
+    patterns: Sequence[URLPattern | URLResolver] = api_urls.urlpatterns,
+    namespace: str = '',
+) -> Iterator[tuple[str, URLPattern]]:
+    """Yield namespaced names and patterns of all API endpoints."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            nested_namespace = ':'.join(filter(None, [namespace, pattern.namespace]))
+            yield from iter_api_endpoints(pattern.url_patterns, nested_namespace)
+        elif pattern.name:
+            yield ':'.join(filter(None, [namespace, pattern.name])), pattern
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict[str, float]:
+    """Calculate latency percentiles in milliseconds and requests per second."""
+    quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+
+    return {
+        'requests': len(latencies),
+        'p50': round(quantiles[49] * 1000, 3),
+        'p95': round(quantiles[94] * 1000, 3),
+        'p99': round(quantiles[98] * 1000, 3),
+        'rps': round(len(latencies) / elapsed, 3),
+    }
+
+
+def compare_with_baseline(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Get descriptions of endpoints whose p95 latency regressed over tolerance."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        allowed = baseline[name]['p95'] * (1 + tolerance)
+        if result['p95'] > allowed:
+            regressions.append(f'{name}: p95 {result["p95"]}ms > {allowed:.3f}ms')
+
+    return regressions
+
+
+class Command(BaseCommand):
+    """The command for measuring latency and throughput of API endpoints."""
+
+    help = 'Benchmark read endpoints of API on data created by seed_benchmark command'
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint')
+        parser.add_argument('--concurrency', type=int, default=1)
+        parser.add_argument('--base-url', help='Benchmark running server instead of test client')
+        parser.add_argument('--save-baseline', type=Path)
+        parser.add_argument('--compare', type=Path, help='Baseline to compare results with')
+        parser.add_argument('--tolerance', type=float, default=0.2)
+
+    def handle(self, *args, **options):
+        """Command execution."""
+        if options['requests'] < 2:
+            raise CommandError('At least two requests per endpoint are required.')
+
+        try:
+            token = AuthService.login(email=benchmark_email(0), password=BENCHMARK_PASSWORD)
+        except UserService.UserNotFoundError:
+            raise CommandError('No benchmark data. Run seed_benchmark command first.')
+
+        self.headers = {'Authorization': f'Bearer {token["access_token"]}'}
+        self.base_url = options['base_url']
+        route_kwargs = self._get_route_kwargs()
+
+        results = {}
+        for name, pattern in iter_api_endpoints():
+            view_class = getattr(pattern.callback, 'view_class', None)
+            if view_class is None or not hasattr(view_class, 'get'):
+                continue
+
+            if not set(pattern.pattern.converters) <= set(route_kwargs):
+                self.stdout.write(f'{name}: skipped, no benchmark data for URL parameters')
+                continue
+
+            kwargs = {key: route_kwargs[key] for key in pattern.pattern.converters}
+            url = reverse(name, kwargs=kwargs)
+            results[name] = self._benchmark(url, options['requests'], options['concurrency'])
+            self.stdout.write(f'{name}: {results[name]}')
+
+        if options['save_baseline']:
+            options['save_baseline'].write_text(json.dumps(results, indent=2))
+
+        if options['compare']:
+            baseline = json.loads(options['compare'].read_text())
+            regressions = compare_with_baseline(results, baseline, options['tolerance'])
+            if regressions:
+                raise CommandError('Regressions found:\n' + '\n'.join(regressions))
+
+    def _get_route_kwargs(self) -> dict[str, int]:
+        comment = Comment.objects.filter(
+            issue__project__code__startswith='BENCH',
+            issue__release__isnull=False,
+        ).select_related('issue__release').first()
+        if comment is None or comment.issue.release is None:
+            raise CommandError('Benchmark data has no comments on issues with release.')
+
+        release = comment.issue.release
+
+        return {
+            'user_id': comment.issue.assignee_id,
+            'project_id': release.project_id,
+            'release_id': release.id,
+            'issue_id': comment.issue_id,
+            'comment_id': comment.id,
+        }
+
+    def _benchmark(self, url: str, requests: int, concurrency: int) -> dict[str, float]:
+        latencies: list[float] = []
+        lock = threading.Lock()
+        per_worker = [requests // concurrency + (i < requests % concurrency)
+                      for i in range(concurrency)]
+
+        def worker(count: int) -> None:
+            client = Client(headers=self.headers)
+            local_latencies = []
+            for _ in range(count):
+                started = time.perf_counter()
+                status = self._request(client, url)
+                local_latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    raise CommandError(f'{url} responded with status {status}')
+
+            with lock:
+                latencies.extend(local_latencies)
+
+        started = time.perf_counter()
+        if concurrency == 1:
+            worker(requests)
+        else:
+            threads = [threading.Thread(target=worker, args=(count,)) for count in per_worker]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        elapsed = time.perf_counter() - started
+
+        if len(latencies) != requests:
+            raise CommandError(f'Benchmark of {url} failed.')
+
+        return summarize(latencies, elapsed)
+
+    def _request(self, client: Client, url: str) -> int:
+        if self.base_url is None:
+            test_response = client.get(url)
+            test_response.getvalue()  # consume streamed content
+            return test_response.status_code
+
+        request = urllib.request.Request(self.base_url.rstrip('/') + url, headers=self.headers)
+        with urllib.request.urlopen(request) as http_response:  # noqa: S310
+            http_response.read()
+            return http_response.status
@@ -0,0 +1,165 @@
+import random
+from typing import Iterator
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from server.apps.core.bulk import bulk_insert
+from server.apps.core.passwords import hash_password
+from server.apps.issues.models import Comment, Issue, Project, Release
+from server.apps.users.models import User
+
+# Factories need factory-boy of requirements.dev.txt, the command is for development only.
+try:
+    from server.apps.issues.tests.factories import IssueFactory, ProjectFactory, ReleaseFactory
+    from server.apps.users.tests.factories import UserFactory
+except ImportError:
+    HAS_FACTORIES = False
+else:
+    HAS_FACTORIES = True
+
+BENCHMARK_EMAIL_DOMAIN = 'benchmark.local'
+BENCHMARK_PASSWORD = 'benchmark'  # noqa: S105
+
+
+def benchmark_email(number: int) -> str:
+    """Email of generated benchmark user."""
+    return f'user-{number}@{BENCHMARK_EMAIL_DOMAIN}'
+
+
+def _batches(total: int, batch_size: int) -> Iterator[range]:
+    for start in range(0, total, batch_size):
+        yield range(start, min(start + batch_size, total))
+
+
+class Command(BaseCommand):
+    """The command for generation of synthetic data for benchmarks."""
+
+    help = (
+        'Fill database with synthetic users, projects, releases, issues and comments '
+        '(development only, needs factory-boy)'
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--projects', type=int, default=10)
+        parser.add_argument('--releases', type=int, default=5, help='Releases per project')
+        parser.add_argument('--issues', type=int, default=10_000)
+        parser.add_argument('--comments', type=int, default=50_000)
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--seed', type=int, default=0, help='Seed of random generator')
+
+    def handle(self, *args, **options):
+        """Command execution."""
+        if not HAS_FACTORIES:
+            raise CommandError('factory-boy is not installed, install requirements.dev.txt.')
+        if User.objects.filter(email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}').exists():
+            raise CommandError('Benchmark data already exists.')
+        if min(options['users'], options['projects']) < 1:
+            raise CommandError('At least one user and one project are required.')
+
+        self.random = random.Random(options['seed'])  # noqa: S311
+        self.batch_size = options['batch_size']
+
+        with transaction.atomic():
+            users = self._create_users(options['users'])
+            projects = self._create_projects(options['projects'], users)
+            releases = self._create_releases(options['releases'], projects)
+        issue_ids = self._create_issues(options['issues'], users, projects, releases)
+        self._create_comments(options['comments'], users, issue_ids)
+
+        self.stdout.write('Benchmark data was successfully created.')
+
+    def _create_users(self, total: int) -> list[User]:
+        # users share password, so its slow hash is computed once
+        hashed_password = hash_password(BENCHMARK_PASSWORD)
+        User.objects.bulk_create(
+            [
+                UserFactory.build(email=benchmark_email(number), password=hashed_password)
+                for number in range(total)
+            ],
+            batch_size=self.batch_size,
+        )
+        self.stdout.write(f'Users: {total}')
+
+        return list(User.objects.filter(
+            email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}',
+        ).only('id'))
+
+    def _create_projects(self, total: int, users: list[User]) -> list[Project]:
+        Project.objects.bulk_create(
+            [
+                ProjectFactory.build(
+                    title=f'Benchmark project {number}',
+                    code=f'BENCH{number}',
+                    owner=self.random.choice(users),
+                )
+                for number in range(total)
+            ],
+            batch_size=self.batch_size,
+        )
+        self.stdout.write(f'Projects: {total}')
+
+        return list(Project.objects.filter(code__startswith='BENCH').only('id', 'code'))
+
+    def _create_releases(self, per_project: int, projects: list[Project]) -> list[Release]:
+        Release.objects.bulk_create(
+            [
+                ReleaseFactory.build(version=f'{number}.0.0', project=project)
+                for project in projects
+                for number in range(per_project)
+            ],
+            batch_size=self.batch_size,
+        )
+        self.stdout.write(f'Releases: {per_project * len(projects)}')
+
+        return list(Release.objects.filter(project__in=projects).only('id', 'project_id'))
+
+    def _create_issues(
+        self,
+        total: int,
+        users: list[User],
+        projects: list[Project],
+        releases: list[Release],
+    ) -> list[int]:
+        releases_by_project: dict[int, list[Release | None]] = {}
+        for release in releases:
+            releases_by_project.setdefault(release.project_id, [None]).append(release)
+
+        counters = {project.id: 0 for project in projects}
+        for batch in _batches(total, self.batch_size):
+            issues = []
+            for _ in batch:
+                project = self.random.choice(projects)
+                counters[project.id] += 1
+                issues.append(IssueFactory.build(
+                    code=f'{project.code}-{counters[project.id]}',
+                    project=project,
+                    release=self.random.choice(releases_by_project.get(project.id, [None])),
+                    author=self.random.choice(users),
+                    assignee=self.random.choice(users),
+                ))
+            Issue.objects.bulk_create(issues)
+            self.stdout.write(f'Issues: {batch.stop}/{total}')
+
+        return list(Issue.objects.filter(project__in=projects).values_list('id', flat=True))
+
+    def _create_comments(self, total: int, users: list[User], issue_ids: list[int]) -> None:
+        if not issue_ids:
+            return
+
+        for batch in _batches(total, self.batch_size):
+            bulk_insert(
+                Comment,
+                ('text', 'author_id', 'issue_id'),
+                (
+                    (
+                        f'Benchmark comment {number}',
+                        self.random.choice(users).id,
+                        self.random.choice(issue_ids),
+                    )
+                    for number in batch
+                ),
+                batch_size=self.batch_size,
+            )
+            self.stdout.write(f'Comments: {batch.stop}/{total}')
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.3 on 2026-10-19 10:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_is_admin'),
+        ('issues', '0003_project_owner'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('total_rows', models.PositiveBigIntegerField(default=0)),
+                ('processed_rows', models.PositiveBigIntegerField(default=0)),
+                ('file_name', models.CharField(blank=True, max_length=100)),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.user')),
+            ],
+            options={
+                'verbose_name': 'export job',
+                'verbose_name_plural': 'export jobs',
+                'db_table': 'export_jobs',
+            },
+        ),
+    ]
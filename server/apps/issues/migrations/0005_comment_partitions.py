@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.db import migrations
+
+from server.apps.issues import partitions
+
+
+def partition_comments(apps, schema_editor):
+    connection = schema_editor.connection
+    if not settings.COMMENTS_PARTITIONING_ENABLED or connection.vendor != 'postgresql':
+        return
+
+    if not partitions.is_partitioned(connection):
+        partitions.partition_table(connection, months_ahead=settings.COMMENTS_PARTITIONS_AHEAD)
+
+
+def unpartition_comments(apps, schema_editor):
+    if partitions.is_partitioned(schema_editor.connection):
+        partitions.unpartition_table(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0004_export_job'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_comments, unpartition_comments),
+    ]
@@ -5,7 +5,7 @@ from django.db import models
 from server.apps.core.models import BaseModel
 
 from ..users.models import User
-from .enums import IssueStatusEnum, ReleaseStatusEnum
+from .enums import ExportJobStatusEnum, IssueStatusEnum, ReleaseStatusEnum
 
 
 class Project(BaseModel):
@@ -124,3 +124,36 @@ class Comment(BaseModel):
     def __str__(self) -> str:
         """Text representation."""
         return f'Comment to issue {self.issue.title}'
+
+
+class ExportJob(BaseModel):
+    """Model of background export of issues, comments and releases to file."""
+
+    status = models.CharField(
+        max_length=20,
+        choices=ExportJobStatusEnum.choices,
+        default=ExportJobStatusEnum.PENDING,
+    )
+    total_rows = models.PositiveBigIntegerField(default=0)
+    processed_rows = models.PositiveBigIntegerField(default=0)
+    file_name = models.CharField(max_length=100, blank=True)
+    author = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'export_jobs'
+        verbose_name = 'export job'
+        verbose_name_plural = 'export jobs'
+
+    def __str__(self) -> str:
+        """Text representation."""
+        return f'Export job {self.id}'
+
+    @property
+    def progress(self) -> int:
+        """Calculate percentage of exported rows."""
+        if self.status == ExportJobStatusEnum.DONE:
+            return 100
+        if not self.total_rows:
+            return 0
+
+        return self.processed_rows * 100 // self.total_rows
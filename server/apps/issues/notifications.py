@@ -1,12 +1,43 @@
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import get_connection, send_mail
+from django.core.mail.backends.base import BaseEmailBackend
+
+_connection: BaseEmailBackend | None = None
+
+
+def get_shared_connection() -> BaseEmailBackend:
+    """Get email backend connection kept open and reused by the process."""
+    global _connection
+
+    if _connection is None:
+        _connection = get_connection(fail_silently=False)
+        _connection.open()
+
+    return _connection
+
+
+def close_shared_connection() -> None:
+    """Close reused email backend connection."""
+    global _connection
+
+    if _connection is not None:
+        try:
+            _connection.close()
+        except OSError:
+            pass  # connection is already broken
+        _connection = None
 
 
 def send_notification(emails: list[str], subject: str, message: str) -> None:
     """Send notification to emails."""
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email=settings.EMAIL_HOST_USER,
-        recipient_list=emails,
-    )
+    try:
+        send_mail(
+            subject=subject,
+            message=message,
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=emails,
+            connection=get_shared_connection(),
+        )
+    except Exception:
+        close_shared_connection()  # next notification will open new connection
+        raise
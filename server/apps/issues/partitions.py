@@ -0,0 +1,127 @@
+import datetime
+from typing import Iterator
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils import timezone
+
+# Comments are partitioned by month of 'created_at' on PostgreSQL. Primary key of partitioned
+# table has to include partition key, id keeps its own sequence. Rows out of created
+# partitions fall to default partition, so inserts never fail.
+TABLE = 'comments'
+SEQUENCE = 'comments_partitioned_id_seq'
+DEFAULT_PARTITION = 'comments_default'
+
+CREATE_PARTITIONED_SQL = f"""
+ALTER TABLE {TABLE} RENAME TO {TABLE}_old;
+CREATE SEQUENCE IF NOT EXISTS {SEQUENCE};
+CREATE TABLE {TABLE} (LIKE {TABLE}_old) PARTITION BY RANGE (created_at);
+ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id;
+ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}');
+ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_part_pkey PRIMARY KEY (id, created_at);
+CREATE INDEX {TABLE}_part_issue_id_idx ON {TABLE} (issue_id);
+CREATE INDEX {TABLE}_part_author_id_idx ON {TABLE} (author_id);
+ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_part_issue_id_fk FOREIGN KEY (issue_id)
+    REFERENCES issues (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_part_author_id_fk FOREIGN KEY (author_id)
+    REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT;
+"""
+
+COPY_ROWS_SQL = f"""
+INSERT INTO {TABLE} SELECT * FROM {TABLE}_old;
+SELECT setval('{SEQUENCE}', COALESCE(MAX(id), 0) + 1, false) FROM {TABLE};
+DROP TABLE {TABLE}_old CASCADE;
+"""  # noqa: S608
+
+CREATE_UNPARTITIONED_SQL = f"""
+ALTER TABLE {TABLE} RENAME TO {TABLE}_old;
+ALTER SEQUENCE {SEQUENCE} OWNED BY NONE;
+CREATE TABLE {TABLE} (LIKE {TABLE}_old INCLUDING DEFAULTS);
+ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id;
+ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id);
+CREATE INDEX {TABLE}_issue_id_idx ON {TABLE} (issue_id);
+CREATE INDEX {TABLE}_author_id_idx ON {TABLE} (author_id);
+ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_issue_id_fk FOREIGN KEY (issue_id)
+    REFERENCES issues (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_author_id_fk FOREIGN KEY (author_id)
+    REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+"""
+
+
+def iter_months(start: datetime.date, count: int) -> Iterator[tuple[datetime.date, datetime.date]]:
+    """Get first days of count months from month of start and of months next to them."""
+    month = start.replace(day=1)
+    for _ in range(count):
+        following = (month + datetime.timedelta(days=32)).replace(day=1)
+        yield month, following
+        month = following
+
+
+def get_partition_name(month: datetime.date) -> str:
+    """Get name of partition of comments created in month."""
+    return f'{TABLE}_y{month:%Y}m{month:%m}'
+
+
+def is_partitioned(connection: BaseDatabaseWrapper) -> bool:
+    """Check comments table is partitioned."""
+    if connection.vendor != 'postgresql':
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT relkind FROM pg_class WHERE oid = %s::regclass', [TABLE])
+        row = cursor.fetchone()
+
+    return row is not None and row[0] == 'p'
+
+
+def create_partitions(
+    connection: BaseDatabaseWrapper,
+    months: int,
+    start: datetime.date | None = None,
+) -> list[str]:
+    """
+    Create monthly partitions of comments from month of start (current by default).
+
+    Return names of created partitions, existing ones are skipped. Creation fails when default
+    partition has rows of the month, partitions should be created ahead of time.
+    """
+    start = start or timezone.now().date()
+    created = []
+    with connection.cursor() as cursor:
+        for month, following in iter_months(start, months):
+            name = get_partition_name(month)
+            cursor.execute('SELECT to_regclass(%s)', [name])
+            if cursor.fetchone()[0] is not None:
+                continue
+
+            cursor.execute(
+                f'CREATE TABLE {name} PARTITION OF {TABLE} '  # noqa: S608
+                'FOR VALUES FROM (%s::timestamptz) TO (%s::timestamptz)',
+                [f'{month.isoformat()} 00:00+00', f'{following.isoformat()} 00:00+00'],
+            )
+            created.append(name)
+
+    return created
+
+
+def partition_table(connection: BaseDatabaseWrapper, months_ahead: int) -> None:
+    """Convert comments table to partitioned one, copying rows to monthly partitions."""
+    with connection.cursor() as cursor:
+        cursor.execute(CREATE_PARTITIONED_SQL)
+        cursor.execute(f'SELECT MIN(created_at) FROM {TABLE}_old')  # noqa: S608
+        oldest = cursor.fetchone()[0]
+
+    today = timezone.now().date()
+    start = oldest.date() if oldest is not None else today
+    months = (today.year - start.year) * 12 + today.month - start.month + 1 + months_ahead
+    create_partitions(connection, months, start=start)
+
+    with connection.cursor() as cursor:
+        cursor.execute(COPY_ROWS_SQL)
+
+
+def unpartition_table(connection: BaseDatabaseWrapper) -> None:
+    """Convert partitioned comments table back to a plain one."""
+    with connection.cursor() as cursor:
+        cursor.execute(CREATE_UNPARTITIONED_SQL)
+        cursor.execute(COPY_ROWS_SQL)
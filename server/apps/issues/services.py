@@ -1,16 +1,25 @@
 import copy
 import datetime
+from pathlib import Path
+from typing import Iterator, Sequence
 
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Subquery
 from django.db.models.query import QuerySet
 from django.db.utils import IntegrityError
+from django.utils import timezone
 
+from server.apps.core import replicas
 from server.apps.core.exceptions import BaseServiceError
+from server.apps.core.utils import load_only
 from server.apps.users.models import User
 from server.apps.users.services import UserService
 
-from .models import Comment, Issue, Project, Release
-from .tasks import send_notification_task
+from .enums import ExportJobStatusEnum
+from .exports import ExportValue, iter_issue_rows
+from .models import Comment, ExportJob, Issue, Project, Release
+from .tasks import export_data_task, send_notification_task
 
 
 class ProjectService:
@@ -23,10 +32,10 @@ class ProjectService:
         """Project with some of provided fields already exists."""
 
     @classmethod
-    def get_or_error(cls, project_id: int):
-        """Get project or raise exception."""
+    def get_or_error(cls, project_id: int, only: Sequence[str] | None = None):
+        """Get project or raise exception. Only given fields are loaded if provided."""
         try:
-            project = Project.objects.get(id=project_id)
+            project = load_only(Project.objects.all(), only).get(id=project_id)
         except Project.DoesNotExist:
             raise cls.ProjectNotFoundError()
 
@@ -58,17 +67,23 @@ class ProjectService:
             raise cls.ProjectAlreadyExist() from exc
 
     @classmethod
-    def get_project_info(cls, project_id: int) -> dict[str, str | QuerySet[Issue]]:
-        """Get project."""
-        project = cls.get_or_error(project_id)
-
-        return {
-            'title': project.title,
-            'code': project.code,
-            'description': project.description,
-            'owner_id': project.owner_id,
-            'issues': project.issue_set.select_related('release', 'assignee'),
+    def get_project_info(
+        cls,
+        project_id: int,
+        only: Sequence[str] | None = None,
+    ) -> dict[str, str | QuerySet[Issue]]:
+        """Get project. Only given fields are loaded and returned if provided."""
+        project = cls.get_or_error(project_id, only=only)
+        deferred = project.get_deferred_fields()
+
+        info: dict[str, str | QuerySet[Issue]] = {
+            field: getattr(project, field)
+            for field in ('title', 'code', 'description', 'owner_id')
+            if field not in deferred
         }
+        info['issues'] = project.issue_set.select_related('release', 'assignee')
+
+        return info
 
 
 class ReleaseService:
@@ -81,8 +96,14 @@ class ReleaseService:
         """Release already exists."""
 
     @classmethod
-    def get_or_error(cls, project_id: int, release_id: int, join_project: bool = False) -> Release:
-        """Get release or raise exception."""
+    def get_or_error(
+        cls,
+        project_id: int,
+        release_id: int,
+        join_project: bool = False,
+        only: Sequence[str] | None = None,
+    ) -> Release:
+        """Get release or raise exception. Only given fields are loaded if provided."""
         try:
             if join_project:
                 release = Release.objects.select_related('project').get(
@@ -90,7 +111,10 @@ class ReleaseService:
                     project_id=project_id,
                 )
             else:
-                release = Release.objects.get(id=release_id, project_id=project_id)
+                release = load_only(Release.objects.all(), only).get(
+                    id=release_id,
+                    project_id=project_id,
+                )
         except Release.DoesNotExist:
             raise cls.ReleaseNotFoundError()
 
@@ -116,9 +140,14 @@ class ReleaseService:
             raise cls.ReleaseAlreadyExist() from exc
 
     @classmethod
-    def get_by_id(cls, project_id: int, release_id: int) -> Release:
-        """Get release by id."""
-        return cls.get_or_error(release_id=release_id, project_id=project_id)
+    def get_by_id(
+        cls,
+        project_id: int,
+        release_id: int,
+        only: Sequence[str] | None = None,
+    ) -> Release:
+        """Get release by id. Only given fields are loaded if provided."""
+        return cls.get_or_error(release_id=release_id, project_id=project_id, only=only)
 
     @classmethod
     def update(cls, release: Release, **kwargs) -> None:
@@ -149,10 +178,13 @@ class IssueService:
         return issue
 
     @classmethod
-    def get_by_id(cls, issue_id: int) -> Issue:
-        """Get issue by id."""
+    def get_by_id(cls, issue_id: int, only: Sequence[str] | None = None) -> Issue:
+        """Get issue by id. Only given fields are loaded if provided."""
         try:
-            issue = Issue.objects.select_related('project', 'release').get(id=issue_id)
+            issue = load_only(
+                Issue.objects.select_related('project', 'release'),
+                only,
+            ).get(id=issue_id)
         except Issue.DoesNotExist:
             raise cls.IssueNotFoundError()
 
@@ -184,6 +216,7 @@ class IssueService:
             description=description,
             estimated_time=estimated_time,
         )
+        replicas.pin_to_primary(author.pk)
 
         if author != assignee:
             message = f'Issue {issue.code} {issue.title} created'
@@ -200,6 +233,15 @@ class IssueService:
 
         return issues
 
+    @classmethod
+    def get_export_rows(
+        cls,
+        issues: QuerySet[Issue],
+        chunk_size: int,
+    ) -> Iterator[tuple[ExportValue, ...]]:
+        """Get rows of issues for export fetching them from database by chunks."""
+        return iter_issue_rows(issues, chunk_size=chunk_size)
+
     @classmethod
     def update(cls, issue: Issue, user: User, **kwargs) -> None:
         """Edit existing issue."""
@@ -225,6 +267,7 @@ class IssueService:
             setattr(issue, key, value)
 
         issue.save()
+        replicas.pin_to_primary(user.pk)
 
         notified_emails = [email for email
                            in set(notified_emails + [issue.assignee.email, issue.author.email])
@@ -259,6 +302,7 @@ class CommentService:
             issue=issue,
             text=text,
         )
+        replicas.pin_to_primary(author.pk)
 
         notified_emails = [email for email
                            in {issue.assignee.email, issue.author.email}
@@ -273,28 +317,86 @@ class CommentService:
             )
 
     @classmethod
-    def get_or_error(cls, comment_id: int, issue_id: int) -> Comment:
-        """Get comment by id."""
+    def get_or_error(
+        cls,
+        comment_id: int,
+        issue_id: int,
+        only: Sequence[str] | None = None,
+    ) -> Comment:
+        """Get comment by id. Only given fields are loaded if provided."""
+        # Comments are not older than their issue, so partitions of older comments are pruned.
+        issue_created_at = Issue.objects.filter(id=issue_id).values('created_at')[:1]
         try:
-            comment = Comment.objects.get(id=comment_id, issue_id=issue_id)
+            comment = load_only(Comment.objects.all(), only).get(
+                id=comment_id,
+                issue_id=issue_id,
+                created_at__gte=Subquery(issue_created_at),
+            )
         except Comment.DoesNotExist:
             raise cls.CommentNotFoundError()
 
         return comment
 
     @classmethod
-    def update(cls, comment: Comment, text: str) -> None:
-        """Update existing comment."""
+    def update(cls, comment: Comment, user: User, text: str) -> None:
+        """Update existing comment by user."""
         comment.text = text
-        comment.save()
+        comment.updated_at = timezone.now()
+        # partition key in filter lets PostgreSQL touch the single partition of comment
+        Comment.objects.filter(id=comment.id, created_at=comment.created_at).update(
+            text=comment.text,
+            updated_at=comment.updated_at,
+        )
+        replicas.pin_to_primary(user.pk)
 
     @classmethod
-    def get_list(cls, issue_id: int) -> QuerySet[Comment]:
-        """Get comments list of issue."""
+    def get_list(cls, issue_id: int, only: Sequence[str] | None = None) -> QuerySet[Comment]:
+        """Get comments list of issue. Only given fields are loaded if provided."""
         issue = IssueService.get_or_error(issue_id=issue_id)
-        return Comment.objects.filter(issue=issue)
+        comments = Comment.objects.filter(issue=issue, created_at__gte=issue.created_at)
+
+        return load_only(comments, only)
+
+    @classmethod
+    def delete(cls, comment: Comment, user: User) -> None:
+        """Delete comment by user."""
+        Comment.objects.filter(id=comment.id, created_at=comment.created_at).delete()
+        replicas.pin_to_primary(user.pk)
+
+
+class ExportService:
+    """Service for background export of issues, releases and comments."""
+
+    class ExportJobNotFoundError(BaseServiceError):
+        """Export job does not exist."""
+
+    class ExportNotReadyError(BaseServiceError):
+        """Export job has not been finished successfully."""
 
     @classmethod
-    def delete(cls, comment: Comment) -> None:
-        """Delete comment."""
-        comment.delete()
+    def create(cls, author: User) -> ExportJob:
+        """Create export job and start export."""
+        job = ExportJob.objects.create(author=author)
+        # Author polls the job right after creating it, replicas may not have it yet.
+        replicas.pin_to_primary(author.pk)
+        export_data_task.delay(job_id=job.id)
+
+        return job
+
+    @classmethod
+    def get_or_error(cls, job_id: int) -> ExportJob:
+        """Get export job or raise exception."""
+        try:
+            job = ExportJob.objects.get(id=job_id)
+        except ExportJob.DoesNotExist:
+            raise cls.ExportJobNotFoundError()
+
+        return job
+
+    @classmethod
+    def get_file_path(cls, job: ExportJob) -> Path:
+        """Get path of exported file."""
+        if job.status != ExportJobStatusEnum.DONE:
+            raise cls.ExportNotReadyError()
+
+        return Path(settings.EXPORT_ROOT) / job.file_name
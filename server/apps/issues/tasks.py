@@ -1,9 +1,93 @@
+import datetime
+import logging
+from pathlib import Path
+from smtplib import SMTPRecipientsRefused
+
+from celery import Task
+from celery.signals import worker_process_shutdown
+from django.conf import settings
+from django.utils import timezone
+
 from server.celery import app
 
-from .notifications import send_notification
+from .enums import ExportJobStatusEnum
+from .exports import count_archive_rows, delete_expired_archives, get_archive_name, write_archive
+from .models import ExportJob
+from .notifications import close_shared_connection, send_notification
 
+logger = logging.getLogger(__name__)
 
-@app.task()
+
+class NotificationTask(Task):
+    """Task sending notifications. Finally failed messages are moved to dead letter queue."""
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        """Move message to dead letter queue."""
+        logger.error('Notification %s failed permanently: %r', task_id, exc)
+        delivery_info = self.request.delivery_info or {}
+        if delivery_info.get('routing_key') == settings.NOTIFICATION_DEAD_LETTER_QUEUE:
+            # Message replayed from dead letter queue failed again. It is acked and dropped
+            # with the error logged above, publishing it back would loop while the queue is
+            # consumed for replay.
+            return
+
+        self.apply_async(
+            args=args,
+            kwargs=kwargs,
+            queue=settings.NOTIFICATION_DEAD_LETTER_QUEUE,
+            headers={'failed_task_id': task_id, 'exception': repr(exc)},
+        )
+
+
+@app.task(
+    base=NotificationTask,
+    autoretry_for=(OSError,),
+    dont_autoretry_for=(SMTPRecipientsRefused,),
+    max_retries=settings.NOTIFICATION_MAX_RETRIES,
+    retry_backoff=settings.NOTIFICATION_RETRY_BACKOFF,
+    retry_backoff_max=settings.NOTIFICATION_RETRY_BACKOFF_MAX,
+    retry_jitter=True,
+    rate_limit=settings.NOTIFICATION_RATE_LIMIT,
+)
 def send_notification_task(emails: list[str], subject: str, message: str):
     """Notification task."""
     send_notification(emails=emails, subject=subject, message=message)
+
+
+@worker_process_shutdown.connect
+def close_email_connection(**kwargs):
+    """Close email connection reused by worker process."""
+    close_shared_connection()
+
+
+@app.task()
+def export_data_task(job_id: int):
+    """Export issues, releases and comments to compressed file, deleting expired exports."""
+    export_root = Path(settings.EXPORT_ROOT)
+    retention = datetime.timedelta(seconds=settings.EXPORT_RETENTION)
+    try:
+        delete_expired_archives(export_root, retention)
+    except OSError:
+        logger.exception('Failed to delete expired export archives.')
+
+    job = ExportJob.objects.filter(id=job_id)
+    job.update(
+        status=ExportJobStatusEnum.IN_PROGRESS,
+        total_rows=count_archive_rows(),
+        processed_rows=0,
+        updated_at=timezone.now(),
+    )
+
+    export_root.mkdir(parents=True, exist_ok=True)
+    file_name = get_archive_name(job_id)
+    try:
+        write_archive(
+            export_root / file_name,
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
+            on_progress=lambda processed: job.update(processed_rows=processed),
+        )
+    except Exception:
+        job.update(status=ExportJobStatusEnum.FAILED, updated_at=timezone.now())
+        raise
+
+    job.update(status=ExportJobStatusEnum.DONE, file_name=file_name, updated_at=timezone.now())
@@ -0,0 +1,27 @@
+import pytest
+from django.urls import reverse
+
+from .factories import CommentFactory, IssueFactory, ReleaseFactory
+
+
+@pytest.mark.django_db()
+class TestAdminChangelists:
+    """Testing admin list pages do not query related objects by row."""
+
+    @pytest.mark.parametrize(('url_name', 'factory'), [
+        ('admin:issues_issue_changelist', IssueFactory),
+        ('admin:issues_comment_changelist', CommentFactory),
+        ('admin:issues_release_changelist', ReleaseFactory),
+    ])
+    def test_no_queries_by_row(
+        self, admin_client, django_assert_max_num_queries, url_name, factory,
+    ):
+        """Number of queries does not depend on number of rows."""
+        factory.create_batch(2)
+        with django_assert_max_num_queries(100) as captured:
+            assert admin_client.get(reverse(url_name)).status_code == 200
+        queries = len(captured)
+
+        factory.create_batch(10)
+        with django_assert_max_num_queries(queries):
+            assert admin_client.get(reverse(url_name)).status_code == 200
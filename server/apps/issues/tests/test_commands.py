@@ -0,0 +1,222 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from server.apps.users.models import User
+
+from ..management.commands.profile_imports import (ImportRecord, parse_importtime,
+                                                   summarize_packages)
+from ..management.commands.run_benchmark import (compare_with_baseline, iter_api_endpoints,
+                                                 summarize)
+from ..models import Comment, Issue, Project, Release
+from .factories import IssueFactory, ProjectFactory, ReleaseFactory
+
+
+@pytest.mark.django_db()
+class TestSeedBenchmarkCommand:
+    """Testing command seed_benchmark."""
+
+    def test_success(self):
+        """Success generation of data."""
+        call_command(
+            'seed_benchmark',
+            users=3,
+            projects=2,
+            releases=2,
+            issues=30,
+            comments=50,
+            batch_size=7,
+        )
+
+        assert User.objects.count() == 3
+        assert Project.objects.count() == 2
+        assert Release.objects.count() == 4
+        assert Issue.objects.count() == 30
+        assert Comment.objects.count() == 50
+
+        for project in Project.objects.all():
+            codes = set(project.issue_set.values_list('code', flat=True))
+            assert codes == {f'{project.code}-{i}' for i in range(1, len(codes) + 1)}
+
+    def test_data_already_exists(self):
+        """Repeated generation is forbidden."""
+        call_command('seed_benchmark', users=1, projects=1, issues=0, comments=0)
+
+        with pytest.raises(CommandError):
+            call_command('seed_benchmark', users=1, projects=1, issues=0, comments=0)
+
+    def test_without_factory_boy(self):
+        """Command fails clearly in production image without development dependencies."""
+        module = 'server.apps.issues.management.commands.seed_benchmark'
+        with mock.patch(f'{module}.HAS_FACTORIES', False):
+            with pytest.raises(CommandError, match='factory-boy'):
+                call_command('seed_benchmark', users=1, projects=1, issues=0, comments=0)
+
+        assert not User.objects.exists()
+
+
+@pytest.mark.django_db()
+class TestRunBenchmarkCommand:
+    """Testing command run_benchmark."""
+
+    def test_success(self, tmp_path):
+        """Benchmark of all read endpoints with saving baseline."""
+        call_command('seed_benchmark', users=2, projects=1, issues=5, comments=20)
+        baseline = tmp_path / 'baseline.json'
+
+        call_command('run_benchmark', requests=2, save_baseline=baseline)
+
+        assert baseline.exists()
+
+    def test_no_data(self):
+        """Benchmark without generated data."""
+        with pytest.raises(CommandError):
+            call_command('run_benchmark', requests=2)
+
+
+class TestBenchmarkHelpers:
+    """Testing helpers of run_benchmark command."""
+
+    def test_iter_api_endpoints(self):
+        """All API endpoints are found."""
+        names = {name for name, _ in iter_api_endpoints()}
+
+        assert {'issues:list', 'issues:comments_detail', 'auth:login', 'users:my_issues'} <= names
+
+    def test_summarize(self):
+        """Calculation of percentiles."""
+        result = summarize([i / 1000 for i in range(1, 101)], elapsed=2)
+
+        assert result == {'requests': 100, 'p50': 50.5, 'p95': 95.05, 'p99': 99.01, 'rps': 50}
+
+    def test_compare_with_baseline(self):
+        """Only regressions over tolerance are reported."""
+        baseline = {'a': {'p95': 10.0}, 'b': {'p95': 10.0}}
+        results = {'a': {'p95': 11.5}, 'b': {'p95': 13.0}, 'c': {'p95': 100.0}}
+
+        assert compare_with_baseline(results, baseline, tolerance=0.2) == [
+            'b: p95 13.0ms > 12.000ms',
+        ]
+
+
+@pytest.mark.django_db()
+class TestImportIssuesCommand:
+    """Testing command import_issues."""
+
+    @pytest.fixture()
+    def project(self):
+        """Project fixture."""
+        return ProjectFactory(code='IMP')
+
+    @pytest.fixture()
+    def issues_csv(self, tmp_path, project, user, author):
+        """CSV file with issues."""
+        ReleaseFactory(project=project, version='1.0')
+        path = tmp_path / 'issues.csv'
+        path.write_text(
+            'code,title,description,status,estimated_time,project,release,author,assignee\n'
+            'OLD-7,First,text,closed,1 02:00:00,IMP,1.0,author@mail.com,user@mail.com\n'
+            'OLD-8,Second,,,00:30:00,IMP,,user@mail.com,user@mail.com\n'
+            'OLD-9,Third,,,01:00:00,IMP,,author@mail.com,user@mail.com\n',
+        )
+
+        return path
+
+    def test_success(self, tmp_path, issues_csv, project, user, author, mock_notification_task):
+        """Issues and comments referencing them by source codes are imported."""
+        IssueFactory(project=project, code='IMP-1', author=author, assignee=user)
+        comments = tmp_path / 'comments.ndjson'
+        comments.write_text(
+            json.dumps({'issue': 'OLD-7', 'author': 'user@mail.com', 'text': 'Done'}) + '\n'
+            + json.dumps({'issue': 'IMP-1', 'author': 'author@mail.com', 'text': 'Old'}) + '\n',
+        )
+
+        call_command('import_issues', issues_csv, comments=comments, batch_size=2)
+
+        first = Issue.objects.get(code='IMP-2')
+        assert first.title == 'First'
+        assert first.status == 'closed'
+        assert str(first.estimated_time) == '1 day, 2:00:00'
+        assert first.release is not None
+        assert first.release.version == '1.0'
+        assert list(Issue.objects.filter(code__in=['IMP-3', 'IMP-4']).values_list(
+            'title', flat=True,
+        ).order_by('code')) == ['Second', 'Third']
+        assert list(first.comment_set.values_list('text', flat=True)) == ['Done']
+        assert Comment.objects.filter(issue__code='IMP-1', text='Old').exists()
+        emails = [call.kwargs['emails'] for call in mock_notification_task.call_args_list]
+        assert emails == [
+            ['user@mail.com'], ['user@mail.com'], ['author@mail.com'], ['user@mail.com'],
+        ]
+
+    def test_no_notifications(self, issues_csv, mock_notification_task):
+        """Notifications are suppressed."""
+        call_command('import_issues', issues_csv, notify=False)
+
+        assert Issue.objects.count() == 3
+        mock_notification_task.assert_not_called()
+
+    def test_invalid_row(self, tmp_path, issues_csv, mock_notification_task):
+        """Import is stopped on unknown user, previous batches are saved."""
+        with issues_csv.open('a') as file:
+            file.write('OLD-10,Fourth,,,01:00:00,IMP,,unknown@mail.com,user@mail.com\n')
+
+        with pytest.raises(CommandError, match='Line 5: user "unknown@mail.com" does not exist'):
+            call_command('import_issues', issues_csv, batch_size=2)
+
+        assert Issue.objects.count() == 2
+
+    def test_unknown_format(self, tmp_path):
+        """Format can not be detected by extension."""
+        path = tmp_path / 'issues.txt'
+        path.write_text('')
+
+        with pytest.raises(CommandError, match='Unknown format'):
+            call_command('import_issues', path)
+
+
+class TestProfileImportsCommand:
+    """Testing command profile_imports."""
+
+    def test_worker(self):
+        """Worker process imports neither API views nor DRF."""
+        stdout = io.StringIO()
+        call_command('profile_imports', target='worker', limit=1000, json=True, stdout=stdout)
+
+        report = json.loads(stdout.getvalue())
+        assert report['target'] == 'worker'
+        assert report['modules'] > 0
+        assert 'celery' in report['packages_ms']
+        assert 'rest_framework' not in report['packages_ms']
+        assert not [
+            record for record in report['slowest']
+            if record['module'].startswith(('server.apps.api', 'django.contrib.admin'))
+        ]
+
+    def test_parse_importtime(self):
+        """Header and unrelated lines are skipped."""
+        lines = [
+            'import time: self [us] | cumulative | imported package',
+            'import time:       120 |        120 |   django.utils',
+            'import time:       300 |        420 | django',
+            'Traceback is not a record',
+        ]
+
+        assert parse_importtime(lines) == [
+            ImportRecord(module='django.utils', self_us=120, cumulative_us=120),
+            ImportRecord(module='django', self_us=300, cumulative_us=420),
+        ]
+
+    def test_summarize_packages(self):
+        """Self import time is summed by top-level package."""
+        records = [
+            ImportRecord(module='django.utils', self_us=120, cumulative_us=120),
+            ImportRecord(module='django', self_us=300, cumulative_us=420),
+            ImportRecord(module='celery', self_us=500, cumulative_us=500),
+        ]
+
+        assert summarize_packages(records) == {'celery': 500, 'django': 420}
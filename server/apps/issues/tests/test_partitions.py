@@ -0,0 +1,107 @@
+import datetime
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.utils import timezone
+
+from ..models import Comment, Issue
+from ..partitions import (create_partitions, get_partition_name, is_partitioned, iter_months,
+                          partition_table, unpartition_table)
+from ..services import CommentService
+from .factories import CommentFactory
+
+
+class TestPartitions:
+    """Testing monthly partitions of comments."""
+
+    def test_iter_months(self):
+        """Months are iterated over end of year."""
+        months = list(iter_months(datetime.date(2026, 11, 19), 3))
+
+        assert months == [
+            (datetime.date(2026, 11, 1), datetime.date(2026, 12, 1)),
+            (datetime.date(2026, 12, 1), datetime.date(2027, 1, 1)),
+            (datetime.date(2027, 1, 1), datetime.date(2027, 2, 1)),
+        ]
+
+    def test_partition_name(self):
+        """Partitions are named by year and month."""
+        assert get_partition_name(datetime.date(2026, 3, 1)) == 'comments_y2026m03'
+
+    def test_create_partitions(self):
+        """Missing partitions are created with month bounds in UTC."""
+        mock_cursor = mock.MagicMock()
+        cursor = mock_cursor.__enter__.return_value
+        cursor.fetchone.side_effect = [('comments_y2026m10',), (None,)]
+
+        with mock.patch.object(connection, 'cursor', return_value=mock_cursor):
+            created = create_partitions(connection, 2, start=datetime.date(2026, 10, 19))
+
+        assert created == ['comments_y2026m11']
+        sql, params = cursor.execute.call_args.args
+        assert sql == (
+            'CREATE TABLE comments_y2026m11 PARTITION OF comments '
+            'FOR VALUES FROM (%s::timestamptz) TO (%s::timestamptz)'
+        )
+        assert params == ['2026-11-01 00:00+00', '2026-12-01 00:00+00']
+
+    def test_not_partitioned(self):
+        """Comments are not partitioned out of PostgreSQL."""
+        assert not is_partitioned(connection)
+
+    def test_command_not_partitioned(self):
+        """Partitions can not be created for plain table."""
+        with pytest.raises(CommandError):
+            call_command('create_comment_partitions')
+
+
+def count_rows(table: str) -> int:
+    """Count rows of table."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM {table}')  # noqa: S608
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='partitioning needs PostgreSQL')
+@pytest.mark.django_db()
+class TestPartitionedComments:
+    """Testing comments table converted to partitions and back on PostgreSQL."""
+
+    def test_round_trip(self, issue, user, mock_notification_task):
+        """Rows and id sequence survive both conversions, service works on partitions."""
+        month_ago = timezone.now() - datetime.timedelta(days=31)
+        Issue.objects.filter(id=issue.id).update(created_at=month_ago - datetime.timedelta(days=1))
+        old = CommentFactory(issue=issue, author=user, text='old')
+        Comment.objects.filter(id=old.id).update(created_at=month_ago)
+        # pending deferred foreign key checks forbid altering the table in the same transaction
+        connection.check_constraints()
+
+        partition_table(connection, months_ahead=1)
+
+        assert is_partitioned(connection)
+        assert count_rows(get_partition_name(month_ago.date())) == 1
+        assert count_rows('comments_default') == 0
+
+        CommentService.create(issue_id=issue.id, author=user, text='new')
+        new = Comment.objects.get(text='new')
+        assert new.id > old.id
+        assert count_rows(get_partition_name(new.created_at.date())) == 1
+
+        comment = CommentService.get_or_error(comment_id=old.id, issue_id=issue.id)
+        CommentService.update(comment, user, text='updated')
+        assert Comment.objects.get(id=old.id).text == 'updated'
+        assert list(CommentService.get_list(issue.id).order_by('id')) == [comment, new]
+
+        CommentService.delete(new, user)
+        assert list(Comment.objects.values_list('id', flat=True)) == [old.id]
+        connection.check_constraints()
+
+        unpartition_table(connection)
+
+        assert not is_partitioned(connection)
+        assert list(Comment.objects.values_list('id', 'text')) == [(old.id, 'updated')]
+        CommentService.create(issue_id=issue.id, author=user, text='after')
+        assert Comment.objects.get(text='after').id > new.id
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from server.apps.issues.models import Comment
@@ -21,6 +23,13 @@ class TestCommentServiceCreate:
         assert comment.author == user
         assert comment.text == 'test_text'
 
+    def test_pinned_to_primary(self, issue, user):
+        """Commentator reads from primary database after comment."""
+        with mock.patch('server.apps.core.replicas.pin_to_primary') as mock_pin:
+            CommentService.create(issue_id=issue.id, author=user, text='test_text')
+
+        mock_pin.assert_called_once_with(user.pk)
+
     def test_issue_not_found(self, user):
         """Issue not found."""
         assert Comment.objects.all().count() == 0
@@ -86,18 +95,35 @@ class TestCommentServiceGetById:
         with pytest.raises(CommentService.CommentNotFoundError):
             CommentService.get_or_error(comment_id=999, issue_id=888)
 
+    def test_partition_key_in_single_query(self, comment, django_assert_num_queries):
+        """Comment is bounded by creation time of issue in the same query."""
+        with django_assert_num_queries(1) as captured:
+            CommentService.get_or_error(comment_id=comment.id, issue_id=comment.issue_id)
+
+        assert '"comments"."created_at" >=' in captured.captured_queries[0]['sql']
+
 
 @pytest.mark.django_db()
 class TestCommentServiceUpdate:
     """Testing method update of CommentService."""
 
-    def test_success(self, comment):
+    def test_success(self, comment, user):
         """Successful updating comment."""
         assert comment.text == 'test_text'
-        CommentService.update(comment=comment, text='new_text')
+        updated_at = comment.updated_at
+        CommentService.update(comment=comment, user=user, text='new_text')
         comment.refresh_from_db()
 
         assert comment.text == 'new_text'
+        assert comment.updated_at > updated_at
+
+    def test_admin_pinned_to_primary(self, comment):
+        """Admin updating comment of another user reads from primary database, not author."""
+        admin = UserFactory(email='admin@mail.com', is_admin=True)
+        with mock.patch('server.apps.core.replicas.pin_to_primary') as mock_pin:
+            CommentService.update(comment=comment, user=admin, text='new_text')
+
+        mock_pin.assert_called_once_with(admin.pk)
 
 
 @pytest.mark.django_db()
@@ -136,7 +162,15 @@ class TestCommentServiceList:
 class TestCommentServiceDelete:
     """Testing method delete of CommentService."""
 
-    def test_success(self, comment):
+    def test_success(self, comment, user):
         """Successful deleting comment."""
-        CommentService.delete(comment=comment)
+        CommentService.delete(comment=comment, user=user)
         assert not Comment.objects.all()
+
+    def test_admin_pinned_to_primary(self, comment):
+        """Admin deleting comment of another user reads from primary database, not author."""
+        admin = UserFactory(email='admin@mail.com', is_admin=True)
+        with mock.patch('server.apps.core.replicas.pin_to_primary') as mock_pin:
+            CommentService.delete(comment=comment, user=admin)
+
+        mock_pin.assert_called_once_with(admin.pk)
@@ -0,0 +1,193 @@
+import csv
+import datetime
+import io
+import zipfile
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+from rest_framework.fields import DateTimeField
+
+from server.celery import app
+
+from .. import notifications
+from ..enums import ExportJobStatusEnum
+from ..models import ExportJob
+from ..tasks import export_data_task, send_notification_task
+
+# Datetimes are exported as they are rendered by API.
+to_api_datetime = DateTimeField().to_representation
+
+
+class TestSendNotificationTask:
+    """Testing send_notification_task."""
+
+    kwargs = {'emails': ['user@mail.com'], 'subject': 'Subject', 'message': 'Text'}
+
+    @pytest.fixture()
+    def mock_send_notification(self):
+        """Mock-fixture of sending notification."""
+        with mock.patch('server.apps.issues.tasks.send_notification') as mock_send:
+            yield mock_send
+
+    @pytest.fixture()
+    def mock_dead_letter(self):
+        """Mock-fixture of publishing message to dead letter queue."""
+        with mock.patch.object(send_notification_task, 'apply_async') as mock_apply_async:
+            yield mock_apply_async
+
+    def test_success(self):
+        """Email is sent."""
+        send_notification_task.apply(kwargs=self.kwargs)
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ['user@mail.com']
+        assert mail.outbox[0].subject == 'Subject'
+
+    def test_retry(self, mock_send_notification, mock_dead_letter):
+        """Temporary SMTP error is retried."""
+        mock_send_notification.side_effect = [SMTPServerDisconnected(), OSError(), None]
+
+        result = send_notification_task.apply(kwargs=self.kwargs)
+
+        assert result.successful()
+        assert mock_send_notification.call_count == 3
+        mock_dead_letter.assert_not_called()
+
+    def test_retries_exceeded(self, settings, mock_send_notification, mock_dead_letter):
+        """Message is moved to dead letter queue when retries are exceeded."""
+        mock_send_notification.side_effect = SMTPServerDisconnected()
+
+        result = send_notification_task.apply(kwargs=self.kwargs)
+
+        assert result.failed()
+        assert mock_send_notification.call_count == settings.NOTIFICATION_MAX_RETRIES + 1
+        mock_dead_letter.assert_called_once_with(
+            args=(),
+            kwargs=self.kwargs,
+            queue='notifications.dead_letter',
+            headers={'failed_task_id': result.id, 'exception': 'SMTPServerDisconnected()'},
+        )
+
+    def test_permanent_error(self, mock_send_notification, mock_dead_letter):
+        """Message with refused recipients is not retried."""
+        mock_send_notification.side_effect = SMTPRecipientsRefused({})
+
+        result = send_notification_task.apply(kwargs=self.kwargs)
+
+        assert result.failed()
+        assert mock_send_notification.call_count == 1
+        mock_dead_letter.assert_called_once()
+
+
+class TestSendNotification:
+    """Testing reuse of email connection."""
+
+    def test_connection_reused(self):
+        """The same connection is used for all notifications."""
+        notifications.close_shared_connection()
+        notifications.send_notification(['first@mail.com'], 'Subject', 'Text')
+        connection = notifications.get_shared_connection()
+
+        notifications.send_notification(['second@mail.com'], 'Subject', 'Text')
+
+        assert notifications.get_shared_connection() is connection
+        assert len(mail.outbox) == 2
+
+    def test_connection_closed_on_error(self):
+        """Broken connection is not reused."""
+        connection = notifications.get_shared_connection()
+
+        with mock.patch.object(connection, 'send_messages', side_effect=SMTPServerDisconnected()):
+            with pytest.raises(SMTPServerDisconnected):
+                notifications.send_notification(['user@mail.com'], 'Subject', 'Text')
+
+        assert notifications.get_shared_connection() is not connection
+
+
+class TestTaskRoutes:
+    """Testing routing of tasks to dedicated queues."""
+
+    @pytest.mark.parametrize(('task_name', 'queue'), [
+        ('server.apps.issues.tasks.send_notification_task', 'notifications'),
+        ('server.apps.issues.tasks.export_issues_task', 'exports'),
+        ('server.apps.issues.tasks.unknown_task', 'maintenance'),
+    ])
+    def test_route(self, task_name, queue):
+        """Task is routed to its queue."""
+        route = app.amqp.router.route({}, task_name)
+
+        assert route['queue'].name == queue
+
+
+@pytest.mark.django_db()
+class TestExportDataTask:
+    """Testing export_data_task."""
+
+    @pytest.fixture(autouse=True)
+    def export_root(self, settings, tmp_path):
+        """Export files to temporary directory."""
+        settings.EXPORT_ROOT = str(tmp_path)
+        settings.EXPORT_CHUNK_SIZE = 1
+        return tmp_path
+
+    def test_success(self, export_root, comment, release):
+        """Issues, releases and comments are exported to zip archive."""
+        job = ExportJob.objects.create(author=comment.author)
+
+        export_data_task(job_id=job.id)
+
+        job.refresh_from_db()
+        assert job.status == ExportJobStatusEnum.DONE
+        assert job.total_rows == job.processed_rows == 3
+        assert job.file_name == f'export-{job.id}.zip'
+
+        with zipfile.ZipFile(export_root / job.file_name) as archive:
+            assert archive.namelist() == ['issues.csv', 'releases.csv', 'comments.csv']
+            comments = list(csv.DictReader(io.TextIOWrapper(archive.open('comments.csv'))))
+            releases = list(csv.DictReader(io.TextIOWrapper(archive.open('releases.csv'))))
+
+        assert releases[0]['version'] == '0.1.0'
+        assert comments == [{
+            'id': str(comment.id),
+            'issue': 'TT-1',
+            'author': 'user@mail.com',
+            'text': 'test_text',
+            'created_at': to_api_datetime(comment.created_at),
+            'updated_at': to_api_datetime(comment.updated_at),
+        }]
+
+    def test_failure(self, issue):
+        """Job is marked as failed if export fails."""
+        job = ExportJob.objects.create(author=issue.author)
+
+        with mock.patch('server.apps.issues.tasks.write_archive', side_effect=PermissionError()):
+            with pytest.raises(PermissionError):
+                export_data_task(job_id=job.id)
+
+        job.refresh_from_db()
+        assert job.status == ExportJobStatusEnum.FAILED
+
+    def test_expired_deleted(self, export_root, settings, issue):
+        """Jobs finished longer than retention ago are deleted with their archives."""
+        settings.EXPORT_RETENTION = 60
+        expired = ExportJob.objects.create(author=issue.author, status=ExportJobStatusEnum.DONE)
+        failed = ExportJob.objects.create(author=issue.author, status=ExportJobStatusEnum.FAILED)
+        recent = ExportJob.objects.create(author=issue.author, status=ExportJobStatusEnum.DONE)
+        ExportJob.objects.filter(id__in=[expired.id, failed.id]).update(
+            updated_at=timezone.now() - datetime.timedelta(seconds=61),
+        )
+        (export_root / f'export-{expired.id}.zip').write_bytes(b'zip')
+        (export_root / f'export-{failed.id}.tmp').write_bytes(b'zip')
+        (export_root / f'export-{recent.id}.zip').write_bytes(b'zip')
+        job = ExportJob.objects.create(author=issue.author)
+
+        export_data_task(job_id=job.id)
+
+        assert set(ExportJob.objects.values_list('id', flat=True)) == {recent.id, job.id}
+        assert {path.name for path in export_root.iterdir()} == {
+            f'export-{recent.id}.zip',
+            f'export-{job.id}.zip',
+        }
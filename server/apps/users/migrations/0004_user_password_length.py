@@ -0,0 +1,18 @@
+# Generated by Django 4.2.3 on 2026-10-19 11:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_is_admin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='password',
+            field=models.CharField(max_length=128),
+        ),
+    ]
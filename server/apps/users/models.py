@@ -9,7 +9,7 @@ class User(BaseModel):
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=120)
     last_name = models.CharField(max_length=120)
-    password = models.CharField(max_length=64)
+    password = models.CharField(max_length=128)
     is_admin = models.BooleanField(default=False)
 
     class Meta:
@@ -1,8 +1,11 @@
+from typing import Sequence
+
 from django.db import IntegrityError, transaction
 from django.db.models import QuerySet
 
 from server.apps.core.exceptions import BaseServiceError
-from server.apps.core.utils import hash_password
+from server.apps.core.passwords import hash_password
+from server.apps.core.utils import load_only
 from server.apps.issues.models import Issue
 
 from .models import User
@@ -18,10 +21,10 @@ class UserService:
         """User with provided email already exists."""
 
     @classmethod
-    def get_or_error(cls, user_id: int) -> User:
-        """Get user by id or raise exception."""
+    def get_or_error(cls, user_id: int, only: Sequence[str] | None = None) -> User:
+        """Get user by id or raise exception. Only given fields are loaded if provided."""
         try:
-            user = User.objects.get(id=user_id)
+            user = load_only(User.objects.all(), only).get(id=user_id)
         except User.DoesNotExist:
             raise cls.UserNotFoundError()
 
@@ -38,16 +41,23 @@ class UserService:
         return user
 
     @classmethod
-    def get_user_info(cls, user_id: int) -> dict[str, str | QuerySet[Issue]]:
-        """Get user by id."""
-        user = cls.get_or_error(user_id)
-
-        return {
-            'email': user.email,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'issues': user.issues_assigned_to.select_related('release'),
+    def get_user_info(
+        cls,
+        user_id: int,
+        only: Sequence[str] | None = None,
+    ) -> dict[str, str | QuerySet[Issue]]:
+        """Get user by id. Only given fields are loaded and returned if provided."""
+        user = cls.get_or_error(user_id, only=only)
+        deferred = user.get_deferred_fields()
+
+        info: dict[str, str | QuerySet[Issue]] = {
+            field: getattr(user, field)
+            for field in ('email', 'first_name', 'last_name')
+            if field not in deferred
         }
+        info['issues'] = user.issues_assigned_to.select_related('release')
+
+        return info
 
     @classmethod
     def create(
@@ -59,7 +69,7 @@ class UserService:
         is_admin: bool = False,
     ) -> None:
         """Create new user."""
-        hashed_password = hash_password(password=password, email=email)
+        hashed_password = hash_password(password)
         try:
             with transaction.atomic():
                 User.objects.create(
@@ -83,6 +93,12 @@ class UserService:
         except IntegrityError as exc:
             raise cls.UserAlreadyExistError() from exc
 
+    @classmethod
+    def set_password(cls, user: User, password: str) -> None:
+        """Hash and save new password of user."""
+        user.password = hash_password(password)
+        user.save(update_fields=['password', 'updated_at'])
+
     @classmethod
     def get_assigned_issues(cls, user: User) -> dict[str, QuerySet[Issue]]:
         """Get issues assigned to authenticated user."""
@@ -1,9 +1,27 @@
 import os
 
 from celery import Celery
+from kombu import Queue
+
+from server.apps.core import metrics  # noqa: F401 Connect signals collecting metrics of tasks.
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+# System checks run by worker on startup import URLconf with all views and DRF, while tasks
+# need none of them. Checks are run by web process and manage.py commands anyway.
+os.environ.setdefault('CELERY_SKIP_CHECKS', 'true')
+
+NOTIFICATIONS_QUEUE = 'notifications'
+EXPORTS_QUEUE = 'exports'
+MAINTENANCE_QUEUE = 'maintenance'
 
 app = Celery('task_tracker')
 app.config_from_object('django.conf:settings', namespace='CELERY')
+app.conf.update(
+    task_queues=[Queue(NOTIFICATIONS_QUEUE), Queue(EXPORTS_QUEUE), Queue(MAINTENANCE_QUEUE)],
+    task_default_queue=MAINTENANCE_QUEUE,
+    task_routes={
+        'server.apps.*.tasks.send_*': {'queue': NOTIFICATIONS_QUEUE},
+        'server.apps.*.tasks.export_*': {'queue': EXPORTS_QUEUE},
+    },
+)
 app.autodiscover_tasks()
@@ -26,13 +26,33 @@ INSTALLED_APPS = [
     'server.apps.issues',
 ]
 
+# Celery workers run tasks only, so they skip apps serving admin pages and static files.
+PROCESS_ROLE = env.str('PROCESS_ROLE', default='web')
+WEB_ONLY_APPS = [
+    'django.contrib.admin',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+]
+if PROCESS_ROLE == 'worker':
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in WEB_ONLY_APPS]
+
+# API profile: requests to API skip session, CSRF, authentication and messages middlewares,
+# admin keeps using them.
+API_PROFILE_ENABLED = env.bool('API_PROFILE_ENABLED', default=True)
+API_PATH_PREFIX = '/api/'
+
 MIDDLEWARE = [
+    'server.apps.core.middleware.PrometheusMetricsMiddleware',
+    'server.apps.core.middleware.RequestInstrumentationMiddleware',
+    'server.apps.core.middleware.CompressionMiddleware',
+    'server.apps.core.middleware.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'server.apps.core.middleware.ApiBypassSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    'server.apps.core.middleware.ApiBypassCsrfViewMiddleware',
+    'server.apps.core.middleware.ApiBypassAuthenticationMiddleware',
+    'server.apps.core.middleware.ApiBypassMessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -64,6 +84,15 @@ DATABASES = {
     'default': env.db('DATABASE_DSN'),
 }
 
+# Read replicas serving safe API requests, users are pinned to primary for a while after their
+# writes to read them back, see server.apps.core.replicas.
+DATABASE_REPLICAS = []
+for number, dsn in enumerate(env.list('DATABASE_REPLICA_DSNS', default=[])):
+    DATABASES[f'replica_{number}'] = {**env.db_url_config(dsn), 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(f'replica_{number}')
+DATABASE_ROUTERS = ['server.apps.core.replicas.ReplicaRouter']
+DATABASE_REPLICA_PIN_SECONDS = env.int('DATABASE_REPLICA_PIN_SECONDS', default=10)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -91,12 +120,53 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Render and parse JSON with orjson, output is the same as of stdlib based classes of DRF.
+API_ORJSON_ENABLED = env.bool('API_ORJSON_ENABLED', default=True)
+
 REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'server.apps.api.exception_handlers.custom_api_exception_handler',
     'DEFAULT_AUTHENTICATION_CLASSES': ['server.apps.auth.authentication.TokenAuthentication'],
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'server.apps.api.renderers.ORJSONRenderer' if API_ORJSON_ENABLED
+        else 'rest_framework.renderers.JSONRenderer',
     ),
+    'DEFAULT_PARSER_CLASSES': (
+        'server.apps.api.parsers.ORJSONParser' if API_ORJSON_ENABLED
+        else 'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    # Number of trusted reverse proxies setting X-Forwarded-For, client IP of throttling is taken
+    # from REMOTE_ADDR when there are none, so clients can not spoof it.
+    'NUM_PROXIES': env.int('API_NUM_PROXIES', default=0),
+    'DEFAULT_THROTTLE_CLASSES': ['server.apps.api.throttling.ScopedUserThrottle'],
+    # Token bucket rates of throttles, see server.apps.api.throttling.
+    'DEFAULT_THROTTLE_RATES': {
+        'read.user': env.str('THROTTLE_READ_USER_RATE', default='600/min'),
+        'read.admin': env.str('THROTTLE_READ_ADMIN_RATE', default='1200/min'),
+        'expensive.user': env.str('THROTTLE_EXPENSIVE_USER_RATE', default='30/min'),
+        'expensive.admin': env.str('THROTTLE_EXPENSIVE_ADMIN_RATE', default='120/min'),
+        'write.user': env.str('THROTTLE_WRITE_USER_RATE', default='120/min'),
+        'write.admin': env.str('THROTTLE_WRITE_ADMIN_RATE', default='300/min'),
+        'login': env.str('THROTTLE_LOGIN_RATE', default='600/min'),
+        'login.ip': env.str('THROTTLE_LOGIN_IP_RATE', default='20/min'),
+        'login.email': env.str('THROTTLE_LOGIN_EMAIL_RATE', default='5/min'),
+        'refresh': env.str('THROTTLE_REFRESH_RATE', default='1200/min'),
+        'refresh.ip': env.str('THROTTLE_REFRESH_IP_RATE', default='60/min'),
+    },
+}
+
+# Redis of cache and rate limiting. Short timeouts let throttling fail open fast when Redis
+# is unavailable.
+CACHES = {
+    'default': {
+        'BACKEND': 'server.apps.core.cache.InstrumentedRedisCache',
+        'LOCATION': env.str('REDIS_URL', default='redis://localhost:6379/0'),
+        'OPTIONS': {
+            'SOCKET_CONNECT_TIMEOUT': env.float('REDIS_CONNECT_TIMEOUT', default=0.2),
+            'SOCKET_TIMEOUT': env.float('REDIS_TIMEOUT', default=0.2),
+        },
+    },
 }
 
 LOGGING = {
@@ -141,15 +211,73 @@ LOGGING = {
     },
 }
 
+# Paginators count rows exactly below threshold and use estimates of PostgreSQL above it.
+COUNT_ESTIMATE_THRESHOLD = env.int('COUNT_ESTIMATE_THRESHOLD', default=100_000)
+
+# Monthly partitions of comments on PostgreSQL, applied by migration, created ahead of time by
+# command create_comment_partitions, see server.apps.issues.partitions.
+COMMENTS_PARTITIONING_ENABLED = env.bool('COMMENTS_PARTITIONING_ENABLED', default=False)
+COMMENTS_PARTITIONS_AHEAD = env.int('COMMENTS_PARTITIONS_AHEAD', default=3)
+
+ISSUE_EXPORT_CHUNK_SIZE = env.int('ISSUE_EXPORT_CHUNK_SIZE', default=2000)
+EXPORT_ROOT = env.str('EXPORT_ROOT', default=os.path.join(BASE_DIR, 'exports'))
+EXPORT_CHUNK_SIZE = env.int('EXPORT_CHUNK_SIZE', default=10000)
+# Seconds finished export jobs and their archives are kept, expired ones are deleted by exports.
+EXPORT_RETENTION = env.int('EXPORT_RETENTION', default=24 * 60 * 60)
+
+REQUEST_INSTRUMENTATION_ENABLED = env.bool('REQUEST_INSTRUMENTATION_ENABLED', default=False)
+REQUEST_INSTRUMENTATION_SLOW_MS = env.float('REQUEST_INSTRUMENTATION_SLOW_MS', default=500)
+REQUEST_INSTRUMENTATION_SAMPLE_RATE = env.float(
+    'REQUEST_INSTRUMENTATION_SAMPLE_RATE',
+    default=0.01,
+)
+
+PROMETHEUS_METRICS_ENABLED = env.bool('PROMETHEUS_METRICS_ENABLED', default=True)
+PROMETHEUS_WORKER_PORT = env.int('PROMETHEUS_WORKER_PORT', default=0)
+PROMETHEUS_CELERY_QUEUES = env.list(
+    'PROMETHEUS_CELERY_QUEUES',
+    default=['notifications', 'exports', 'maintenance'],
+)
+
+COMPRESSION_ENABLED = env.bool('COMPRESSION_ENABLED', default=True)
+COMPRESSION_MIN_SIZE = env.int('COMPRESSION_MIN_SIZE', default=1024)
+COMPRESSION_PATH_PREFIXES = env.list('COMPRESSION_PATH_PREFIXES', default=['/api/'])
+COMPRESSION_CONTENT_TYPES = env.list(
+    'COMPRESSION_CONTENT_TYPES',
+    default=['application/json', 'application/x-ndjson', 'text/csv'],
+)
+COMPRESSION_GZIP_LEVEL = env.int('COMPRESSION_GZIP_LEVEL', default=6)
+COMPRESSION_BROTLI_QUALITY = env.int('COMPRESSION_BROTLI_QUALITY', default=5)
+
 AUTH_SECRET = env.str('AUTH_SECRET')
+# Passwords are hashed with PBKDF2 in bounded thread pool, logins are limited per process.
+PASSWORD_HASH_ITERATIONS = env.int('PASSWORD_HASH_ITERATIONS', default=600_000)
+PASSWORD_HASH_WORKERS = env.int('PASSWORD_HASH_WORKERS', default=2)
+LOGIN_MAX_CONCURRENCY = env.int('LOGIN_MAX_CONCURRENCY', default=8)
+LOGIN_SLOT_TIMEOUT = env.float('LOGIN_SLOT_TIMEOUT', default=2.0)
 JWT_TOKEN_SECRET = env.str('JWT_TOKEN_SECRET')
+# In-process LRU cache of verified JWT claims, see server.apps.auth.token_cache.
+JWT_CACHE_SIZE = env.int('JWT_CACHE_SIZE', default=10_000)
+JWT_CACHE_TTL = env.float('JWT_CACHE_TTL', default=60)
 
 CELERY_BROKER_URL = env('CELERY_BROKER_URL')
 CELERY_RESULT_BACKEND = env('CELERY_RESULT_BACKEND')
 CELERY_ACCEPT_CONTENT = ['json', 'yaml']
+CELERY_TASK_ACKS_LATE = env.bool('CELERY_TASK_ACKS_LATE', default=True)
+CELERY_TASK_REJECT_ON_WORKER_LOST = env.bool('CELERY_TASK_REJECT_ON_WORKER_LOST', default=True)
+CELERY_WORKER_PREFETCH_MULTIPLIER = env.int('CELERY_WORKER_PREFETCH_MULTIPLIER', default=1)
 
 EMAIL_HOST = env.str('EMAIL_HOST')
 EMAIL_HOST_USER = env.str('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = env.str('EMAIL_HOST_PASSWORD')
 EMAIL_PORT = env.int('EMAIL_PORT')
 EMAIL_USE_TLS = env.bool('EMAIL_USE_TLS')
+
+NOTIFICATION_MAX_RETRIES = env.int('NOTIFICATION_MAX_RETRIES', default=5)
+NOTIFICATION_RETRY_BACKOFF = env.int('NOTIFICATION_RETRY_BACKOFF', default=2)
+NOTIFICATION_RETRY_BACKOFF_MAX = env.int('NOTIFICATION_RETRY_BACKOFF_MAX', default=600)
+NOTIFICATION_RATE_LIMIT = env.str('NOTIFICATION_RATE_LIMIT', default='10/s')
+NOTIFICATION_DEAD_LETTER_QUEUE = env.str(
+    'NOTIFICATION_DEAD_LETTER_QUEUE',
+    default='notifications.dead_letter',
+)
@@ -2,13 +2,16 @@ from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import TemplateView
 
+from server.apps.core.views import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('server.apps.api.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 urlpatterns += [
-    path('docs/', TemplateView.as_view(  # type: ignore[list-item]
+    path('docs/', TemplateView.as_view(
         template_name='swagger-ui.html',
         extra_context={'schema_url': 'openapi-schema'},
     ), name='docs'),